@@ -0,0 +1,485 @@
+"""
+Asset Budget Module for pSEO Engine
+
+This module estimates how many bytes each page ships, as an offline input
+to the "Core Web Vitals Indicators" check:
+
+- images referenced by the post MDX (frontmatter `image`, Markdown and
+  <img>/<Image> tags) and by the rendered HTML (including /_next/image
+  URLs), joined against the files in public/ for size, format and
+  intrinsic dimensions
+- JavaScript chunks from the Next.js build manifests
+  (.next/app-build-manifest.json, .next/build-manifest.json)
+
+Image headers are parsed once and cached with each file's size and mtime
+(outputs/.asset_cache/), so repeat runs only re-read changed assets.
+
+Usage by Claude:
+- Trigger: "seo audit" (Core Web Vitals Indicators), "page weight", "heavy pages"
+- analyze_asset_budget(pages=...) -> AssetBudgetReport
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+import json
+import os
+import re
+import struct
+
+from page_facts import PageFacts
+from site_routes import DEFAULT_PROJECT_ROOT, iter_blog_posts, localize_path, read_mdx
+
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "outputs" / ".asset_cache" / "assets.json"
+CACHE_VERSION = 1
+
+PUBLIC_DIR = "public"
+DEFAULT_BUILD_DIR = ".next"
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico"}
+IMAGE_FORMATS = {"png", "jpeg", "gif", "webp", "avif", "svg"}
+
+# Budgets (bytes, transferred before compression)
+PAGE_BYTE_BUDGET = 1_000_000
+IMAGE_BYTE_LIMIT = 200_000
+MAX_IMAGE_WIDTH = 2400
+MODERN_FORMATS = {"webp", "avif", "svg"}
+
+_MDX_IMAGE_PATTERNS = (
+    re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)"),
+    re.compile(r"<(?:img|Image)\b[^>]*?\bsrc=\{?[\"']([^\"']+)[\"']", re.I),
+)
+
+
+@dataclass
+class AssetInfo:
+    """A file in public/ with its image header facts"""
+    path: str  # public URL path, e.g. "/images/hero.png"
+    bytes: int
+    format: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+
+@dataclass
+class ImageRef:
+    """One image a page references"""
+    src: str
+    origin: str  # "mdx" or "html"
+    asset: Optional[AssetInfo] = None
+    external: bool = False
+    generated: bool = False  # rendered on demand, e.g. /og?title=...
+
+
+@dataclass
+class PageWeight:
+    """Estimated bytes a page ships"""
+    route: str
+    images: list[ImageRef] = field(default_factory=list)
+    chunks: list[str] = field(default_factory=list)
+    image_bytes: int = 0
+    js_bytes: int = 0
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.image_bytes + self.js_bytes
+
+
+@dataclass
+class AssetBudgetReport:
+    """Pages ranked by weight, heaviest first"""
+    pages: list[PageWeight] = field(default_factory=list)
+    budget: int = PAGE_BYTE_BUDGET
+    assets: int = 0
+    assets_read: int = 0  # headers parsed this run (cache misses)
+    shared_js_bytes: int = 0
+
+    @property
+    def over_budget(self) -> list[PageWeight]:
+        return [page for page in self.pages if page.total_bytes > self.budget]
+
+
+# --- Image headers --------------------------------------------------------
+
+def read_image_header(path: Path) -> tuple[Optional[str], Optional[int], Optional[int]]:
+    """
+    Read an image's format and intrinsic size from its header only.
+
+    Supports PNG, GIF, JPEG, WebP (VP8/VP8L/VP8X) and SVG width/height
+    attributes; other formats return their extension and no dimensions.
+
+    Args:
+        path: Image file
+
+    Returns:
+        Tuple of (format, width, height)
+    """
+    with path.open("rb") as handle:
+        head = handle.read(64)
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return "png", width, height
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            width, height = struct.unpack("<HH", head[6:10])
+            return "gif", width, height
+        if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+            chunk = head[12:16]
+            if chunk == b"VP8 ":
+                width, height = struct.unpack("<HH", head[26:30])
+                return "webp", width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L":
+                bits = int.from_bytes(head[21:25], "little")
+                return "webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                return "webp", int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+            return "webp", None, None
+        if head.startswith(b"\xff\xd8"):
+            return ("jpeg",) + _jpeg_size(handle)
+        if head[4:12] in (b"ftypavif", b"ftypavis"):
+            return "avif", None, None
+        if path.suffix.lower() == ".svg":
+            handle.seek(0)
+            return ("svg",) + _svg_size(handle.read(4096).decode("utf-8", "replace"))
+    return path.suffix.lower().lstrip(".") or None, None, None
+
+
+def _jpeg_size(handle) -> tuple[Optional[int], Optional[int]]:
+    # Walk segment markers until a start-of-frame; only headers are read
+    handle.seek(2)
+    while True:
+        marker = handle.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None, None
+        kind = marker[1]
+        if kind in (0xD8, 0x01) or 0xD0 <= kind <= 0xD7:
+            continue
+        length_bytes = handle.read(2)
+        if len(length_bytes) < 2:
+            return None, None
+        length = struct.unpack(">H", length_bytes)[0]
+        if kind in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+            frame = handle.read(5)
+            height, width = struct.unpack(">HH", frame[1:5])
+            return width, height
+        handle.seek(length - 2, os.SEEK_CUR)
+
+
+def _svg_size(text: str) -> tuple[Optional[int], Optional[int]]:
+    tag = re.search(r"<svg\b[^>]*>", text, re.S)
+    if not tag:
+        return None, None
+    sizes = []
+    for name in ("width", "height"):
+        match = re.search(rf'\b{name}=["\'](\d+(?:\.\d+)?)(?:px)?["\']', tag.group(0))
+        sizes.append(int(float(match.group(1))) if match else None)
+    return sizes[0], sizes[1]
+
+
+# --- Asset index ----------------------------------------------------------
+
+class AssetIndex:
+    """
+    Stat and header facts for every file under public/, cached on disk.
+
+    Args:
+        root: Repository root
+        cache_path: JSON cache file (None disables caching)
+    """
+
+    def __init__(self, root: Path = DEFAULT_PROJECT_ROOT, cache_path: Optional[Path] = DEFAULT_CACHE_PATH):
+        self.root = Path(root)
+        self.cache_path = cache_path
+        self.assets: dict[str, AssetInfo] = {}
+        self.headers_read = 0
+        self._cache: dict[str, list] = {}
+        if cache_path and cache_path.exists():
+            try:
+                with cache_path.open("r", encoding="utf-8") as handle:
+                    data = json.load(handle)
+                if data.get("version") == CACHE_VERSION:
+                    self._cache = data.get("files", {})
+            except (OSError, ValueError):
+                self._cache = {}
+
+    def scan(self) -> "AssetIndex":
+        """Stat every public file, re-reading headers only for changed images."""
+        public = self.root / PUBLIC_DIR
+        fresh: dict[str, list] = {}
+        stack = [public] if public.is_dir() else []
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                        continue
+                    stat = entry.stat()
+                    url_path = "/" + Path(entry.path).relative_to(public).as_posix()
+                    cached = self._cache.get(url_path)
+                    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                        record = cached
+                    else:
+                        fmt = width = height = None
+                        if Path(entry.name).suffix.lower() in IMAGE_EXTENSIONS:
+                            fmt, width, height = read_image_header(Path(entry.path))
+                            self.headers_read += 1
+                        record = [stat.st_size, stat.st_mtime_ns, fmt, width, height]
+                    fresh[url_path] = record
+                    self.assets[url_path] = AssetInfo(url_path, record[0], record[2], record[3], record[4])
+        self._cache = fresh
+        return self
+
+    def save(self) -> None:
+        """Write the cache (atomically) if caching is enabled."""
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.cache_path.with_suffix(".tmp")
+        with temporary.open("w", encoding="utf-8") as handle:
+            json.dump({"version": CACHE_VERSION, "files": self._cache}, handle)
+        temporary.replace(self.cache_path)
+
+
+# --- JS chunks ------------------------------------------------------------
+
+@dataclass
+class RouteChunks:
+    """JS files of one app-router page, matched by regex"""
+    key: str
+    pattern: re.Pattern
+    dynamic_segments: int
+    files: list[str]
+
+
+def _route_pattern(key: str) -> tuple[re.Pattern, int]:
+    segments = [s for s in key.split("/") if s and not (s.startswith("(") and s.endswith(")"))]
+    parts, dynamic = [], 0
+    for segment in segments:
+        if segment.startswith("[[..."):
+            parts.append("(?:/.*)?")
+            dynamic += 2
+        elif segment.startswith("[..."):
+            parts.append("/.+")
+            dynamic += 2
+        elif segment.startswith("["):
+            parts.append("/[^/]+")
+            dynamic += 1
+        else:
+            parts.append("/" + re.escape(segment))
+    return re.compile("^" + ("".join(parts) or "/") + "$"), dynamic
+
+
+def load_build_chunks(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    build_dir: str = DEFAULT_BUILD_DIR
+) -> tuple[dict[str, int], list[str], list[RouteChunks]]:
+    """
+    Read JS chunk lists from the build manifests.
+
+    Args:
+        root: Repository root
+        build_dir: Build directory relative to root
+
+    Returns:
+        Tuple of (file -> bytes, shared files, per-route chunks); empty
+        when there is no build
+    """
+    build = Path(root) / build_dir
+    sizes: dict[str, int] = {}
+    shared: list[str] = []
+    routes: list[RouteChunks] = []
+
+    manifest_path = build / "build-manifest.json"
+    if manifest_path.exists():
+        with manifest_path.open("r", encoding="utf-8") as handle:
+            shared = list(json.load(handle).get("rootMainFiles", []))
+
+    app_manifest_path = build / "app-build-manifest.json"
+    layouts: dict[str, list[str]] = {}
+    if app_manifest_path.exists():
+        with app_manifest_path.open("r", encoding="utf-8") as handle:
+            pages = json.load(handle).get("pages", {})
+        for key, files in pages.items():
+            if key.endswith("/layout"):
+                layouts[key[: -len("/layout")] or "/"] = files
+        for key, files in pages.items():
+            if not key.endswith("/page"):
+                continue
+            route_key = key[: -len("/page")] or "/"
+            # Layout chunks of every ancestor segment load with the page
+            combined = list(files)
+            segments = [s for s in route_key.split("/") if s]
+            for depth in range(len(segments) + 1):
+                combined.extend(layouts.get("/" + "/".join(segments[:depth]), []))
+            pattern, dynamic = _route_pattern(route_key)
+            routes.append(RouteChunks(route_key, pattern, dynamic, list(dict.fromkeys(combined))))
+
+    for name in {f for r in routes for f in r.files} | set(shared):
+        if name.endswith(".js"):
+            try:
+                sizes[name] = (build / name).stat().st_size
+            except OSError:
+                sizes[name] = 0
+    routes.sort(key=lambda r: (r.dynamic_segments, -len(r.key)))
+    return sizes, shared, routes
+
+
+def chunks_for_route(route: str, routes: list[RouteChunks]) -> Optional[RouteChunks]:
+    """Most specific app-router page matching a public route (routes are sorted static-first)."""
+    for candidate in routes:
+        if candidate.pattern.match(route):
+            return candidate
+    return None
+
+
+# --- Page joins -----------------------------------------------------------
+
+def mdx_image_refs(text: str, metadata: dict) -> list[str]:
+    """
+    Image sources referenced by one MDX post.
+
+    Args:
+        text: MDX body
+        metadata: Parsed frontmatter
+
+    Returns:
+        Sources in document order (frontmatter image first), deduplicated
+    """
+    sources = [metadata["image"]] if metadata.get("image") else []
+    for pattern in _MDX_IMAGE_PATTERNS:
+        sources.extend(match.group(1) for match in pattern.finditer(text))
+    return list(dict.fromkeys(s.strip() for s in sources if s.strip()))
+
+
+def resolve_image(src: str, origin: str, assets: dict[str, AssetInfo]) -> ImageRef:
+    """
+    Join an image reference to its public/ file.
+
+    Args:
+        src: Image src as written (relative, absolute or /_next/image URL)
+        origin: "mdx" or "html"
+        assets: AssetIndex.assets
+
+    Returns:
+        ImageRef
+    """
+    parts = urlsplit(src)
+    if parts.path == "/_next/image":
+        inner = parse_qs(parts.query).get("url", [""])[0]
+        if inner:
+            parts = urlsplit(inner)
+    if parts.scheme in ("http", "https") or src.startswith("//"):
+        return ImageRef(src=src, origin=origin, external=True)
+    if parts.scheme == "data":
+        return ImageRef(src=src[:40], origin=origin)
+    path = unquote(parts.path)
+    if path.startswith("/og") or path.startswith("/api/"):
+        return ImageRef(src=src, origin=origin, generated=True)
+    return ImageRef(src=src, origin=origin, asset=assets.get(path))
+
+
+def _weigh(page: PageWeight) -> None:
+    seen = set()
+    for ref in page.images:
+        if ref.asset is None:
+            if not (ref.external or ref.generated or ref.src.startswith("data:")):
+                page.warnings.append(f"image not found in public/: {ref.src}")
+            continue
+        if ref.asset.path in seen:
+            continue
+        seen.add(ref.asset.path)
+        page.image_bytes += ref.asset.bytes
+        if ref.asset.bytes > IMAGE_BYTE_LIMIT:
+            page.warnings.append(f"{ref.asset.path} is {ref.asset.bytes // 1024} KB")
+        if ref.asset.width and ref.asset.width > MAX_IMAGE_WIDTH:
+            page.warnings.append(f"{ref.asset.path} is {ref.asset.width}px wide")
+        extension = Path(ref.asset.path).suffix.lower().lstrip(".").replace("jpg", "jpeg")
+        if ref.asset.format and extension in IMAGE_FORMATS and extension != ref.asset.format:
+            page.warnings.append(f"{ref.asset.path} is actually {ref.asset.format}")
+        if ref.asset.format and ref.asset.format not in MODERN_FORMATS and ref.asset.bytes > IMAGE_BYTE_LIMIT // 2:
+            page.warnings.append(f"{ref.asset.path} is {ref.asset.format}; serve WebP/AVIF")
+
+
+def analyze_asset_budget(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    pages: Optional[Iterable[PageFacts]] = None,
+    build_dir: str = DEFAULT_BUILD_DIR,
+    budget: int = PAGE_BYTE_BUDGET,
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH
+) -> AssetBudgetReport:
+    """
+    Estimate per-page image and JS bytes and rank pages by weight.
+
+    Args:
+        root: Repository root
+        pages: Rendered pages (crawl or build audit); MDX posts are always included
+        build_dir: Build directory for the JS manifests
+        budget: Byte budget per page
+        cache_path: Asset cache file (None disables caching)
+
+    Returns:
+        AssetBudgetReport
+    """
+    root = Path(root)
+    index = AssetIndex(root, cache_path).scan()
+    index.save()
+    sizes, shared, routes = load_build_chunks(root, build_dir)
+
+    weights: dict[str, PageWeight] = {}
+    for post in iter_blog_posts(root):
+        sources = [(f"/blog/{post.slug}", post.source_path)]
+        sources += [(localize_path(f"/blog/{post.slug}", locale), path) for locale, path in post.translations.items()]
+        for route, path in sources:
+            metadata, body = read_mdx(path)
+            page = weights.setdefault(route, PageWeight(route=route))
+            page.images.extend(resolve_image(src, "mdx", index.assets) for src in mdx_image_refs(body, metadata))
+
+    for facts in pages or ():
+        if not facts.is_html or facts.status != 200:
+            continue
+        page = weights.setdefault(facts.path, PageWeight(route=facts.path))
+        page.images.extend(resolve_image(img.src, "html", index.assets) for img in facts.images if img.src)
+
+    shared_bytes = sum(sizes.get(name, 0) for name in shared)
+    for page in weights.values():
+        _weigh(page)
+        matched = chunks_for_route(page.route, routes)
+        files = list(dict.fromkeys(shared + (matched.files if matched else [])))
+        page.chunks = [name for name in files if name.endswith(".js")]
+        page.js_bytes = sum(sizes.get(name, 0) for name in page.chunks)
+
+    ranked = sorted(weights.values(), key=lambda p: (-p.total_bytes, p.route))
+    return AssetBudgetReport(
+        pages=ranked,
+        budget=budget,
+        assets=len(index.assets),
+        assets_read=index.headers_read,
+        shared_js_bytes=shared_bytes,
+    )
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+After `npm run build` (JS sizes need .next/; images work without it):
+
+```python
+from asset_budget import analyze_asset_budget
+
+report = analyze_asset_budget()                       # MDX posts only
+# report = analyze_asset_budget(pages=snapshot.pages.values())  # + rendered HTML
+
+print(f"{report.assets} public files ({report.assets_read} re-read), "
+      f"{len(report.over_budget)} pages over {report.budget // 1000} KB")
+for page in report.pages[:10]:
+    print(f"{page.total_bytes // 1024:>6} KB  {page.route}  "
+          f"(img {page.image_bytes // 1024} KB, js {page.js_bytes // 1024} KB)")
+    for warning in page.warnings:
+        print("        ", warning)
+```
+
+Typical fixes: convert large PNG/JPEG heroes to WebP/AVIF, resize images
+wider than 2400px, and move heavy client components behind dynamic().
+"""
@@ -0,0 +1,347 @@
+"""
+Audit Scoring Module for pSEO Engine
+
+This module turns audit checks into a weighted 0-100 score. Each check
+weighs:
+
+    category weight × severity weight × (1 + log10(1 + affected pages))
+
+and earns partial credit from its compliance ratio (e.g. 95% of pages
+have a canonical), clamped to the range of its status: a FAILED check
+never earns more than STATUS_RANGE["failed"] allows, a PASSED check never
+less. Checks are added one at a time and
+the running totals are updated in O(1), so a dashboard can show a live
+score while the audit streams checks in.
+
+Usage by Claude:
+- Not triggered directly; technical_seo_audit.build_audit_report() scores
+  with it, and audit_site(on_score=...) / audit_build(on_score=...)
+  report live scores
+- ScoreBoard().add(check) -> LiveScore
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+import math
+
+
+# Relative importance of each technical_seo_audit.CATEGORIES entry
+CATEGORY_WEIGHTS = {
+    "accessibility": 1.5,
+    "technical": 1.25,
+    "meta": 1.0,
+    "links": 1.0,
+    "performance": 1.0,
+    "mobile": 1.0,
+    "schema": 0.75,
+}
+
+# Declared per check ("severity" key of BASE_CHECKS / EXTENDED_CHECKS / PAGE_CHECKS)
+SEVERITY_WEIGHTS = {
+    "critical": 3.0,
+    "high": 2.0,
+    "medium": 1.0,
+    "low": 0.5,
+}
+
+# Credit without a compliance ratio, and the (floor, ceiling) a status can earn with one
+STATUS_CREDIT = {"passed": 1.0, "warning": 0.5, "failed": 0.0}
+STATUS_RANGE = {"passed": (0.75, 1.0), "warning": (0.25, 0.9), "failed": (0.0, 0.6)}
+
+
+@dataclass
+class CheckScore:
+    """Weight and credit of one scored check"""
+    name: str
+    category: str
+    weight: float
+    credit: float  # 0-1
+    compliance: Optional[float] = None  # share of checked items that comply
+    affected: int = 0  # pages (or items) failing the check
+
+    @property
+    def points_lost(self) -> float:
+        return self.weight * (1 - self.credit)
+
+
+@dataclass
+class LiveScore:
+    """Score after the checks added so far"""
+    score: int
+    status: str
+    checks_scored: int
+    checks_expected: Optional[int] = None
+    categories: dict[str, int] = field(default_factory=dict)
+
+
+def score_status(score: int) -> str:
+    """Map a 0-100 score to "excellent", "good", "needs-improvement" or "poor"."""
+    if score >= 90:
+        return "excellent"
+    if score >= 75:
+        return "good"
+    if score >= 50:
+        return "needs-improvement"
+    return "poor"
+
+
+# --- Compliance from check details -----------------------------------------
+
+# (compliance or None, affected count)
+Measure = tuple[Optional[float], int]
+
+
+def _ratio(compliant: int, total: int) -> Optional[float]:
+    return max(0.0, compliant / total) if total else None
+
+
+def _boolean_checks(details: dict) -> Measure:
+    # Homepage-level checks: details holds one bool per sub-check
+    values = [value for value in details.values() if isinstance(value, bool)]
+    if not values:
+        return None, 0
+    return _ratio(sum(values), len(values)), int(not all(values))
+
+
+def _robots(details: dict) -> Measure:
+    blocked = len(details.get("blockedSitemapUrls", {}))
+    return _ratio(details.get("pathsChecked", 0) - blocked, details.get("pathsChecked", 0)), blocked
+
+
+def _structured_data(details: dict) -> Measure:
+    total = details.get("totalCount", 0)
+    return _ratio(details.get("validCount", 0), total), int(bool(details.get("errors")))
+
+
+def _schema_coverage(details: dict) -> Measure:
+    missing = len(details.get("postsMissingBlogPosting", []))
+    return _ratio(details.get("postsChecked", 0) - missing, details.get("postsChecked", 0)), missing
+
+
+def _canonical_consistency(details: dict) -> Measure:
+    affected = set(details.get("missing", []))
+    affected.update(item["page"] for item in details.get("mismatched", []))
+    affected.update(item["page"] for item in details.get("badTargets", []))
+    for pages in details.get("conflictingClusters", {}).values():
+        affected.update(pages)
+    checked = details.get("pagesChecked", 0)
+    return _ratio(checked - len(affected), checked), len(affected)
+
+
+def _internal_link_health(details: dict) -> Measure:
+    broken = details.get("broken", [])
+    return (
+        _ratio(details.get("linksChecked", 0) - len(broken), details.get("linksChecked", 0)),
+        len({link["from"] for link in broken}),
+    )
+
+
+def _orphan_pages(details: dict) -> Measure:
+    orphans = len(details.get("orphans", []))
+    return _ratio(details.get("pagesChecked", 0) - orphans, details.get("pagesChecked", 0)), orphans
+
+
+def _redirect_chains(details: dict) -> Measure:
+    affected = (
+        len(details.get("chains", [])) + len(details.get("loops", []))
+        + details.get("configuredChainCount", 0) + len(details.get("redirectingSitemapUrls", []))
+    )
+    return None, affected
+
+
+def _https_enforcement(details: dict) -> Measure:
+    return None, len(details.get("insecure", []))
+
+
+def _sitemap_completeness(details: dict) -> Measure:
+    missing = details.get("missingRouteCount", 0)
+    expected = details.get("expectedRoutes", 0)
+    return _ratio(expected - missing, expected), missing + len(details.get("missingFromSitemap", []))
+
+
+def _hreflang(details: dict) -> Measure:
+    problems = details.get("pagesWithProblems", 0)
+    return _ratio(details.get("pagesWithHreflang", 0) - problems, details.get("pagesWithHreflang", 0)), problems
+
+
+def _page_checks(details: dict) -> Measure:
+    # build_audit.summarize_page_checks: failing pages in details["pages"]
+    failing = len(details.get("pages", {}))
+    return _ratio(details.get("pagesChecked", 0) - failing, details.get("pagesChecked", 0)), failing
+
+
+COMPLIANCE_MEASURES: dict[str, Callable[[dict], Measure]] = {
+    "Robots.txt Accessibility": _robots,
+    "Homepage Meta Tags": _boolean_checks,
+    "Structured Data Validation": _structured_data,
+    "Page Speed Basics": _boolean_checks,
+    "Mobile Friendliness": _boolean_checks,
+    "Schema Coverage": _schema_coverage,
+    "Canonical Tags Consistency": _canonical_consistency,
+    "Internal Link Health": _internal_link_health,
+    "Orphan Page Detection": _orphan_pages,
+    "Redirect Chain Analysis": _redirect_chains,
+    "Core Web Vitals Indicators": _boolean_checks,
+    "HTTPS Enforcement": _https_enforcement,
+    "XML Sitemap Completeness": _sitemap_completeness,
+    "Hreflang Tags (if multilingual)": _hreflang,
+}
+
+
+def measure_compliance(name: str, details: dict) -> Measure:
+    """
+    Compliance ratio and affected count of a check from its details.
+
+    Args:
+        name: Check name
+        details: SEOCheck.details
+
+    Returns:
+        Tuple of (compliance 0-1 or None if not measurable, affected count)
+    """
+    measure = COMPLIANCE_MEASURES.get(name)
+    if measure is None:
+        if "pagesChecked" in details and isinstance(details.get("pages"), dict):
+            measure = _page_checks
+        else:
+            return None, 0
+    return measure(details)
+
+
+def score_check(check) -> Optional[CheckScore]:
+    """
+    Weight and credit of one SEOCheck.
+
+    Args:
+        check: technical_seo_audit.SEOCheck
+
+    Returns:
+        CheckScore, or None for skipped checks
+    """
+    status = check.status.value
+    if status not in STATUS_CREDIT:
+        return None
+    compliance, affected = measure_compliance(check.name, check.details)
+    if compliance is None:
+        credit = STATUS_CREDIT[status]
+    else:
+        floor, ceiling = STATUS_RANGE[status]
+        credit = min(max(compliance, floor), ceiling)
+    weight = (
+        CATEGORY_WEIGHTS.get(check.category, 1.0)
+        * SEVERITY_WEIGHTS.get(check.severity, 1.0)
+        * (1 + math.log10(1 + affected))
+    )
+    return CheckScore(
+        name=check.name,
+        category=check.category,
+        weight=weight,
+        credit=credit,
+        compliance=compliance,
+        affected=affected,
+    )
+
+
+class ScoreBoard:
+    """
+    Running weighted score, updated as checks arrive.
+
+    Adding a check with a name already on the board replaces it, so a
+    re-run check does not count twice.
+
+    Args:
+        expected: Number of checks the audit will produce (for progress)
+    """
+
+    def __init__(self, expected: Optional[int] = None):
+        self.expected = expected
+        self.scores: dict[str, CheckScore] = {}
+        self._weight = 0.0
+        self._earned = 0.0
+        self._categories: dict[str, list[float]] = {}  # category -> [weight, earned]
+
+    def _apply(self, score: CheckScore, sign: int) -> None:
+        self._weight += sign * score.weight
+        self._earned += sign * score.weight * score.credit
+        totals = self._categories.setdefault(score.category, [0.0, 0.0])
+        totals[0] += sign * score.weight
+        totals[1] += sign * score.weight * score.credit
+
+    def add(self, check) -> LiveScore:
+        """
+        Score a check and fold it into the running totals.
+
+        Args:
+            check: technical_seo_audit.SEOCheck
+
+        Returns:
+            LiveScore after this check
+        """
+        previous = self.scores.pop(check.name, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        score = score_check(check)
+        if score is not None:
+            self.scores[check.name] = score
+            self._apply(score, 1)
+        return self.snapshot()
+
+    @property
+    def score(self) -> int:
+        return round(self._earned / self._weight * 100) if self._weight > 0 else 0
+
+    def snapshot(self) -> LiveScore:
+        """Current score, status and per-category scores."""
+        score = self.score
+        return LiveScore(
+            score=score,
+            status=score_status(score) if self.scores else "unknown",
+            checks_scored=len(self.scores),
+            checks_expected=self.expected,
+            categories={
+                category: round(earned / weight * 100)
+                for category, (weight, earned) in sorted(self._categories.items())
+                if weight > 1e-9
+            },
+        )
+
+    def points_lost(self, name: str) -> float:
+        """Weighted points a check costs (0 for passed, skipped or unknown checks)."""
+        score = self.scores.get(name)
+        return score.points_lost if score else 0.0
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Live score while a long audit runs:
+
+```python
+import asyncio
+from site_crawler import audit_site
+
+def show(check, live):
+    print(f"[{live.checks_scored}/{live.checks_expected}] {live.score}/100 "
+          f"after {check.name} ({check.status.value})")
+
+report, stats = asyncio.run(audit_site("http://localhost:3000", on_score=show))
+print(report.overall_score, report.category_scores)
+```
+
+Explaining a score:
+
+```python
+from audit_scoring import ScoreBoard
+
+board = ScoreBoard()
+for check in report.checks:
+    board.add(check)
+for score in sorted(board.scores.values(), key=lambda s: -s.points_lost)[:5]:
+    print(f"{score.name}: -{score.points_lost:.1f} pts "
+          f"(compliance {score.compliance}, {score.affected} affected)")
+```
+
+Tune CATEGORY_WEIGHTS / SEVERITY_WEIGHTS here, and each check's
+"severity" where it is declared.
+"""
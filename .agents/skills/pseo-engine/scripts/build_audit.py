@@ -0,0 +1,395 @@
+"""
+Build Audit Module for pSEO Engine
+
+This module audits the prerendered output of `next build` directly from
+disk, with no server running. It walks .next/server/app for:
+
+- *.html  prerendered pages (stream-parsed with page_facts, no DOM)
+- *.rsc   RSC payloads (scanned for internal hrefs the HTML may not expose)
+- *.meta  status/headers for each prerendered route
+- robots.txt.body / sitemap.xml.body  generated metadata routes
+
+Every page is parsed and checked in a worker process; the per-page
+results are then combined with the site-level checks from
+technical_seo_audit.run_declared_checks().
+
+Usage by Claude:
+- Trigger: "seo audit" right after `npm run build`
+- audit_build() -> (AuditReport, BuildAuditStats)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+import json
+import re
+import time
+import xml.etree.ElementTree as ET
+
+from audit_scoring import LiveScore, ScoreBoard
+from page_facts import PageFacts, extract_page_facts_from_file, internal_hosts, normalize_page_path
+from site_routes import BASE_URL, DEFAULT_LOCALE, DEFAULT_PROJECT_ROOT
+from technical_seo_audit import (
+    AuditReport,
+    CheckStatus,
+    Priority,
+    SEOCheck,
+    SiteSnapshot,
+    BASE_CHECKS,
+    EXTENDED_CHECKS,
+    build_audit_report,
+    run_declared_checks,
+)
+
+
+DEFAULT_BUILD_DIR = ".next"
+APP_OUTPUT_DIR = Path("server") / "app"
+
+# Prerendered error pages get their real status so page checks skip them
+ERROR_PAGES = {"_not-found": 404, "404": 404, "500": 500}
+
+RSC_CHUNK_SIZE = 1 << 16
+_RSC_HREF_PATTERN = re.compile(rb'"href":"(/[^"#?]*)')
+_SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# A per-page check fails the site only when more than this share of pages fail
+PAGE_CHECK_FAIL_RATIO = 0.25
+
+
+def _missing_meta(facts: PageFacts) -> Optional[str]:
+    missing = [name for name, value in (("title", facts.title), ("description", facts.meta_description)) if not value]
+    return f"missing {', '.join(missing)}" if missing else None
+
+
+def _bad_canonical(facts: PageFacts) -> Optional[str]:
+    if not facts.canonical:
+        return "no canonical"
+    target = normalize_page_path(facts.canonical, BASE_URL, internal_hosts(BASE_URL))
+    return None if target == facts.path else f"canonical points to {facts.canonical}"
+
+
+def _bad_jsonld(facts: PageFacts) -> Optional[str]:
+    return "; ".join(facts.jsonld_errors) or None
+
+
+def _missing_viewport(facts: PageFacts) -> Optional[str]:
+    return None if facts.viewport else "no viewport meta tag"
+
+
+def _eager_images(facts: PageFacts) -> Optional[str]:
+    # The first image is the likely LCP element and should load eagerly
+    eager = [img.src for img in facts.images[1:] if img.loading != "lazy"]
+    return f"{len(eager)} below-the-fold images without loading=\"lazy\"" if eager else None
+
+
+# Per-page checks run in the worker processes (same shape as BASE_CHECKS)
+PAGE_CHECKS = [
+    {
+        "name": "Page Meta Tags",
+        "category": "meta",
+        "run": _missing_meta,
+        "impact": "Pages without title/description get auto-generated snippets",
+        "severity": "high",
+    },
+    {
+        "name": "Page Canonical Tags",
+        "category": "technical",
+        "run": _bad_canonical,
+        "impact": "Duplicate content and diluted ranking signals",
+        "severity": "high",
+    },
+    {
+        "name": "Page JSON-LD Validity",
+        "category": "schema",
+        "run": _bad_jsonld,
+        "impact": "Invalid structured data is ignored by search engines",
+        "severity": "medium",
+    },
+    {
+        "name": "Page Viewport",
+        "category": "mobile",
+        "run": _missing_viewport,
+        "impact": "Page is not treated as mobile-friendly",
+        "severity": "medium",
+    },
+    {
+        "name": "Image Lazy Loading",
+        "category": "performance",
+        "run": _eager_images,
+        "impact": "Offscreen images compete with the LCP element for bandwidth",
+        "severity": "low",
+    },
+]
+
+
+@dataclass
+class PrerenderedPage:
+    """One prerendered route in the build output"""
+    route: str
+    html_path: str
+    rsc_path: Optional[str] = None
+    meta_path: Optional[str] = None
+
+
+@dataclass
+class PageAudit:
+    """Worker result: facts plus failed per-page checks (name -> message)"""
+    facts: PageFacts
+    failures: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class BuildAuditStats:
+    """Counters for one build audit"""
+    pages: int = 0
+    rsc_files: int = 0
+    bytes_parsed: int = 0
+    seconds: float = 0.0
+
+
+def route_for_file(relative: Path) -> str:
+    """
+    Map a prerendered file under .next/server/app to its public route.
+
+    Args:
+        relative: Path relative to .next/server/app, e.g. "zh/blog/post.html"
+
+    Returns:
+        Route, e.g. "/zh/blog/post"; index -> "/", default locale unprefixed
+    """
+    parts = list(relative.with_suffix("").parts)
+    if parts and parts[-1] == "index":
+        parts.pop()
+    if parts and parts[0] == DEFAULT_LOCALE:
+        parts.pop(0)
+    return "/" + "/".join(parts)
+
+
+def iter_prerendered_pages(app_dir: Path) -> Iterator[PrerenderedPage]:
+    """
+    Yield every prerendered HTML route with its sibling .rsc/.meta files.
+
+    app/[locale] also prerenders the default locale, so "en/about.html"
+    and the root "about.html" both serve /about; the root file wins and
+    each route is yielded once.
+
+    Args:
+        app_dir: .next/server/app
+
+    Yields:
+        PrerenderedPage
+    """
+    html_paths = sorted(app_dir.rglob("*.html"))
+    root_routes = {
+        route_for_file(path.relative_to(app_dir))
+        for path in html_paths
+        if path.relative_to(app_dir).with_suffix("").parts[0] != DEFAULT_LOCALE
+    }
+    for html_path in html_paths:
+        relative = html_path.relative_to(app_dir)
+        route = route_for_file(relative)
+        if relative.with_suffix("").parts[0] == DEFAULT_LOCALE and route in root_routes:
+            continue
+        rsc_path = html_path.with_suffix(".rsc")
+        meta_path = html_path.with_suffix(".meta")
+        yield PrerenderedPage(
+            route=route,
+            html_path=str(html_path),
+            rsc_path=str(rsc_path) if rsc_path.exists() else None,
+            meta_path=str(meta_path) if meta_path.exists() else None,
+        )
+
+
+def _rsc_links(rsc_path: str, hosts: tuple[str, ...]) -> list[str]:
+    links = []
+    tail = b""
+    with open(rsc_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(RSC_CHUNK_SIZE), b""):
+            data = tail + chunk
+            # Defer the last (possibly unterminated) href, or a partial marker, to the next chunk
+            last = data.rfind(b'"href":"')
+            cut = last if last != -1 else max(0, len(data) - len(b'"href":"'))
+            for match in _RSC_HREF_PATTERN.finditer(data, 0, cut):
+                path = normalize_page_path(match.group(1).decode("utf-8", "replace"), BASE_URL, hosts)
+                if path:
+                    links.append(path)
+            tail = data[cut:]
+    for match in _RSC_HREF_PATTERN.finditer(tail):
+        path = normalize_page_path(match.group(1).decode("utf-8", "replace"), BASE_URL, hosts)
+        if path:
+            links.append(path)
+    return links
+
+
+def audit_prerendered_page(page: PrerenderedPage) -> PageAudit:
+    """
+    Parse one prerendered page and run PAGE_CHECKS on it.
+
+    Top-level so it can run in a worker process.
+
+    Args:
+        page: Prerendered route
+
+    Returns:
+        PageAudit
+    """
+    hosts = internal_hosts(BASE_URL)
+    facts = extract_page_facts_from_file(page.route, page.html_path, BASE_URL, hosts)
+
+    name = Path(page.html_path).stem
+    if name in ERROR_PAGES:
+        facts.status = ERROR_PAGES[name]
+    if page.meta_path:
+        with open(page.meta_path, "r", encoding="utf-8") as handle:
+            meta = json.load(handle)
+        facts.status = meta.get("status", facts.status)
+        facts.content_type = meta.get("headers", {}).get("content-type", facts.content_type)
+
+    if page.rsc_path:
+        known = set(facts.links)
+        facts.links.extend(link for link in dict.fromkeys(_rsc_links(page.rsc_path, hosts)) if link not in known)
+
+    audit = PageAudit(facts=facts)
+    if facts.is_indexable:
+        for check in PAGE_CHECKS:
+            message = check["run"](facts)
+            if message:
+                audit.failures[check["name"]] = message
+    return audit
+
+
+def _read_body(app_dir: Path, name: str) -> Optional[bytes]:
+    body = app_dir / f"{name}.body"
+    return body.read_bytes() if body.exists() else None
+
+
+def summarize_page_checks(audits: list[PageAudit]) -> list[SEOCheck]:
+    """
+    Turn per-page failures into one SEOCheck per PAGE_CHECKS entry.
+
+    Args:
+        audits: Worker results
+
+    Returns:
+        List of SEOCheck with failing pages in details["pages"]
+    """
+    checked = [a for a in audits if a.facts.is_indexable]
+    checks = []
+    for declared in PAGE_CHECKS:
+        failing = {a.facts.path: a.failures[declared["name"]] for a in checked if declared["name"] in a.failures}
+        if not failing:
+            status, priority = CheckStatus.PASSED, Priority.LOW
+            message = f"All {len(checked)} pages pass"
+        elif len(failing) > len(checked) * PAGE_CHECK_FAIL_RATIO:
+            status, priority = CheckStatus.FAILED, Priority.HIGH
+            message = f"{len(failing)} of {len(checked)} pages fail"
+        else:
+            status, priority = CheckStatus.WARNING, Priority.MEDIUM
+            message = f"{len(failing)} of {len(checked)} pages fail"
+        checks.append(SEOCheck(
+            name=declared["name"],
+            category=declared["category"],
+            status=status,
+            message=message,
+            impact=declared["impact"],
+            priority=priority,
+            details={"pagesChecked": len(checked), "pages": failing},
+            severity=declared["severity"],
+        ))
+    return checks
+
+
+def audit_build(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    build_dir: str = DEFAULT_BUILD_DIR,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    on_score: Optional[Callable[[SEOCheck, LiveScore], None]] = None
+) -> tuple[AuditReport, BuildAuditStats]:
+    """
+    Audit the prerendered build output without a server.
+
+    Args:
+        root: Repository root
+        build_dir: Build directory relative to root
+        max_workers: Worker processes (defaults to CPU count)
+        progress: Called with the number of pages audited so far
+        on_score: Called after each check with the live weighted score
+
+    Returns:
+        Tuple of (AuditReport, BuildAuditStats)
+
+    Raises:
+        FileNotFoundError: If the build output does not exist
+    """
+    app_dir = Path(root) / build_dir / APP_OUTPUT_DIR
+    if not app_dir.is_dir():
+        raise FileNotFoundError(f"No prerendered output at {app_dir}; run `npm run build` first")
+
+    started = time.perf_counter()
+    pages = list(iter_prerendered_pages(app_dir))
+    stats = BuildAuditStats(
+        pages=len(pages),
+        rsc_files=sum(1 for p in pages if p.rsc_path),
+        bytes_parsed=sum(Path(p.html_path).stat().st_size for p in pages),
+    )
+
+    audits: list[PageAudit] = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        chunksize = max(1, len(pages) // ((max_workers or 4) * 8))
+        for audit in pool.map(audit_prerendered_page, pages, chunksize=chunksize):
+            audits.append(audit)
+            if progress:
+                progress(len(audits))
+
+    snapshot = SiteSnapshot(base_url=BASE_URL, source="build")
+    snapshot.pages = {a.facts.path: a.facts for a in audits}
+
+    robots = _read_body(app_dir, "robots.txt")
+    snapshot.robots_status = 200 if robots is not None else 404
+    snapshot.robots_txt = robots.decode("utf-8", errors="replace") if robots is not None else None
+    sitemap = _read_body(app_dir, "sitemap.xml")
+    snapshot.sitemap_status = 200 if sitemap is not None else 404
+    if sitemap:
+        try:
+            snapshot.sitemap_urls = [
+                loc.text.strip() for loc in ET.fromstring(sitemap).iter(f"{_SITEMAP_NS}loc") if loc.text
+            ]
+        except ET.ParseError:
+            snapshot.sitemap_status = 500
+
+    board = ScoreBoard(expected=len(BASE_CHECKS) + len(EXTENDED_CHECKS) + len(PAGE_CHECKS))
+    checks = run_declared_checks(snapshot, on_score, board)
+    for check in summarize_page_checks(audits):
+        checks.append(check)
+        live = board.add(check)
+        if on_score:
+            on_score(check, live)
+    stats.seconds = round(time.perf_counter() - started, 3)
+    return build_audit_report(checks, board), stats
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+After `npm run build` (no `next start` needed):
+
+```python
+from build_audit import audit_build
+from technical_seo_audit import get_status_emoji
+
+report, stats = audit_build()
+print(f"{report.overall_score}/100 - {stats.pages} pages "
+      f"({stats.bytes_parsed / 1e6:.1f} MB) in {stats.seconds}s")
+
+for check in report.priority_fixes:
+    print(get_status_emoji(check.status), check.name, "-", check.message)
+    for page, problem in list(check.details.get("pages", {}).items())[:5]:
+        print("   ", page, "->", problem)
+```
+
+Response time and compression cannot be measured offline; those
+sub-checks are excluded from "Page Speed Basics" rather than failed.
+"""
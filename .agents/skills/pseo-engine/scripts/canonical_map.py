@@ -0,0 +1,178 @@
+"""
+Canonical Map Module for pSEO Engine
+
+This module checks canonical tags across the whole site in linear time.
+One pass over the audited pages builds two hash maps:
+
+- canonical path -> pages declaring it
+- content hash   -> pages with that visible text
+
+From those it reports:
+
+- pages without a canonical, or with an off-site canonical
+- canonicals pointing at a non-200, noindex or redirecting URL (redirects
+  are taken from the crawl, or from the configured redirect graph when
+  the target was not fetched)
+- clusters: pages sharing a canonical but with different content
+- duplicates: identical content under different canonicals
+
+Usage by Claude:
+- Trigger: "seo audit" (Canonical Tags Consistency), "check canonicals"
+- build_canonical_map(pages) -> CanonicalReport
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+from page_facts import PageFacts, internal_hosts
+from redirect_analyzer import RedirectGraph
+from site_routes import BASE_URL, normalize_path
+
+
+@dataclass
+class CanonicalIssue:
+    """A page whose canonical target is not a valid final URL"""
+    page: str
+    canonical: str
+    problem: str
+
+
+@dataclass
+class CanonicalCluster:
+    """Pages grouped under one canonical (or one content hash)"""
+    key: str
+    pages: dict[str, Optional[str]] = field(default_factory=dict)  # page -> content hash or canonical
+
+
+@dataclass
+class CanonicalReport:
+    """Result of one pass over the audited pages"""
+    pages: int = 0
+    canonicals: int = 0
+    missing: list[str] = field(default_factory=list)
+    external: list[str] = field(default_factory=list)
+    self_referencing: int = 0
+    target_issues: list[CanonicalIssue] = field(default_factory=list)
+    conflicting_clusters: list[CanonicalCluster] = field(default_factory=list)
+    duplicate_content: list[CanonicalCluster] = field(default_factory=list)
+
+    @property
+    def issue_count(self) -> int:
+        return (
+            len(self.missing) + len(self.external) + len(self.target_issues)
+            + len(self.conflicting_clusters) + len(self.duplicate_content)
+        )
+
+
+def build_canonical_map(
+    pages: Iterable[PageFacts],
+    base_url: str = BASE_URL,
+    graph: Optional[RedirectGraph] = None
+) -> CanonicalReport:
+    """
+    Group pages by canonical and content hash, then validate every canonical target.
+
+    Args:
+        pages: Every audited page (non-HTML and non-200 pages only serve
+            as canonical targets)
+        base_url: Origin the pages were audited from
+        graph: Configured redirect graph for targets that were not fetched
+
+    Returns:
+        CanonicalReport
+    """
+    hosts = internal_hosts(base_url)
+    by_path: dict[str, PageFacts] = {}
+    by_canonical: dict[str, dict[str, Optional[str]]] = {}
+    by_content: dict[str, dict[str, str]] = {}
+    report = CanonicalReport()
+
+    for page in pages:
+        by_path[page.path] = page
+        if not (page.status == 200 and page.is_html and page.is_indexable):
+            continue
+        report.pages += 1
+        if not page.canonical:
+            report.missing.append(page.path)
+            continue
+        parts = urlsplit(page.canonical)
+        if parts.hostname not in hosts:
+            report.external.append(page.path)
+            continue
+        target = normalize_path(parts.path)
+        by_canonical.setdefault(target, {})[page.path] = page.content_hash
+        if page.content_hash:
+            by_content.setdefault(page.content_hash, {})[page.path] = target
+
+    report.canonicals = len(by_canonical)
+
+    for target, members in by_canonical.items():
+        if target in members:
+            report.self_referencing += 1
+        problem = _target_problem(target, by_path.get(target), base_url, graph)
+        if problem:
+            report.target_issues.extend(
+                CanonicalIssue(page=page, canonical=target, problem=problem) for page in members
+            )
+        hashes = {digest for digest in members.values() if digest}
+        if len(hashes) > 1:
+            report.conflicting_clusters.append(CanonicalCluster(key=target, pages=dict(members)))
+
+    for digest, members in by_content.items():
+        if len(set(members.values())) > 1:
+            report.duplicate_content.append(CanonicalCluster(key=digest, pages=dict(members)))
+
+    report.target_issues.sort(key=lambda issue: (issue.canonical, issue.page))
+    report.conflicting_clusters.sort(key=lambda cluster: -len(cluster.pages))
+    report.duplicate_content.sort(key=lambda cluster: -len(cluster.pages))
+    return report
+
+
+def _target_problem(
+    target: str,
+    facts: Optional[PageFacts],
+    base_url: str,
+    graph: Optional[RedirectGraph]
+) -> Optional[str]:
+    if facts is not None:
+        if 300 <= facts.status < 400:
+            return f"canonical redirects ({facts.status}) to {facts.location or '?'}"
+        if facts.status != 200:
+            return f"canonical returns {facts.status}"
+        if not facts.is_indexable:
+            return "canonical is noindex"
+        return None
+    if graph is not None:
+        hop = graph.step(graph.base_url + ("" if target == "/" else target))
+        if hop is not None:
+            return f"canonical redirects ({hop.status}, {hop.origin}) to {hop.target}"
+    return None
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+On the pages of a crawl or a build audit:
+
+```python
+from canonical_map import build_canonical_map
+from redirect_analyzer import load_redirect_graph
+
+report = build_canonical_map(snapshot.pages.values(), graph=load_redirect_graph())
+
+print(f"{report.pages} pages -> {report.canonicals} canonicals "
+      f"({report.self_referencing} self-referencing)")
+for issue in report.target_issues[:20]:
+    print(issue.page, "->", issue.canonical, ":", issue.problem)
+for cluster in report.conflicting_clusters[:10]:
+    print("Different content, same canonical", cluster.key, list(cluster.pages))
+for cluster in report.duplicate_content[:10]:
+    print("Same content, different canonicals", cluster.pages)
+```
+
+Conflicting clusters usually mean a template emits the wrong canonical
+(e.g. every locale pointing at the English page); duplicate content
+clusters should share one canonical.
+"""
@@ -0,0 +1,358 @@
+"""
+Catalog Loader Module for pSEO Engine
+
+This module loads the pSEO catalog (technologies, roles, features and
+optionally templates/FAQ patterns) from data files instead of the
+DEFAULT_* lists hardcoded in pseo_generator.py.
+
+Supported sources:
+- A JSON file in the pseo_data.json shape (camelCase keys), so the
+  generated data/pseo_data.json can be edited and fed straight back in
+- A directory with technologies.csv, roles.csv, features.csv (list
+  columns separated by "|") and an optional templates.json
+
+Parsed catalogs are validated, their strings interned, and the result is
+cached per process and on disk keyed by the SHA-256 of the source files.
+
+Usage by Claude:
+- Trigger: "generate pseo" when the user maintains the catalog as data
+- load_catalog(path) -> PSEOData -> generate_pseo_data(catalog)
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+import copy
+import csv
+import hashlib
+import json
+import pickle
+import re
+import sys
+
+from pseo_generator import Feature, PSEOData, Role, Technology
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "outputs" / ".catalog_cache"
+
+# Bump when the record layout or validation changes so stale pickles are ignored
+CACHE_VERSION = 2
+
+CSV_LIST_SEPARATOR = "|"
+
+SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
+# Field schema per collection: (record class, required str fields,
+# list[str] fields, lists the pages index into and so must not be empty,
+# optional str fields, file key -> attribute name)
+CATALOG_SCHEMA = {
+    "technologies": {
+        "record": Technology,
+        "required": ("slug", "name", "description"),
+        "lists": ("features", "useCases", "relatedPosts"),
+        "nonempty": ("features", "useCases"),
+        "optional": ("icon",),
+        "attributes": {"useCases": "use_cases", "relatedPosts": "related_posts"},
+    },
+    "roles": {
+        "record": Role,
+        "required": ("slug", "name", "description"),
+        "lists": ("keywords", "challenges", "goals"),
+        "nonempty": ("challenges", "goals"),
+        "optional": (),
+        "attributes": {},
+    },
+    "features": {
+        "record": Feature,
+        "required": ("slug", "name", "description"),
+        "lists": ("benefits",),
+        "nonempty": (),
+        "optional": ("technicalDetails",),
+        "attributes": {"technicalDetails": "technical_details"},
+    },
+}
+
+# Pattern sections a catalog's templates/faqs must define (see
+# pseo_generator.DEFAULT_TEMPLATES / DEFAULT_FAQS) and the string keys of each
+TEMPLATE_KEYS = ("titlePattern", "descriptionPattern", "h1Pattern")
+FAQ_KEYS = ("questionPattern", "answerPattern")
+PATTERN_SECTIONS = ("techRole", "feature")
+
+# Parsed catalogs for this process: fingerprint -> PSEOData
+_memory_cache: dict[str, PSEOData] = {}
+
+
+class CatalogValidationError(ValueError):
+    """Raised when catalog files do not match CATALOG_SCHEMA"""
+
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        super().__init__(f"{len(errors)} catalog error(s):\n" + "\n".join(f"- {e}" for e in errors))
+
+
+def _catalog_files(path: Path) -> list[Path]:
+    if path.is_dir():
+        names = [f"{collection}.csv" for collection in CATALOG_SCHEMA] + ["templates.json"]
+        return [path / name for name in names if (path / name).exists()]
+    return [path]
+
+
+def catalog_fingerprint(path: Union[str, Path]) -> str:
+    """
+    Hash every file that makes up a catalog.
+
+    Args:
+        path: Catalog JSON file or CSV directory
+
+    Returns:
+        Hex SHA-256 digest over file names and contents
+    """
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode("utf-8"))
+    for file in _catalog_files(Path(path)):
+        digest.update(file.name.encode("utf-8"))
+        with file.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 16), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_raw(path: Path) -> dict:
+    if not path.is_dir():
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    raw: dict = {}
+    for collection, schema in CATALOG_SCHEMA.items():
+        csv_path = path / f"{collection}.csv"
+        if not csv_path.exists():
+            raw[collection] = []
+            continue
+        with csv_path.open("r", encoding="utf-8", newline="") as handle:
+            rows = []
+            for row in csv.DictReader(handle):
+                for key in schema["lists"]:
+                    value = (row.get(key) or "").strip()
+                    row[key] = [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+                rows.append(row)
+            raw[collection] = rows
+
+    templates_path = path / "templates.json"
+    if templates_path.exists():
+        with templates_path.open("r", encoding="utf-8") as handle:
+            extra = json.load(handle)
+        raw["templates"] = extra.get("templates", {})
+        raw["faqs"] = extra.get("faqs", {})
+    return raw
+
+
+def validate_catalog(raw: dict) -> list[str]:
+    """
+    Check a raw catalog against CATALOG_SCHEMA.
+
+    Args:
+        raw: Parsed JSON/CSV data
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    errors = []
+
+    for collection, schema in CATALOG_SCHEMA.items():
+        entries = raw.get(collection, [])
+        if not isinstance(entries, list):
+            errors.append(f"{collection}: expected a list")
+            continue
+
+        seen = set()
+        for index, entry in enumerate(entries):
+            where = f"{collection}[{index}]"
+            if not isinstance(entry, dict):
+                errors.append(f"{where}: expected an object")
+                continue
+
+            for key in schema["required"]:
+                value = entry.get(key)
+                if not isinstance(value, str) or not value.strip():
+                    errors.append(f"{where}.{key}: required non-empty string")
+
+            for key in schema["lists"]:
+                value = entry.get(key, [])
+                if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                    errors.append(f"{where}.{key}: expected a list of strings")
+                elif key in schema["nonempty"] and not any(item.strip() for item in value):
+                    errors.append(f"{where}.{key}: required non-empty list")
+
+            for key in schema["optional"]:
+                value = entry.get(key)
+                if value is not None and not isinstance(value, str):
+                    errors.append(f"{where}.{key}: expected a string")
+
+            slug = entry.get("slug")
+            if isinstance(slug, str):
+                if not SLUG_PATTERN.match(slug):
+                    errors.append(f"{where}.slug: '{slug}' is not a lowercase kebab-case slug")
+                elif slug in seen:
+                    errors.append(f"{where}.slug: duplicate slug '{slug}'")
+                seen.add(slug)
+
+    errors.extend(_validate_patterns(raw))
+    return errors
+
+
+def _validate_patterns(raw: dict) -> list[str]:
+    # An empty or missing templates/faqs object falls back to the defaults
+    errors = []
+
+    templates = raw.get("templates") or {}
+    if not isinstance(templates, dict):
+        errors.append("templates: expected an object")
+    elif templates:
+        for section in PATTERN_SECTIONS:
+            patterns = templates.get(section)
+            if not isinstance(patterns, dict):
+                errors.append(f"templates.{section}: expected an object")
+                continue
+            for key in TEMPLATE_KEYS:
+                value = patterns.get(key)
+                if not isinstance(value, str) or not value.strip():
+                    errors.append(f"templates.{section}.{key}: required non-empty string")
+
+    faqs = raw.get("faqs") or {}
+    if not isinstance(faqs, dict):
+        errors.append("faqs: expected an object")
+    elif faqs:
+        for section in PATTERN_SECTIONS:
+            entries = faqs.get(section)
+            if not isinstance(entries, list):
+                errors.append(f"faqs.{section}: expected a list")
+                continue
+            for index, entry in enumerate(entries):
+                where = f"faqs.{section}[{index}]"
+                if not isinstance(entry, dict):
+                    errors.append(f"{where}: expected an object")
+                    continue
+                for key in FAQ_KEYS:
+                    value = entry.get(key)
+                    if not isinstance(value, str) or not value.strip():
+                        errors.append(f"{where}.{key}: required non-empty string")
+
+    return errors
+
+
+def _build_record(schema: dict, entry: dict):
+    kwargs = {}
+    for key in schema["required"] + schema["optional"]:
+        value = entry.get(key)
+        if value not in (None, ""):
+            kwargs[schema["attributes"].get(key, key)] = sys.intern(value.strip())
+    for key in schema["lists"]:
+        kwargs[schema["attributes"].get(key, key)] = [sys.intern(item) for item in entry.get(key, [])]
+    return schema["record"](**kwargs)
+
+
+def parse_catalog(raw: dict) -> PSEOData:
+    """
+    Validate a raw catalog and build slotted records from it.
+
+    Args:
+        raw: Parsed JSON/CSV data
+
+    Returns:
+        PSEOData with Technology/Role/Feature records
+
+    Raises:
+        CatalogValidationError: If the data does not match the schema
+    """
+    errors = validate_catalog(raw)
+    if errors:
+        raise CatalogValidationError(errors)
+
+    return PSEOData(
+        technologies=[_build_record(CATALOG_SCHEMA["technologies"], e) for e in raw.get("technologies", [])],
+        roles=[_build_record(CATALOG_SCHEMA["roles"], e) for e in raw.get("roles", [])],
+        features=[_build_record(CATALOG_SCHEMA["features"], e) for e in raw.get("features", [])],
+        templates=raw.get("templates", {}),
+        faqs=raw.get("faqs", {}),
+    )
+
+
+def load_catalog(
+    path: Union[str, Path],
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> PSEOData:
+    """
+    Load a catalog, reusing a cached parse when the files are unchanged.
+
+    Every call returns its own copy, so editing the result does not
+    change what later calls load.
+
+    Args:
+        path: Catalog JSON file or CSV directory
+        cache_dir: On-disk cache directory (None disables the disk cache)
+
+    Returns:
+        PSEOData ready for pseo_generator.generate_pseo_data()
+
+    Raises:
+        FileNotFoundError: If the catalog does not exist
+        CatalogValidationError: If the data does not match the schema
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Catalog not found: {path}")
+
+    fingerprint = catalog_fingerprint(path)
+    if fingerprint in _memory_cache:
+        return copy.deepcopy(_memory_cache[fingerprint])
+
+    cache_file = cache_dir / f"{fingerprint}.pickle" if cache_dir else None
+    if cache_file and cache_file.exists():
+        try:
+            with cache_file.open("rb") as handle:
+                catalog = pickle.load(handle)
+            _memory_cache[fingerprint] = catalog
+            return copy.deepcopy(catalog)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            cache_file.unlink(missing_ok=True)
+
+    catalog = parse_catalog(_read_raw(path))
+    _memory_cache[fingerprint] = catalog
+
+    if cache_file:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with tmp_file.open("wb") as handle:
+            pickle.dump(catalog, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+
+    return copy.deepcopy(catalog)
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+When the user wants to add technologies, roles or features without
+editing Python:
+
+1. Edit the catalog data (either form works):
+   - `data/pseo_data.json` (same shape the generator writes)
+   - A directory with `technologies.csv`, `roles.csv`, `features.csv`
+
+```csv
+slug,name,description,features,useCases,relatedPosts,icon
+nextjs,Next.js,The React framework...,SSR|SSG|API Routes,Portfolio websites|Blogs,,nextjs
+```
+
+2. Load and regenerate:
+```python
+from catalog_loader import load_catalog
+from pseo_generator import generate_pseo_data, write_incremental_outputs
+
+catalog = load_catalog("data/pseo_data.json")
+data = generate_pseo_data(catalog)
+manifest = write_incremental_outputs(data)
+```
+
+3. On validation errors, report every entry from
+   `CatalogValidationError.errors` and stop before writing files.
+"""
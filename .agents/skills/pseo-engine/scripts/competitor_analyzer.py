@@ -9,10 +9,42 @@ Usage by Claude:
 - Use WebFetch to retrieve competitor page
 - Compare against our site's content
 - Generate actionable opportunity report
+
+Saved or fetched HTML is analyzed with one streaming html.parser pass
+(CompetitorPageParser): metrics, JSON-LD, heading outline and body text
+come out together, so large pages are read once.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Iterable, Optional, Union
+from urllib.parse import urlsplit
+import codecs
+import json
+import re
+
+from keyword_extractor import DocumentFrequency, extract_keywords
+from page_facts import NON_CONTENT_TAGS
+
+
+# Elements that separate runs of text (so "</p><p>" does not glue words)
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "td", "th", "tr", "ul",
+}
+
+# Headings recorded in content_structure
+OUTLINE_LEVELS = {"h1": 1, "h2": 2, "h3": 3}
+
+# Only these tags need their attributes looked at
+ATTRIBUTE_TAGS = {"a", "code", "iframe", "link", "meta", "script"}
+
+VIDEO_HOSTS = ("youtube.com", "youtube-nocookie.com", "youtu.be", "vimeo.com")
+
+_WHITESPACE = re.compile(r"[^\S\n]+")
 
 
 @dataclass
@@ -69,6 +101,19 @@ class CompetitorAnalysis:
     weaknesses: list[str] = field(default_factory=list)
 
 
+@dataclass
+class PageExtract:
+    """Everything one parsing pass collects from a page"""
+    title: str = ""
+    meta_description: str = ""
+    canonical: Optional[str] = None  # rel=canonical, else og:url
+    metrics: ContentMetrics = field(default_factory=ContentMetrics)
+    schema_info: SchemaInfo = field(default_factory=SchemaInfo)
+    content_structure: list[str] = field(default_factory=list)
+    text: str = ""  # visible text, one block per line
+    jsonld_errors: int = 0
+
+
 @dataclass
 class GapAnalysis:
     """Gap analysis between competitor and our site"""
@@ -80,43 +125,234 @@ class GapAnalysis:
     opportunities: list[dict] = field(default_factory=list)
 
 
-def extract_content_metrics(html_content: str) -> ContentMetrics:
+class CompetitorPageParser(HTMLParser):
     """
-    Extract content metrics from HTML.
+    Single-pass extractor: call feed() with str chunks, then close().
+
+    Args:
+        extract: PageExtract to fill in
+        page_url: URL of the page (links to other hosts count as external;
+            without it, only absolute links do)
+    """
+
+    def __init__(self, extract: PageExtract, page_url: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.extract = extract
+        self.host = urlsplit(page_url).hostname if page_url else None
+        self._skip_depth = 0
+        self._in_title = False
+        self._title_parts: list[str] = []
+        self._jsonld_parts: Optional[list[str]] = None
+        self._heading: Optional[tuple[int, list[str]]] = None
+        self._text_parts: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        a = {name: value or "" for name, value in attrs} if tag in ATTRIBUTE_TAGS else {}
+        metrics = self.extract.metrics
+        if tag == "script" and a.get("type", "").lower() == "application/ld+json":
+            self._jsonld_parts = []
+        if tag in NON_CONTENT_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        if tag in BLOCK_TAGS:
+            self._text_parts.append("\n")
+
+        if tag == "title" and not self._title_parts:
+            self._in_title = True
+        elif tag == "meta":
+            name = (a.get("name") or a.get("property") or "").lower()
+            if name == "description":
+                self.extract.meta_description = a.get("content", "").strip()
+            elif name == "og:url" and self.extract.canonical is None:
+                self.extract.canonical = a.get("content") or None
+        elif tag == "link" and "canonical" in a.get("rel", "").lower().split() and a.get("href"):
+            self.extract.canonical = a["href"]
+        elif tag in OUTLINE_LEVELS:
+            self._heading = (OUTLINE_LEVELS[tag], [])
+            if tag == "h2":
+                metrics.h2_count += 1
+            elif tag == "h3":
+                metrics.h3_count += 1
+        elif tag == "img":
+            metrics.image_count += 1
+        elif tag == "video":
+            metrics.video_count += 1
+        elif tag == "iframe" and any(host in a.get("src", "") for host in VIDEO_HOSTS):
+            metrics.video_count += 1
+        elif tag == "pre" or (tag == "code" and "class" in a):
+            metrics.code_block_count += 1
+        elif tag in ("ul", "ol"):
+            metrics.list_count += 1
+        elif tag == "table":
+            metrics.table_count += 1
+        elif tag == "a" and a.get("href"):
+            self._count_link(a["href"])
+
+    def _count_link(self, href: str) -> None:
+        metrics = self.extract.metrics
+        if href.startswith(("#", "mailto:", "tel:", "javascript:")):
+            return
+        host = urlsplit(href).hostname
+        if host is None or (self.host is not None and host.removeprefix("www.") == self.host.removeprefix("www.")):
+            metrics.internal_link_count += 1
+        else:
+            metrics.external_link_count += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script" and self._jsonld_parts is not None:
+            self._add_jsonld("".join(self._jsonld_parts))
+            self._jsonld_parts = None
+        if tag in NON_CONTENT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if self._skip_depth:
+            return
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.extract.title = " ".join("".join(self._title_parts).split())
+        elif tag in OUTLINE_LEVELS and self._heading is not None:
+            level, parts = self._heading
+            self._heading = None
+            text = " ".join("".join(parts).split())
+            if text:
+                self.extract.content_structure.append(f"{'  ' * (level - 1)}H{level}: {text}")
+        if tag in BLOCK_TAGS:
+            self._text_parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self._jsonld_parts is not None:
+            self._jsonld_parts.append(data)
+        elif self._skip_depth:
+            return
+        elif self._in_title:
+            self._title_parts.append(data)
+        else:
+            self._text_parts.append(data)
+            if self._heading is not None:
+                self._heading[1].append(data)
+
+    def _add_jsonld(self, raw: str) -> None:
+        info = self.extract.schema_info
+        try:
+            schema = json.loads(raw.strip())
+        except ValueError:
+            self.extract.jsonld_errors += 1
+            return
+        info.raw_schemas.append(schema)
+        for node in _schema_nodes(schema):
+            schema_type = node.get("@type", "")
+            types = schema_type if isinstance(schema_type, list) else [schema_type]
+            info.types.extend(types)
+            joined = " ".join(str(t) for t in types)
+            if "FAQPage" in joined:
+                info.has_faq = True
+            if "HowTo" in joined:
+                info.has_howto = True
+            if "Article" in joined or "BlogPosting" in joined:
+                info.has_article = True
+            if "BreadcrumbList" in joined:
+                info.has_breadcrumb = True
+            if "Organization" in joined:
+                info.has_organization = True
+
+    def close(self) -> None:
+        super().close()
+        lines = (_WHITESPACE.sub(" ", line).strip() for line in "".join(self._text_parts).split("\n"))
+        self.extract.text = "\n".join(line for line in lines if line)
+        self._text_parts = []
+        metrics = self.extract.metrics
+        metrics.word_count = len(self.extract.text.split())
+        metrics.heading_count = metrics.h2_count + metrics.h3_count
+
+
+def _schema_nodes(schema) -> list[dict]:
+    # Top-level objects, arrays of objects, and @graph members
+    if isinstance(schema, list):
+        return [node for item in schema for node in _schema_nodes(item)]
+    if not isinstance(schema, dict):
+        return []
+    if "@graph" in schema:
+        return [schema] * ("@type" in schema) + _schema_nodes(schema["@graph"])
+    return [schema]
+
+
+def extract_page(html_content: str, url: Optional[str] = None) -> PageExtract:
+    """
+    Extract metrics, JSON-LD, heading outline and text in one pass.
 
     Args:
         html_content: Raw HTML content
+        url: Page URL (for internal/external link counts)
 
     Returns:
-        ContentMetrics with extracted values
+        PageExtract
     """
-    metrics = ContentMetrics()
+    extract = PageExtract()
+    parser = CompetitorPageParser(extract, url)
+    parser.feed(html_content)
+    parser.close()
+    return extract
 
-    # Count words (rough estimate from text content)
-    import re
-    text = re.sub(r'<[^>]+>', ' ', html_content)
-    words = text.split()
-    metrics.word_count = len(words)
 
-    # Count headings
-    metrics.h2_count = len(re.findall(r'<h2[^>]*>', html_content, re.IGNORECASE))
-    metrics.h3_count = len(re.findall(r'<h3[^>]*>', html_content, re.IGNORECASE))
-    metrics.heading_count = metrics.h2_count + metrics.h3_count
+def _parse_chunks(chunks: Iterable[bytes], url: Optional[str]) -> PageExtract:
+    extract = PageExtract()
+    parser = CompetitorPageParser(extract, url)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return extract
 
-    # Count media
-    metrics.image_count = len(re.findall(r'<img[^>]+>', html_content, re.IGNORECASE))
-    metrics.video_count = len(re.findall(r'<video|<iframe[^>]*youtube|<iframe[^>]*vimeo', html_content, re.IGNORECASE))
 
-    # Count code blocks
-    metrics.code_block_count = len(re.findall(r'<pre[^>]*>|<code[^>]*class="', html_content, re.IGNORECASE))
+def extract_page_from_file(file_path: Union[str, Path], url: Optional[str] = None, chunk_size: int = 1 << 16) -> PageExtract:
+    """
+    Like extract_page(), reading a saved page chunk by chunk.
 
-    # Count lists
-    metrics.list_count = len(re.findall(r'<ul[^>]*>|<ol[^>]*>', html_content, re.IGNORECASE))
+    Args:
+        file_path: HTML file on disk
+        url: Original page URL
+        chunk_size: Bytes per read
+
+    Returns:
+        PageExtract
+    """
+    with open(file_path, "rb") as handle:
+        return _parse_chunks(iter(lambda: handle.read(chunk_size), b""), url)
 
-    # Count tables
-    metrics.table_count = len(re.findall(r'<table[^>]*>', html_content, re.IGNORECASE))
 
-    return metrics
+def extract_page_from_buffer(buffer: Union[bytes, memoryview], url: Optional[str] = None, chunk_size: int = 1 << 16) -> PageExtract:
+    """
+    Like extract_page(), for raw HTML bytes such as a snapshot_store view.
+
+    The buffer is fed in memoryview slices, so only one decoded chunk
+    exists at a time.
+
+    Args:
+        buffer: UTF-8 HTML (bytes, or a memoryview from SnapshotStore.read())
+        url: Original page URL
+        chunk_size: Bytes per parser feed
+
+    Returns:
+        PageExtract
+    """
+    view = memoryview(buffer)
+    return _parse_chunks((view[offset:offset + chunk_size] for offset in range(0, len(view), chunk_size)), url)
+
+
+def extract_content_metrics(html_content: str) -> ContentMetrics:
+    """
+    Extract content metrics from HTML.
+
+    Args:
+        html_content: Raw HTML content
+
+    Returns:
+        ContentMetrics with extracted values
+    """
+    return extract_page(html_content).metrics
 
 
 def extract_schema_info(html_content: str) -> SchemaInfo:
@@ -129,43 +365,40 @@ def extract_schema_info(html_content: str) -> SchemaInfo:
     Returns:
         SchemaInfo with found schemas
     """
-    import re
-    import json
-
-    info = SchemaInfo()
+    return extract_page(html_content).schema_info
 
-    # Find JSON-LD scripts
-    pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-    matches = re.findall(pattern, html_content, re.DOTALL | re.IGNORECASE)
 
-    for match in matches:
-        try:
-            schema = json.loads(match.strip())
-            info.raw_schemas.append(schema)
-
-            # Detect schema type
-            schema_type = schema.get('@type', '')
-            if isinstance(schema_type, list):
-                info.types.extend(schema_type)
-            else:
-                info.types.append(schema_type)
-
-            # Check for specific types
-            if 'FAQPage' in str(schema_type):
-                info.has_faq = True
-            if 'HowTo' in str(schema_type):
-                info.has_howto = True
-            if 'Article' in str(schema_type) or 'BlogPosting' in str(schema_type):
-                info.has_article = True
-            if 'BreadcrumbList' in str(schema_type):
-                info.has_breadcrumb = True
-            if 'Organization' in str(schema_type):
-                info.has_organization = True
+def analyze_competitor_page(
+    url: str,
+    html_content: Union[str, PageExtract],
+    document_frequency: Optional[DocumentFrequency] = None
+) -> CompetitorAnalysis:
+    """
+    Build a CompetitorAnalysis from a page's HTML in one parsing pass.
 
-        except json.JSONDecodeError:
-            continue
+    Args:
+        url: Competitor URL
+        html_content: Raw HTML, or an already extracted page
+        document_frequency: Background corpus (keyword_extractor); fills
+            keywords_detected with the page's most distinctive phrases
 
-    return info
+    Returns:
+        CompetitorAnalysis (strengths/weaknesses are left to the reviewer)
+    """
+    page = html_content if isinstance(html_content, PageExtract) else extract_page(html_content, url)
+    keywords = []
+    if document_frequency is not None:
+        keywords = extract_keywords("\n".join([page.title, page.meta_description, page.text]), document_frequency)
+    return CompetitorAnalysis(
+        url=url,
+        title=page.title,
+        meta_description=page.meta_description,
+        content_metrics=page.metrics,
+        schema_info=page.schema_info,
+        serp_features=analyze_serp_features(page.metrics, page.schema_info),
+        keywords_detected=keywords,
+        content_structure=page.content_structure,
+    )
 
 
 def analyze_serp_features(content_metrics: ContentMetrics, schema_info: SchemaInfo) -> SERPFeatures:
@@ -305,6 +538,27 @@ def generate_opportunities(
 USAGE_EXAMPLE = """
 ## How Claude Should Use This Module
 
+When the HTML is available (saved page, curl, snapshot), parse it locally
+instead of asking WebFetch for counts:
+
+```python
+from competitor_analyzer import analyze_competitor_page, extract_page_from_file
+
+page = extract_page_from_file("competitor.html", url="https://example.com/guide")
+analysis = analyze_competitor_page("https://example.com/guide", page)
+print(analysis.content_metrics, analysis.schema_info.types)
+print("\\n".join(analysis.content_structure))
+```
+
+Pass a keyword corpus to fill `keywords_detected` (no manual keyword list):
+
+```python
+from competitor_batch import load_competitor_frequency
+
+analysis = analyze_competitor_page("https://example.com/guide", page, load_competitor_frequency())
+print(analysis.keywords_detected)
+```
+
 When user triggers "analyze competitor [url]":
 
 1. Use WebFetch to retrieve the competitor page:
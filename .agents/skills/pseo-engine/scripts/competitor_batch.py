@@ -0,0 +1,507 @@
+"""
+Competitor Batch Module for pSEO Engine
+
+This module benchmarks a whole topic cluster of saved competitor pages at
+once instead of one WebFetch at a time:
+
+- input is a directory or a tar archive (.tar, .tar.gz, ...) of saved
+  HTML pages; first-level subdirectories are topic clusters
+- page URLs come from a manifest.json ({"relative/path.html": url}) when
+  present, else from the page's canonical / og:url
+- pages are parsed in a process pool (competitor_analyzer's single-pass
+  extractor) with a bounded number of pages in flight
+- every CompetitorAnalysis is appended to a JSONL file as it completes
+- every page is kept in the snapshot store (collection
+  "competitors/<cluster>"), and a SnapshotStore can itself be the input,
+  so a cluster can be re-benchmarked later without the original files
+- keywords_detected is filled by TF-IDF against our blog posts and the
+  stored snapshots (keyword_extractor), loaded once per worker
+- a per-cluster gap report aggregates metric percentiles, schema and SERP
+  feature adoption, common H2 topics and keywords, the shared keywords
+  none of our pages cover and, given one of our pages as baseline, the
+  gaps and opportunities against it
+
+Usage by Claude:
+- Trigger: "analyze competitors [dir|tar]", "benchmark competitor cluster"
+- analyze_competitor_batch("competitors/") -> BatchReport
+"""
+
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields, replace
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+import json
+import os
+import tarfile
+import time
+
+from competitor_analyzer import (
+    CompetitorAnalysis,
+    ContentMetrics,
+    analyze_competitor_page,
+    extract_page_from_buffer,
+    generate_opportunities,
+    identify_keyword_gaps,
+)
+from keyword_extractor import (
+    DEFAULT_CACHE_DIR as KEYWORD_CACHE_DIR,
+    CorpusDocument,
+    DocumentFrequency,
+    blog_documents,
+    load_document_frequency,
+)
+from site_routes import DEFAULT_PROJECT_ROOT
+from snapshot_store import DEFAULT_SNAPSHOT_DIR, SnapshotStore, StoredBlob, open_blob, write_blob
+
+
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent.parent / "outputs" / "competitors"
+MANIFEST_NAME = "manifest.json"
+HTML_SUFFIXES = (".html", ".htm")
+SNAPSHOT_COLLECTION = "competitors/"
+
+# Pages submitted to the pool but not yet collected (bounds memory for tar input)
+IN_FLIGHT_PER_WORKER = 4
+
+# A feature/type/heading counts as a cluster norm at this share of pages
+NORM_SHARE = 0.5
+HEADING_SHARE = 0.3
+KEYWORD_SHARE = 0.3
+METRIC_GAP_RATIO = 1.5
+
+
+@dataclass
+class SavedPage:
+    """One saved page handed to a worker"""
+    name: str  # path relative to the directory or archive
+    cluster: str
+    url: Optional[str] = None  # from the manifest
+    path: Optional[str] = None  # file on disk (directory input)
+    data: Optional[bytes] = None  # member contents (tar input)
+    fetched_at: Optional[float] = None  # file / member mtime, or snapshot time
+    store: Optional[str] = None  # snapshot store directory to read from or write to
+    blob: Optional[StoredBlob] = None  # stored body (set by the worker when writing)
+
+
+@dataclass
+class ClusterSummary:
+    """Aggregate benchmark of one topic cluster"""
+    cluster: str
+    pages: int = 0
+    metric_percentiles: dict[str, dict[str, float]] = field(default_factory=dict)  # metric -> pNN -> value
+    schema_share: dict[str, float] = field(default_factory=dict)  # @type -> share of pages
+    serp_feature_share: dict[str, float] = field(default_factory=dict)
+    common_headings: list[tuple[str, int]] = field(default_factory=list)  # H2 -> pages
+    common_keywords: list[tuple[str, int]] = field(default_factory=list)  # keyword -> pages
+    keyword_gaps: list[str] = field(default_factory=list)  # shared keywords none of our pages contain
+    opportunity_counts: dict[str, int] = field(default_factory=dict)  # vs baseline
+    gaps: list[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchReport:
+    """Result of one batch run"""
+    source: str
+    output: Optional[str] = None
+    pages: int = 0
+    failed: list[tuple[str, str]] = field(default_factory=list)  # (page, error)
+    seconds: float = 0.0
+    clusters: dict[str, ClusterSummary] = field(default_factory=dict)
+
+
+def _cluster_of(name: str, default: str) -> str:
+    parts = Path(name).parts
+    return parts[0] if len(parts) > 1 else default
+
+
+def iter_saved_pages(source: Union[str, Path]) -> Iterator[SavedPage]:
+    """
+    Stream saved HTML pages from a directory or tar archive.
+
+    Args:
+        source: Directory, or tar archive (any compression tarfile reads)
+
+    Yields:
+        SavedPage per HTML file, in path order for directories and archive
+        order for tars
+    """
+    source = Path(source)
+    default_cluster = source.name.split(".")[0]
+
+    if source.is_dir():
+        manifest_path = source / MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+        for path in sorted(source.rglob("*")):
+            if path.is_file() and path.suffix.lower() in HTML_SUFFIXES:
+                name = path.relative_to(source).as_posix()
+                yield SavedPage(
+                    name=name,
+                    cluster=_cluster_of(name, default_cluster),
+                    url=manifest.get(name),
+                    path=str(path),
+                    fetched_at=path.stat().st_mtime,
+                )
+        return
+
+    with tarfile.open(source, "r:*") as archive:
+        members = [m for m in archive.getmembers() if m.isfile()]
+        pages = [m for m in members if Path(m.name).suffix.lower() in HTML_SUFFIXES]
+
+        # An archive of one wrapping directory ("tar czf x.tgz competitors/") is unwrapped
+        roots = {Path(m.name).parts[0] for m in pages}
+        wrapper = roots.pop() + "/" if len(roots) == 1 and all(len(Path(m.name).parts) > 1 for m in pages) else ""
+
+        def relative(name: str) -> str:
+            return Path(name).as_posix().removeprefix(wrapper)
+
+        manifest = {}
+        for member in members:
+            if Path(member.name).name == MANIFEST_NAME:
+                prefix = Path(member.name).parent.as_posix()
+                entries = json.load(archive.extractfile(member))
+                manifest.update({relative(f"{prefix}/{key}"): url for key, url in entries.items()})
+        for member in pages:
+            name = relative(member.name)
+            yield SavedPage(
+                name=name,
+                cluster=_cluster_of(name, default_cluster),
+                url=manifest.get(name),
+                data=archive.extractfile(member).read(),
+                fetched_at=float(member.mtime),
+            )
+
+
+def iter_snapshot_pages(store: SnapshotStore, collection: str = SNAPSHOT_COLLECTION, at: Optional[float] = None) -> Iterator[SavedPage]:
+    """
+    Stream the latest stored version of every competitor page.
+
+    Args:
+        store: Snapshot store the pages were recorded in
+        collection: Collection prefix ("competitors/" for every cluster,
+            "competitors/ai-agents" for one)
+        at: Use the versions stored at that time instead of the latest
+
+    Yields:
+        SavedPage per URL, clustered by collection
+    """
+    for snapshot in store.iter_latest(collection, at):
+        yield SavedPage(
+            name=snapshot.url,
+            cluster=snapshot.collection.removeprefix(SNAPSHOT_COLLECTION) or "default",
+            url=snapshot.url,
+            fetched_at=snapshot.fetched_at,
+            store=str(store.directory),
+            blob=StoredBlob(snapshot.digest, snapshot.codec, snapshot.size, snapshot.stored_size),
+        )
+
+
+def _snapshot_text(store_dir: str, snapshot) -> str:
+    page = extract_page_from_buffer(open_blob(store_dir, snapshot.digest, snapshot.codec), snapshot.url)
+    return "\n".join([page.title, page.meta_description, page.text])
+
+
+def snapshot_documents(store: SnapshotStore) -> list[CorpusDocument]:
+    """
+    Latest stored pages as keyword corpus documents (one per distinct body).
+
+    Args:
+        store: Snapshot store
+
+    Returns:
+        CorpusDocument per digest; pages of our own crawls count as ours
+    """
+    documents: dict[str, CorpusDocument] = {}
+    for snapshot in store.iter_latest():
+        if snapshot.digest not in documents:
+            documents[snapshot.digest] = CorpusDocument(
+                key=snapshot.digest,
+                load=partial(_snapshot_text, str(store.directory), snapshot),
+                own=snapshot.collection == "crawl",
+            )
+    return list(documents.values())
+
+
+def load_competitor_frequency(
+    store: Optional[SnapshotStore] = None,
+    root: Path = DEFAULT_PROJECT_ROOT,
+    cache_dir: Optional[Union[str, Path]] = KEYWORD_CACHE_DIR
+) -> DocumentFrequency:
+    """
+    Keyword corpus of our blog posts plus every stored snapshot.
+
+    Args:
+        store: Snapshot store (defaults to outputs/.snapshots if it exists)
+        root: Repository root
+        cache_dir: Document-frequency cache (None to always count from scratch)
+
+    Returns:
+        DocumentFrequency for analyze_competitor_page()
+    """
+    documents = blog_documents(root)
+    if store is not None:
+        documents += snapshot_documents(store)
+    elif (DEFAULT_SNAPSHOT_DIR / "index.sqlite3").exists():
+        with SnapshotStore() as default_store:
+            documents += snapshot_documents(default_store)
+    return load_document_frequency(documents, cache_dir)
+
+
+# Set in each pool worker by _init_worker (sent once per process, not per page)
+_document_frequency: Optional[DocumentFrequency] = None
+
+
+def _init_worker(document_frequency: Optional[DocumentFrequency]) -> None:
+    global _document_frequency
+    _document_frequency = document_frequency
+
+
+def analyze_saved_page(page: SavedPage) -> tuple[SavedPage, Union[CompetitorAnalysis, str]]:
+    """
+    Worker: parse one saved page into a CompetitorAnalysis.
+
+    Pages with a blob are read from the snapshot store; other pages are
+    written to page.store (when set) before parsing, so compression runs
+    in the pool too.
+
+    Args:
+        page: Saved page (contents dropped from the returned copy)
+
+    Returns:
+        Tuple of (page, analysis or error message); never raises
+    """
+    try:
+        if page.blob is not None:
+            buffer = open_blob(page.store, page.blob.digest, page.blob.codec)
+        else:
+            buffer = memoryview(page.data if page.data is not None else Path(page.path).read_bytes())
+            if page.store is not None:
+                page.blob = write_blob(page.store, buffer)
+        extract = extract_page_from_buffer(buffer, page.url)
+        url = page.url or extract.canonical or page.name
+        result: Union[CompetitorAnalysis, str] = analyze_competitor_page(url, extract, _document_frequency)
+    except Exception as error:
+        # Unreadable files, corrupt blobs, parser assertions on malformed markup:
+        # one bad page is a report.failed entry, never the end of the batch
+        result = f"{type(error).__name__}: {error}"
+    page.data = None
+    return page, result
+
+
+def _bounded_map(pool: Executor, fn: Callable, items: Iterable, window: int) -> Iterator:
+    # Executor.map submits the whole iterable up front; keep at most `window` pending
+    pending: deque = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _quantiles(values: list[float]) -> dict[str, float]:
+    values = sorted(values)
+    return {
+        f"p{p}": values[min(len(values) - 1, int(len(values) * p / 100))]
+        for p in (25, 50, 90)
+    }
+
+
+class _ClusterAccumulator:
+    def __init__(self, cluster: str, baseline: Optional[CompetitorAnalysis], document_frequency: Optional[DocumentFrequency]):
+        self.summary = ClusterSummary(cluster=cluster)
+        self.baseline = baseline
+        self.document_frequency = document_frequency
+        self.keywords: Counter = Counter()
+        self.metrics: dict[str, list[int]] = {f.name: [] for f in fields(ContentMetrics)}
+        self.schema_types: Counter = Counter()
+        self.serp_features: Counter = Counter()
+        self.headings: Counter = Counter()
+        self.opportunities: Counter = Counter()
+
+    def add(self, analysis: CompetitorAnalysis) -> None:
+        self.summary.pages += 1
+        for name, values in self.metrics.items():
+            values.append(getattr(analysis.content_metrics, name))
+        self.schema_types.update({t for t in analysis.schema_info.types if isinstance(t, str) and t})
+        self.serp_features.update(set(analysis.serp_features.estimated_serp_features))
+        self.headings.update({
+            line.strip()[4:].lower() for line in analysis.content_structure if line.strip().startswith("H2: ")
+        })
+        self.keywords.update(set(analysis.keywords_detected))
+        if self.baseline is not None:
+            self.opportunities.update(
+                item["type"] for item in generate_opportunities(
+                    analysis, self.baseline.content_metrics, self.baseline.schema_info
+                )
+            )
+
+    def finish(self) -> ClusterSummary:
+        summary, pages = self.summary, self.summary.pages
+        summary.metric_percentiles = {name: _quantiles(values) for name, values in self.metrics.items() if values}
+        summary.schema_share = {t: round(n / pages, 3) for t, n in self.schema_types.most_common()}
+        summary.serp_feature_share = {f: round(n / pages, 3) for f, n in self.serp_features.most_common()}
+        summary.common_headings = [(h, n) for h, n in self.headings.most_common(30) if n > 1]
+        summary.common_keywords = [(k, n) for k, n in self.keywords.most_common(30) if n > 1]
+        if self.document_frequency is not None:
+            summary.keyword_gaps = [
+                f'{n / pages:.0%} of competitors emphasize "{keyword}"; none of our pages mention it'
+                for keyword, n in summary.common_keywords
+                if n / pages >= KEYWORD_SHARE and not self.document_frequency.covered(keyword)
+            ]
+        summary.opportunity_counts = dict(self.opportunities.most_common())
+        summary.gaps = self._gaps()
+        return summary
+
+    def _gaps(self) -> list[str]:
+        summary, pages, baseline = self.summary, self.summary.pages, self.baseline
+        if baseline is None:
+            return []
+        gaps = []
+        for name, quantiles in summary.metric_percentiles.items():
+            ours = getattr(baseline.content_metrics, name)
+            if quantiles["p50"] and quantiles["p50"] > ours * METRIC_GAP_RATIO:
+                gaps.append(f"Median competitor {name.replace('_', ' ')} is {quantiles['p50']} vs our {ours}")
+        ours_types = set(baseline.schema_info.types)
+        gaps += [
+            f"{share:.0%} of competitors use {schema_type} schema; we don't"
+            for schema_type, share in summary.schema_share.items()
+            if share >= NORM_SHARE and schema_type not in ours_types
+        ]
+        ours_features = set(baseline.serp_features.estimated_serp_features)
+        gaps += [
+            f"{share:.0%} of competitors target {feature}; we don't"
+            for feature, share in summary.serp_feature_share.items()
+            if share >= NORM_SHARE and feature not in ours_features
+        ]
+        ours_headings = {line.strip()[4:].lower() for line in baseline.content_structure}
+        gaps += [
+            f'{n / pages:.0%} of competitors cover "{heading}"'
+            for heading, n in summary.common_headings
+            if n / pages >= HEADING_SHARE and heading not in ours_headings
+        ]
+        if baseline.keywords_detected:
+            shared = [keyword for keyword, n in summary.common_keywords if n / pages >= KEYWORD_SHARE]
+            gaps += [
+                f'Competitors emphasize "{keyword}"; our page does not'
+                for keyword in identify_keyword_gaps(shared, baseline.keywords_detected)
+            ]
+        return gaps
+
+
+def analyze_competitor_batch(
+    source: Union[str, Path, SnapshotStore],
+    output: Optional[Union[str, Path]] = None,
+    baseline: Optional[CompetitorAnalysis] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    snapshot_dir: Optional[Union[str, Path]] = DEFAULT_SNAPSHOT_DIR,
+    document_frequency: Optional[DocumentFrequency] = None
+) -> BatchReport:
+    """
+    Analyze every saved page of a directory or tar in a process pool.
+
+    Args:
+        source: Directory or tar archive of saved HTML pages, or a
+            SnapshotStore to re-analyze the stored competitor pages
+        output: JSONL file for the per-page analyses (defaults to
+            outputs/competitors/<source name>.jsonl)
+        baseline: Our page to compare against (analyze_competitor_page on
+            our rendered HTML, with the same document_frequency for keyword
+            gaps); enables gaps and opportunity counts
+        max_workers: Worker processes (defaults to CPU count)
+        progress: Called with the number of pages analyzed so far
+        snapshot_dir: Snapshot store to record directory / tar pages in
+            (None to not keep them)
+        document_frequency: Keyword corpus (defaults to
+            load_competitor_frequency() over the snapshot store in use)
+
+    Returns:
+        BatchReport with one ClusterSummary per topic cluster
+    """
+    store: Optional[SnapshotStore] = None
+    if isinstance(source, SnapshotStore):
+        output_name, pages = "snapshots", iter_snapshot_pages(source)
+    else:
+        source = Path(source)
+        output_name, pages = source.name.split(".")[0], iter_saved_pages(source)
+        if snapshot_dir is not None:
+            store = SnapshotStore(snapshot_dir)
+            pages = (replace(page, store=str(store.directory)) for page in pages)
+    if document_frequency is None:
+        # Pages recorded by this run join the corpus on the next one
+        corpus_store = source if isinstance(source, SnapshotStore) else store
+        document_frequency = load_competitor_frequency(corpus_store) if corpus_store else load_document_frequency(blog_documents())
+
+    output = Path(output) if output else DEFAULT_OUTPUT_DIR / f"{output_name}.jsonl"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = BatchReport(source=str(getattr(source, "directory", source)), output=str(output))
+    clusters: dict[str, _ClusterAccumulator] = {}
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(document_frequency,)) as pool, output.open("w", encoding="utf-8") as handle:
+        window = (max_workers or os.cpu_count() or 1) * IN_FLIGHT_PER_WORKER
+        for page, result in _bounded_map(pool, analyze_saved_page, pages, window):
+            if isinstance(result, str):
+                report.failed.append((page.name, result))
+                continue
+            if store is not None:
+                store.record(
+                    result.url, page.blob, collection=SNAPSHOT_COLLECTION + page.cluster, fetched_at=page.fetched_at
+                )
+            report.pages += 1
+            handle.write(json.dumps({"source": page.name, "cluster": page.cluster, **asdict(result)}, ensure_ascii=False) + "\n")
+            accumulator = clusters.get(page.cluster)
+            if accumulator is None:
+                accumulator = clusters[page.cluster] = _ClusterAccumulator(page.cluster, baseline, document_frequency)
+            accumulator.add(result)
+            if progress:
+                progress(report.pages)
+
+    if store is not None:
+        store.close()
+    report.clusters = {name: accumulator.finish() for name, accumulator in sorted(clusters.items())}
+    report.seconds = round(time.perf_counter() - started, 3)
+    return report
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Save competitor pages per topic cluster (one subdirectory each, optional
+manifest.json mapping file -> URL), then:
+
+```python
+from competitor_analyzer import analyze_competitor_page
+from competitor_batch import analyze_competitor_batch, load_competitor_frequency
+
+corpus = load_competitor_frequency()
+ours = analyze_competitor_page(
+    "https://tolearn.blog/blog/ai-agents-production-guide",
+    open(".next/server/app/blog/ai-agents-production-guide.html").read(),
+    corpus,
+)
+report = analyze_competitor_batch("competitors.tar.gz", baseline=ours, document_frequency=corpus)
+
+print(f"{report.pages} pages in {report.seconds}s -> {report.output}")
+for name, cluster in report.clusters.items():
+    print(f"## {name} ({cluster.pages} pages)")
+    print("words", cluster.metric_percentiles["word_count"])
+    for gap in cluster.gaps + cluster.keyword_gaps:
+        print("-", gap)
+```
+
+The JSONL file holds one CompetitorAnalysis per line (plus "source" and
+"cluster") for further slicing.
+
+Pages are also kept in outputs/.snapshots, so after tweaking the analyzer
+the benchmark re-runs without the original archive:
+
+```python
+from snapshot_store import SnapshotStore
+
+with SnapshotStore() as store:
+    report = analyze_competitor_batch(store, baseline=ours)
+```
+"""
@@ -0,0 +1,409 @@
+"""
+Crawl Logs Module for pSEO Engine
+
+This module measures how search and AI crawlers actually visit the site,
+from access-log exports:
+
+- Vercel log exports (JSON lines, with or without the `proxy` object) and
+  Apache/Nginx combined log format, plain or gzipped, mixed freely
+- lines are streamed one at a time; crawler hits on known routes go into
+  fixed arrays indexed by route, everything else into bounded counters
+  (Misra-Gries heavy hitters), so memory does not grow with the log size
+- known routes come from site_routes plus the sitemap and link graph, and
+  the report lists never-crawled pages (with whether they are in the
+  sitemap and how many internal links point at them) and crawl-frequency
+  percentiles
+
+Crawlers are identified by user-agent token only (no reverse-DNS check),
+so spoofed agents are counted too.
+
+Usage by Claude:
+- Trigger: "crawl logs", "how often does Googlebot crawl", "never crawled pages"
+- analyze_access_logs(["logs/2026-10.jsonl.gz"]) -> CrawlLogReport
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Union
+from urllib.parse import unquote, urlsplit
+import gzip
+import json
+import re
+
+from site_routes import DEFAULT_PROJECT_ROOT, iter_pseo_routes, iter_site_routes, normalize_path
+
+
+# User-agent token -> crawler name (first match wins)
+CRAWLER_TOKENS = (
+    ("Googlebot-Image", "Googlebot-Image"),
+    ("Googlebot", "Googlebot"),
+    ("Google-InspectionTool", "Googlebot"),
+    ("AdsBot-Google", "AdsBot-Google"),
+    ("Storebot-Google", "Googlebot"),
+    ("bingbot", "Bingbot"),
+    ("Applebot", "Applebot"),
+    ("DuckDuckBot", "DuckDuckBot"),
+    ("YandexBot", "YandexBot"),
+    ("Baiduspider", "Baiduspider"),
+    ("Slurp", "Slurp"),
+    ("GPTBot", "GPTBot"),
+    ("OAI-SearchBot", "OAI-SearchBot"),
+    ("ChatGPT-User", "ChatGPT-User"),
+    ("ClaudeBot", "ClaudeBot"),
+    ("Claude-User", "Claude-User"),
+    ("PerplexityBot", "PerplexityBot"),
+    ("AhrefsBot", "AhrefsBot"),
+    ("SemrushBot", "SemrushBot"),
+    ("DataForSeoBot", "DataForSeoBot"),
+    ("MJ12bot", "MJ12bot"),
+    ("DotBot", "DotBot"),
+)
+_CRAWLER_PATTERN = re.compile("|".join(re.escape(token) for token, _ in CRAWLER_TOKENS), re.I)
+_CRAWLER_NAMES = {token.lower(): name for token, name in CRAWLER_TOKENS}
+
+# 127.0.0.1 - - [10/Oct/2026:13:55:36 +0000] "GET /blog/x HTTP/1.1" 200 2326 "ref" "agent"
+_COMBINED_PATTERN = re.compile(
+    r'\S+ \S+ \S+ \[([^\]]+)\] "(\S+) (\S+)[^"]*" (\d{3}) \S+(?: "[^"]*" "([^"]*)")?'
+)
+_COMBINED_DAY = "%d/%b/%Y %z"
+
+# Paths that are never pages
+ASSET_PREFIXES = ("/_next/", "/api/", "/static/", "/_vercel/")
+ASSET_SUFFIXES = (".js", ".css", ".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif", ".svg", ".ico", ".woff2", ".map", ".json")
+
+DEFAULT_TOP_K = 500
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class LogHit:
+    """One parsed access-log line"""
+    path: str
+    status: int
+    user_agent: str
+    logged_time: Union[str, float, None] = None  # as written in the log
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """Epoch seconds (parsed on demand: only crawler hits need it)."""
+        return _epoch(self.logged_time)
+
+
+@dataclass
+class CrawlLogReport:
+    """Crawler activity joined with the site's routes"""
+    files: list[str] = field(default_factory=list)
+    lines: int = 0
+    unparsed: int = 0
+    crawler_hits: int = 0
+    asset_hits: int = 0
+    first_seen: Optional[str] = None
+    last_seen: Optional[str] = None
+    crawlers: dict[str, int] = field(default_factory=dict)  # name -> hits
+    statuses: dict[str, dict[int, int]] = field(default_factory=dict)  # crawler -> status -> hits
+    routes: int = 0
+    crawled_routes: int = 0
+    never_crawled: list[dict] = field(default_factory=list)  # {path, inSitemap, inboundLinks}
+    never_crawled_count: int = 0
+    pseo_routes: int = 0
+    pseo_crawled: int = 0
+    hit_percentiles: dict[str, float] = field(default_factory=dict)  # pNN -> hits per route
+    days_since_crawl_percentiles: dict[str, float] = field(default_factory=dict)  # over crawled routes
+    top_routes: list[tuple[str, int]] = field(default_factory=list)
+    top_unknown_paths: list[tuple[str, int]] = field(default_factory=list)  # crawled, not a known route
+    top_error_paths: list[tuple[str, int]] = field(default_factory=list)  # "status path"
+
+
+class HeavyHitters:
+    """
+    Misra-Gries frequent-items counter with at most k keys.
+
+    Any key seen more than n/(k+1) times is kept; counts are lower bounds
+    (under by at most n/(k+1)).
+
+    Args:
+        k: Maximum number of tracked keys
+    """
+
+    def __init__(self, k: int = DEFAULT_TOP_K):
+        self.k = k
+        self.counts: dict[str, int] = {}
+        self.total = 0
+
+    def add(self, key: str) -> None:
+        self.total += 1
+        if key in self.counts:
+            self.counts[key] += 1
+        elif len(self.counts) < self.k:
+            self.counts[key] = 1
+        else:
+            for other in list(self.counts):
+                if self.counts[other] == 1:
+                    del self.counts[other]
+                else:
+                    self.counts[other] -= 1
+
+    def top(self, n: int) -> list[tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+
+@lru_cache(maxsize=8192)
+def crawler_name(user_agent: str) -> Optional[str]:
+    """
+    Crawler behind a user-agent string.
+
+    Args:
+        user_agent: Raw User-Agent header
+
+    Returns:
+        Crawler name, or None for browsers and unknown agents
+    """
+    match = _CRAWLER_PATTERN.search(user_agent)
+    return _CRAWLER_NAMES[match.group(0).lower()] if match else None
+
+
+def _parse_json_line(line: str) -> Optional[LogHit]:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    proxy = record.get("proxy") or {}
+    path = proxy.get("path") or record.get("path") or record.get("requestPath")
+    status = proxy.get("statusCode") or record.get("statusCode") or record.get("status")
+    agent = proxy.get("userAgent") or record.get("userAgent") or record.get("user_agent") or ""
+    if isinstance(agent, list):
+        agent = " ".join(agent)
+    if not path or status is None:
+        return None
+    logged_time = proxy.get("timestamp") or record.get("timestamp")
+    return LogHit(path=path, status=int(status), user_agent=agent, logged_time=logged_time)
+
+
+@lru_cache(maxsize=1024)
+def _day_epoch(day: str, offset: str) -> float:
+    return datetime.strptime(f"{day} {offset}", _COMBINED_DAY).timestamp()
+
+
+def _epoch(value: Union[str, float, None]) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)  # Vercel logs milliseconds
+    if not isinstance(value, str):
+        return None
+    try:
+        if value[2:3] == "/":
+            # Combined format "10/Oct/2026:13:55:36 +0000": parse the day once, add the clock
+            hours, minutes, seconds = value[12:20].split(":")
+            return _day_epoch(value[:11], value[21:]) + int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def parse_log_line(line: str) -> Optional[LogHit]:
+    """
+    Parse a Vercel JSON log line or a combined-log-format line.
+
+    Args:
+        line: One log line
+
+    Returns:
+        LogHit, or None if the line is not a request
+    """
+    line = line.strip()
+    if line.startswith("{"):
+        return _parse_json_line(line)
+    match = _COMBINED_PATTERN.match(line)
+    if not match:
+        return None
+    return LogHit(path=match.group(3), status=int(match.group(4)), user_agent=match.group(5) or "", logged_time=match.group(1))
+
+
+def _open_log(path: Union[str, Path]) -> IO[str]:
+    with open(path, "rb") as probe:
+        gzipped = probe.read(2) == b"\x1f\x8b"
+    if gzipped:
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def iter_log_lines(paths: Iterable[Union[str, Path]]) -> Iterator[str]:
+    """
+    Stream lines from plain or gzipped log files (detected by magic bytes).
+
+    Args:
+        paths: Log files or directories of log files
+
+    Yields:
+        Lines in file order
+    """
+    for path in paths:
+        path = Path(path)
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for file in files:
+            with _open_log(file) as handle:
+                yield from handle
+
+
+@lru_cache(maxsize=65536)
+def _route_path(raw: str) -> str:
+    return normalize_path(unquote(urlsplit(raw).path) or "/")
+
+
+def _is_asset(path: str) -> bool:
+    return path.startswith(ASSET_PREFIXES) or path.lower().endswith(ASSET_SUFFIXES)
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    values = sorted(values)
+    return {
+        f"p{p}": round(values[min(len(values) - 1, int(len(values) * p / 100))], 2)
+        for p in PERCENTILES
+    }
+
+
+def analyze_access_logs(
+    paths: Iterable[Union[str, Path]],
+    root: Path = DEFAULT_PROJECT_ROOT,
+    sitemap_paths: Optional[Iterable[str]] = None,
+    links: Optional[dict[str, list[str]]] = None,
+    crawlers: Optional[set[str]] = None,
+    top_k: int = DEFAULT_TOP_K,
+    limit: Optional[int] = 200
+) -> CrawlLogReport:
+    """
+    Aggregate crawler hits per route and status and join them with the site's routes.
+
+    Args:
+        paths: Log files or directories (plain or gzipped)
+        root: Repository root (route sources)
+        sitemap_paths: Paths listed in the sitemap (default: every route source)
+        links: Link graph from a crawl, path -> outgoing paths
+        crawlers: Only count these crawler names (default: all known crawlers)
+        top_k: Keys kept by the bounded unknown/error path counters
+        limit: Maximum never-crawled pages listed
+
+    Returns:
+        CrawlLogReport
+    """
+    report = CrawlLogReport(files=[str(p) for p in paths])
+
+    # Known routes: route sources, sitemap and link graph share one index
+    index: dict[str, int] = {}
+    for entry in iter_site_routes(root):
+        index.setdefault(entry.path, len(index))
+    sitemap = set(index) if sitemap_paths is None else {_route_path(p) for p in sitemap_paths}
+    inbound_counts: dict[str, int] = {}
+    for source, targets in (links or {}).items():
+        for path in (source, *targets):
+            index.setdefault(path, len(index))
+        for target in set(targets):
+            if target != source:
+                inbound_counts[target] = inbound_counts.get(target, 0) + 1
+    for path in sitemap:
+        index.setdefault(path, len(index))
+    paths_by_index = list(index)
+
+    hits = array("I", bytes(4 * len(index)))
+    last_seen = array("d", bytes(8 * len(index)))
+    unknown = HeavyHitters(top_k)
+    errors = HeavyHitters(top_k)
+    first = last = None
+
+    for line in iter_log_lines(report.files):
+        report.lines += 1
+        hit = parse_log_line(line)
+        if hit is None:
+            report.unparsed += 1
+            continue
+        name = crawler_name(hit.user_agent)
+        if name is None or (crawlers is not None and name not in crawlers):
+            continue
+        report.crawler_hits += 1
+        report.crawlers[name] = report.crawlers.get(name, 0) + 1
+        by_status = report.statuses.setdefault(name, {})
+        by_status[hit.status] = by_status.get(hit.status, 0) + 1
+        timestamp = hit.timestamp
+        if timestamp is not None:
+            first = timestamp if first is None else min(first, timestamp)
+            last = timestamp if last is None else max(last, timestamp)
+
+        path = _route_path(hit.path)
+        if _is_asset(path):
+            report.asset_hits += 1
+            continue
+        if hit.status >= 400:
+            errors.add(f"{hit.status} {path}")
+        route = index.get(path)
+        if route is None:
+            unknown.add(path)
+            continue
+        hits[route] += 1
+        if timestamp is not None and timestamp > last_seen[route]:
+            last_seen[route] = timestamp
+
+    if first is not None:
+        report.first_seen = datetime.fromtimestamp(first).isoformat(timespec="seconds")
+        report.last_seen = datetime.fromtimestamp(last).isoformat(timespec="seconds")
+
+    report.routes = len(index)
+    report.crawled_routes = sum(1 for count in hits if count)
+    never = [i for i, count in enumerate(hits) if not count]
+    report.never_crawled_count = len(never)
+    # Sitemap pages with the most inbound links first: the least excusable gaps
+    never.sort(key=lambda i: (paths_by_index[i] not in sitemap, -inbound_counts.get(paths_by_index[i], 0), paths_by_index[i]))
+    report.never_crawled = [
+        {
+            "path": paths_by_index[i],
+            "inSitemap": paths_by_index[i] in sitemap,
+            "inboundLinks": inbound_counts.get(paths_by_index[i], 0),
+        }
+        for i in (never[:limit] if limit else never)
+    ]
+
+    pseo = {entry.path for entry in iter_pseo_routes(root)}
+    report.pseo_routes = len(pseo)
+    report.pseo_crawled = sum(1 for path in pseo if path in index and hits[index[path]])
+
+    report.hit_percentiles = _percentiles(list(hits))
+    if last is not None:
+        report.days_since_crawl_percentiles = _percentiles(
+            [(last - seen) / 86400 for seen in last_seen if seen]
+        )
+    ranked = sorted(range(len(hits)), key=lambda i: -hits[i])[:20]
+    report.top_routes = [(paths_by_index[i], hits[i]) for i in ranked if hits[i]]
+    report.top_unknown_paths = unknown.top(20)
+    report.top_error_paths = errors.top(20)
+    return report
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Export logs (Vercel: `vercel logs` / log drain JSON; Nginx/Apache combined
+format works too), then:
+
+```python
+from crawl_logs import analyze_access_logs
+
+report = analyze_access_logs(["logs/"], crawlers={"Googlebot", "Bingbot"})
+
+print(f"{report.crawler_hits} crawler hits {report.first_seen} .. {report.last_seen}", report.crawlers)
+print(f"{report.crawled_routes}/{report.routes} routes crawled, "
+      f"{report.pseo_crawled}/{report.pseo_routes} pSEO pages")
+print("hits per route", report.hit_percentiles)
+print("days since last crawl", report.days_since_crawl_percentiles)
+for page in report.never_crawled[:20]:
+    print("NEVER", page["path"], "sitemap" if page["inSitemap"] else "", page["inboundLinks"], "links")
+```
+
+Pass `links=link_graph_from_pages(snapshot.pages.values())` (robots_rules)
+to rank never-crawled pages by internal links. Pages in the sitemap that
+were never crawled usually need more internal links; crawled unknown
+paths (`top_unknown_paths`) are stale URLs worth redirecting.
+"""
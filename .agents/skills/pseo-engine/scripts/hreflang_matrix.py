@@ -0,0 +1,217 @@
+"""
+Hreflang Matrix Module for pSEO Engine
+
+This module validates hreflang alternates across all six locales at once.
+Every audited page becomes a row and every language tag (en-US, zh-CN,
+de-DE, fr-FR, th-TH, pt-BR, x-default) a column; each cell holds the row
+index of the declared alternate. The checks then run column by column
+over compact integer arrays:
+
+- self-reference: the page lists itself under its own language
+- x-default: present, and equal to the default-locale alternate
+- language match: an alternate under zh-CN really is a /zh page
+- target health: the alternate is an audited 200 page
+- reciprocity: if A lists B, B lists A under A's language
+
+Memory is one array('i') per column, so every pSEO page × locale fits.
+
+Usage by Claude:
+- Trigger: "seo audit" (Hreflang Tags), "check hreflang"
+- validate_hreflang(pages) -> HreflangReport
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+from page_facts import PageFacts
+from site_routes import DEFAULT_LOCALE, LOCALE_LANGUAGE_TAGS, LOCALES, normalize_path, strip_locale
+
+
+X_DEFAULT = "x-default"
+COLUMNS = tuple(LOCALE_LANGUAGE_TAGS[locale] for locale in LOCALES) + (X_DEFAULT,)
+X_DEFAULT_COLUMN = len(COLUMNS) - 1
+DEFAULT_COLUMN = LOCALES.index(DEFAULT_LOCALE)
+
+# Accept both "zh-CN" and bare "zh" (any case) for a locale's column
+_COLUMN_ALIASES = {
+    **{tag.lower(): index for index, tag in enumerate(COLUMNS)},
+    **{locale: index for index, locale in enumerate(LOCALES)},
+}
+
+MISSING = -1
+
+
+@dataclass
+class HreflangReport:
+    """Per-page hreflang problems from one matrix pass"""
+    pages: int = 0
+    alternates: int = 0
+    problems: dict[str, list[str]] = field(default_factory=dict)  # page -> issues
+    issue_counts: dict[str, int] = field(default_factory=dict)  # issue type -> pages
+    non_reciprocal: list[tuple[str, str, str]] = field(default_factory=list)  # (page, tag, target)
+    _counted: set[tuple[str, str]] = field(default_factory=set, repr=False)  # (kind, page) already counted
+
+    def add(self, page: str, kind: str, message: str) -> None:
+        self.problems.setdefault(page, []).append(message)
+        if (kind, page) not in self._counted:
+            self._counted.add((kind, page))
+            self.issue_counts[kind] = self.issue_counts.get(kind, 0) + 1
+
+
+class HreflangMatrix:
+    """
+    Page × language-tag matrix of declared alternates.
+
+    Args:
+        pages: Audited pages with their hreflang maps
+    """
+
+    def __init__(self, pages: Iterable[PageFacts]):
+        self.paths: list[str] = []
+        self.index: dict[str, int] = {}
+        self.status = array("i")
+        self.is_row = bytearray()
+        self.own = array("b")  # column of each node's own locale
+        self.cells = [array("i") for _ in COLUMNS]
+        self.unknown_tags: dict[str, list[str]] = {}
+
+        pages = list(pages)
+        rows = [page for page in pages if page.hreflang]
+        for page in rows:
+            self.is_row[self._node(page.path)] = 1
+        for page in rows:
+            row = self.index[page.path]
+            for tag, href in page.hreflang.items():
+                column = _COLUMN_ALIASES.get(tag.lower())
+                if column is None:
+                    self.unknown_tags.setdefault(page.path, []).append(tag)
+                    continue
+                self.cells[column][row] = self._node(normalize_path(urlsplit(href).path))
+
+        # Status of every audited node, including alternate targets without hreflang
+        for page in pages:
+            node = self.index.get(page.path)
+            if node is not None:
+                self.status[node] = page.status
+
+    def _node(self, path: str) -> int:
+        node = self.index.get(path)
+        if node is None:
+            node = len(self.paths)
+            self.index[path] = node
+            self.paths.append(path)
+            self.status.append(0)  # 0 = not audited
+            self.is_row.append(0)
+            self.own.append(LOCALES.index(strip_locale(path)[0]))
+            for column in self.cells:
+                column.append(MISSING)
+        return node
+
+
+def validate_hreflang(pages: Iterable[PageFacts]) -> HreflangReport:
+    """
+    Check self-reference, x-default, language match, target health and reciprocity.
+
+    Args:
+        pages: Every audited page (pages without hreflang only contribute
+            their status as alternate targets)
+
+    Returns:
+        HreflangReport
+    """
+    matrix = HreflangMatrix(pages)
+    report = HreflangReport(pages=sum(matrix.is_row))
+    paths, own, status, is_row, cells = matrix.paths, matrix.own, matrix.status, matrix.is_row, matrix.cells
+    rows = [node for node in range(len(paths)) if is_row[node]]
+
+    for path, tags in matrix.unknown_tags.items():
+        report.add(path, "unknown-tag", f"unknown hreflang values: {', '.join(sorted(tags))}")
+
+    # Self-reference under the page's own language
+    for node in rows:
+        if cells[own[node]][node] != node:
+            report.add(paths[node], "no-self-reference", f"no self-referencing {COLUMNS[own[node]]} alternate")
+
+    # x-default present and aligned with the default locale
+    x_default, default = cells[X_DEFAULT_COLUMN], cells[DEFAULT_COLUMN]
+    for node in rows:
+        if x_default[node] == MISSING:
+            report.add(paths[node], "no-x-default", "no x-default alternate")
+        elif default[node] != MISSING and x_default[node] != default[node]:
+            report.add(paths[node], "x-default-mismatch",
+                       f"x-default {paths[x_default[node]]} differs from {COLUMNS[DEFAULT_COLUMN]} {paths[default[node]]}")
+
+    # Column-wise: language match, target health, reciprocity
+    for column_index, column in enumerate(cells[:X_DEFAULT_COLUMN]):
+        tag = COLUMNS[column_index]
+        for node in rows:
+            target = column[node]
+            if target == MISSING:
+                continue
+            report.alternates += 1
+            if own[target] != column_index:
+                report.add(paths[node], "language-mismatch", f"{tag} alternate {paths[target]} is not a {LOCALES[column_index]} page")
+                continue
+            if target == node:
+                continue
+            if status[target] and status[target] != 200:
+                report.add(paths[node], "bad-target", f"{tag} alternate {paths[target]} returns {status[target]}")
+                continue
+            if not is_row[target]:
+                if not status[target]:
+                    report.add(paths[node], "unaudited-target", f"{tag} alternate {paths[target]} was not audited")
+                else:
+                    report.add(paths[node], "non-reciprocal", f"{tag} alternate {paths[target]} declares no hreflang")
+                    report.non_reciprocal.append((paths[node], tag, paths[target]))
+                continue
+            if cells[own[node]][target] != node:
+                back = cells[own[node]][target]
+                pointed = paths[back] if back != MISSING else "nothing"
+                report.add(paths[node], "non-reciprocal",
+                           f"{tag} alternate {paths[target]} points its {COLUMNS[own[node]]} at {pointed}")
+                report.non_reciprocal.append((paths[node], tag, paths[target]))
+
+    return report
+
+
+def summarize_problems(report: HreflangReport, limit: Optional[int] = None) -> dict[str, list[str]]:
+    """
+    Problems per page, worst pages first.
+
+    Args:
+        report: Validation result
+        limit: Maximum number of pages
+
+    Returns:
+        Ordered dict of page -> issues
+    """
+    ranked = sorted(report.problems.items(), key=lambda item: (-len(item[1]), item[0]))
+    return dict(ranked[:limit] if limit else ranked)
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+On the pages of a crawl or a build audit:
+
+```python
+from hreflang_matrix import summarize_problems, validate_hreflang
+from site_crawler import crawl_site
+import asyncio
+
+snapshot, _ = asyncio.run(crawl_site("http://localhost:3000"))
+report = validate_hreflang(snapshot.pages.values())
+
+print(f"{report.pages} pages, {report.alternates} alternates", report.issue_counts)
+for page, issues in summarize_problems(report, limit=20).items():
+    print(page)
+    for issue in issues:
+        print("   ", issue)
+```
+
+Fixes usually belong in app/lib/i18n-paths.js (getLocalizedAlternates)
+or app/lib/blog-i18n.js (article alternates for untranslated posts).
+"""
@@ -0,0 +1,223 @@
+"""
+HTTP Cache Module for pSEO Engine
+
+This module gives the audit crawler a persistent HTTP cache so repeat
+audits only transfer what changed:
+
+- every 200 response with an ETag or Last-Modified is stored
+- the next fetch of that URL is a conditional GET (If-None-Match /
+  If-Modified-Since); a 304 is answered from the cache
+- bodies are stored zlib-compressed and content-addressed (SHA-256), so
+  identical bodies served under several URLs are stored once
+- the URL index is a small SQLite table next to the bodies
+
+Usage by Claude:
+- Not triggered directly; site_crawler.crawl_site() uses it by default
+- HTTPCache(path) / cache.stats() / cache.prune()
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "outputs" / ".http_cache"
+COMPRESSION_LEVEL = 6
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body_hash TEXT NOT NULL,
+    body_size INTEGER NOT NULL,
+    stored_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Response headers kept with a cached entry (the rest are per-response)
+STORED_HEADERS = ("content-type", "content-encoding", "etag", "last-modified", "cache-control", "x-robots-tag")
+
+
+@dataclass
+class CachedResponse:
+    """A stored response ready to replay"""
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache session"""
+    revalidated: int = 0  # 304s answered from the cache
+    stored: int = 0
+    bytes_saved: int = 0  # body bytes not transferred thanks to 304s
+
+
+class HTTPCache:
+    """
+    Validator-based HTTP cache with compressed, content-addressed bodies.
+
+    Args:
+        directory: Cache directory (index.sqlite3 plus bodies/)
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+        self.bodies = self.directory / "bodies"
+        self.bodies.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.directory / "index.sqlite3"))
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+        self.session = CacheStats()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "HTTPCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _body_path(self, digest: str) -> Path:
+        return self.bodies / digest[:2] / f"{digest}.z"
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Validators to send with a GET for url.
+
+        Args:
+            url: Absolute URL
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if not cached)
+        """
+        row = self.conn.execute("SELECT etag, last_modified FROM entries WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return {}
+        headers = {}
+        if row[0]:
+            headers["If-None-Match"] = row[0]
+        if row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def load(self, url: str) -> Optional[CachedResponse]:
+        """
+        Replay the stored response for url.
+
+        Args:
+            url: Absolute URL
+
+        Returns:
+            CachedResponse, or None if missing or the body file is gone
+        """
+        row = self.conn.execute(
+            "SELECT status, headers, body_hash, body_size FROM entries WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            body = zlib.decompress(self._body_path(row[2]).read_bytes())
+        except (OSError, zlib.error):
+            self.conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            self.conn.commit()
+            return None
+        self.session.revalidated += 1
+        self.session.bytes_saved += row[3]
+        return CachedResponse(url=url, status=row[0], headers=json.loads(row[1]), body=body)
+
+    def store(self, url: str, status: int, headers: dict[str, str], body: bytes) -> bool:
+        """
+        Store a response if it carries a validator.
+
+        Args:
+            url: Absolute URL
+            status: HTTP status (only 200 is stored)
+            headers: Lowercase response headers
+            body: Decoded body
+
+        Returns:
+            True if stored
+        """
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if status != 200 or not (etag or last_modified) or "no-store" in headers.get("cache-control", ""):
+            return False
+
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._body_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(".tmp")
+            temporary.write_bytes(zlib.compress(body, COMPRESSION_LEVEL))
+            temporary.replace(path)
+
+        # content-encoding is kept for the compression checks; the stored body is decoded
+        kept = {name: headers[name] for name in STORED_HEADERS if name in headers}
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, status, etag, last_modified, json.dumps(kept), digest, len(body), time.time()),
+        )
+        self.conn.commit()
+        self.session.stored += 1
+        return True
+
+    def prune(self) -> int:
+        """
+        Delete body files no entry references.
+
+        Returns:
+            Number of files removed
+        """
+        referenced = {row[0] for row in self.conn.execute("SELECT DISTINCT body_hash FROM entries")}
+        removed = 0
+        for path in self.bodies.glob("*/*.z"):
+            if path.stem not in referenced:
+                path.unlink()
+                removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        """Entry count, distinct bodies and compressed bytes on disk."""
+        entries, bodies, raw = self.conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT body_hash), COALESCE(SUM(body_size), 0) FROM entries"
+        ).fetchone()
+        stored = sum(path.stat().st_size for path in self.bodies.glob("*/*.z"))
+        return {"entries": entries, "bodies": bodies, "raw_bytes": raw, "stored_bytes": stored}
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Repeat audits are incremental automatically:
+
+```python
+import asyncio
+from site_crawler import audit_site
+
+report, stats = asyncio.run(audit_site("http://localhost:3000"))
+print(f"{stats.requests} requests, {stats.revalidated} answered by 304, "
+      f"{stats.bytes_received / 1e6:.1f} MB transferred")
+```
+
+Disable with `audit_site(url, cache_dir=None)`; inspect or clean up with:
+
+```python
+from http_cache import HTTPCache
+
+with HTTPCache() as cache:
+    print(cache.stats())
+    cache.prune()
+```
+"""
@@ -0,0 +1,348 @@
+"""
+Keyword Extractor Module for pSEO Engine
+
+This module finds the phrases a page emphasizes relative to a background
+corpus, so competitor keywords no longer have to be listed by hand:
+
+- text is split into sentence-like segments and 1-3 word phrases that
+  neither start nor end with a stopword
+- a document-frequency table counts, per phrase, how many corpus
+  documents contain it; the corpus is our blog posts plus stored
+  snapshots (competitor_batch.load_competitor_frequency())
+- a page's phrases are ranked by (1 + log tf) × idf, with singular and
+  plural forms counted together; a phrase scoring close to its parts
+  replaces them, otherwise phrases inside (or containing) a better-ranked
+  phrase are dropped
+- the table is cached on disk and extended incrementally: only documents
+  not counted before are read
+
+The table also remembers which phrases occur in our own documents, so a
+phrase competitors emphasize can be checked against everything we have
+published.
+
+Usage by Claude:
+- Not triggered directly; competitor_analyzer.analyze_competitor_page()
+  fills keywords_detected with it and competitor_batch reports keyword
+  gaps per cluster
+- extract_keywords(text, document_frequency) -> list[str]
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+import math
+import pickle
+import re
+
+from site_routes import DEFAULT_PROJECT_ROOT, iter_blog_posts, read_mdx
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "outputs" / ".keyword_cache"
+CACHE_FILE = "document_frequency.pickle"
+
+# Bump when tokenization or the table layout changes so stale caches are rebuilt
+CACHE_VERSION = 1
+
+MAX_NGRAM = 3
+DEFAULT_TOP_K = 15
+MIN_PHRASE_COUNT = 2  # multi-word phrases must repeat to count as emphasized
+PHRASE_MARGIN = 0.6  # a phrase scoring at least this share of each part it contains ranks in their place
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before
+being below between both but by can could did do does doing down during each even few for
+from further get gets got had has have having he her here hers him his how however i if in
+into is it its itself just let like make makes many may me might more most much must my new
+no nor not now of off often on once one only or other our ours out over own per really same
+she should since so some such than that the their theirs them then there these they this
+those through to too two under until up us use used uses using very via want was way we well
+were what when where which while who whom why will with within without would yet you your
+yours
+""".split())
+
+_SEGMENT_BREAK = re.compile(r"[.!?;:,]+(?:\s|$)|[()\[\]{}\"“”|/\n\t]+|\s[-–—]+\s")
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#']*(?:[.-][a-z0-9+#]+)*")
+
+# MDX constructs that are not prose
+_MDX_NOISE = (
+    (re.compile(r"```[\s\S]*?```|~~~[\s\S]*?~~~"), "\n"),
+    (re.compile(r"^\s*(?:import|export)\s.*$", re.MULTILINE), ""),
+    (re.compile(r"!\[[^\]]*\]\([^)]*\)"), ""),
+    (re.compile(r"\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"`[^`\n]*`"), ""),
+    (re.compile(r"<[^>]+>"), "\n"),
+    (re.compile(r"https?://\S+"), ""),
+    (re.compile(r"^\s*[#>*+-]+\s*", re.MULTILINE), "\n"),
+)
+
+
+def mdx_to_text(body: str) -> str:
+    """Strip code, JSX, link targets and markdown markers from an MDX body."""
+    for pattern, replacement in _MDX_NOISE:
+        body = pattern.sub(replacement, body)
+    return body
+
+
+def iter_phrases(text: str, max_n: int = MAX_NGRAM) -> Iterator[str]:
+    """
+    Candidate phrases of a text, in order of appearance.
+
+    Args:
+        text: Plain text (any case)
+        max_n: Longest phrase in words
+
+    Yields:
+        Lowercase 1..max_n word phrases that do not cross punctuation,
+        do not start or end with a stopword or number, and do not start
+        and end with the same word
+    """
+    for segment in _SEGMENT_BREAK.split(text.lower()):
+        tokens = _TOKEN.findall(segment)
+        edges = [token not in STOPWORDS and not token.isdigit() and len(token) > 1 for token in tokens]
+        for start, token in enumerate(tokens):
+            if not edges[start]:
+                continue
+            if len(token) > 2:
+                yield token
+            for end in range(start + 1, min(start + max_n, len(tokens))):
+                if edges[end] and tokens[end] != token:
+                    yield " ".join(tokens[start:end + 1])
+
+
+@dataclass
+class CorpusDocument:
+    """A background document, read only if the table has not counted it"""
+    key: str  # changes whenever the content does (path + mtime, snapshot digest)
+    load: Callable[[], str]
+    own: bool = False  # published by us
+
+
+@dataclass
+class DocumentFrequency:
+    """Per-phrase document counts of a background corpus"""
+    documents: int = 0
+    counts: Counter = field(default_factory=Counter)  # phrase -> documents containing it
+    own_counts: Counter = field(default_factory=Counter)  # same, over our own documents
+    sources: dict[str, bool] = field(default_factory=dict)  # counted key -> own
+    max_n: int = MAX_NGRAM
+    version: int = CACHE_VERSION
+
+    def add(self, document: CorpusDocument) -> bool:
+        """Count a document unless its key was counted before; True if added."""
+        if document.key in self.sources:
+            return False
+        phrases = set(iter_phrases(document.load(), self.max_n))
+        self.counts.update(phrases)
+        if document.own:
+            self.own_counts.update(phrases)
+        self.sources[document.key] = document.own
+        self.documents += 1
+        return True
+
+    def idf(self, phrase: str) -> float:
+        """Smoothed inverse document frequency (phrases never seen score highest)."""
+        return math.log((1 + self.documents) / (1 + self.counts.get(phrase, 0))) + 1
+
+    def covered(self, phrase: str) -> bool:
+        """Whether any of our own documents contains the phrase."""
+        return self.own_counts.get(phrase, 0) > 0
+
+
+def blog_documents(root: Path = DEFAULT_PROJECT_ROOT) -> list[CorpusDocument]:
+    """
+    Our English source posts as corpus documents.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        One CorpusDocument per post (title, description and prose)
+    """
+    documents = []
+    for post in iter_blog_posts(root):
+        stat = post.source_path.stat()
+        documents.append(CorpusDocument(
+            key=f"post:{post.slug}:{stat.st_mtime_ns}:{stat.st_size}",
+            load=partial(_post_text, post.source_path),
+            own=True,
+        ))
+    return documents
+
+
+def _post_text(path: Path) -> str:
+    metadata, body = read_mdx(path)
+    return "\n".join([metadata.get("title", ""), metadata.get("description", ""), mdx_to_text(body)])
+
+
+def load_document_frequency(
+    documents: Iterable[CorpusDocument],
+    cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR
+) -> DocumentFrequency:
+    """
+    Document-frequency table over documents, reusing the cached counts.
+
+    Documents already counted are not read again. Counted snapshots that
+    are no longer listed stay in the table (an old version of a page
+    barely moves the statistics); if one of our own documents changed or
+    disappeared, the table is rebuilt.
+
+    Args:
+        documents: Corpus documents (blog_documents() plus any extras)
+        cache_dir: On-disk cache directory (None disables the cache)
+
+    Returns:
+        DocumentFrequency
+    """
+    documents = list(documents)
+    cache_file = Path(cache_dir) / CACHE_FILE if cache_dir else None
+    table = None
+    if cache_file and cache_file.exists():
+        try:
+            with cache_file.open("rb") as handle:
+                table = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            table = None
+
+    listed = {document.key for document in documents}
+    if (
+        not isinstance(table, DocumentFrequency)
+        or table.version != CACHE_VERSION
+        or any(own and key not in listed for key, own in table.sources.items())
+    ):
+        table = DocumentFrequency()
+
+    added = sum(table.add(document) for document in documents)
+    if cache_file and added:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with tmp_file.open("wb") as handle:
+            pickle.dump(table, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+    return table
+
+
+def singular_key(phrase: str) -> str:
+    """The phrase with its last word reduced to a naive singular ("vector databases" -> "vector database")."""
+    head, _, word = phrase.rpartition(" ")
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif word.endswith(("sses", "shes", "ches", "xes")):
+        word = word[:-2]
+    elif len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    return f"{head} {word}" if head else word
+
+
+def score_phrases(text: str, document_frequency: DocumentFrequency) -> list[tuple[str, float]]:
+    """
+    TF-IDF of every candidate phrase of a text.
+
+    Singular and plural forms are one phrase: their counts are added and
+    the idf is that of the form most corpus documents use, so merging
+    never makes a phrase look rarer than it is.
+
+    Args:
+        text: Page text
+        document_frequency: Background corpus
+
+    Returns:
+        (phrase, score) pairs, best first; each phrase in the form the
+        text uses most
+    """
+    forms: dict[str, Counter] = {}
+    for phrase, count in Counter(iter_phrases(text, document_frequency.max_n)).items():
+        forms.setdefault(singular_key(phrase), Counter())[phrase] = count
+
+    scored = []
+    for variants in forms.values():
+        phrase = variants.most_common(1)[0][0]
+        count = sum(variants.values())
+        if count < MIN_PHRASE_COUNT and " " in phrase:
+            continue
+        idf = min(document_frequency.idf(variant) for variant in variants)
+        scored.append((phrase, (1 + math.log(count)) * idf))
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored
+
+
+def _parts(phrase: str) -> Iterator[str]:
+    words = phrase.split()
+    for size in range(1, len(words)):
+        for start in range(len(words) - size + 1):
+            yield " ".join(words[start:start + size])
+
+
+def extract_keywords(text: str, document_frequency: DocumentFrequency, top_k: int = DEFAULT_TOP_K) -> list[str]:
+    """
+    The phrases a text emphasizes relative to the corpus.
+
+    A single word always counts at least as often as the phrases
+    containing it, so on raw scores it outranks them. A phrase that
+    scores at least PHRASE_MARGIN of each of its parts therefore takes
+    the rank of its best part ("vector database" in place of "vector").
+
+    Args:
+        text: Page text (PageExtract.text, or prose from mdx_to_text())
+        document_frequency: Background corpus
+        top_k: Phrases to return
+
+    Returns:
+        Up to top_k phrases, most distinctive first; a phrase is skipped
+        when it overlaps one already chosen ("agent" after "ai agent")
+    """
+    scored = score_phrases(text, document_frequency)
+    scores = {singular_key(phrase): score for phrase, score in scored}
+    ranked = []
+    for phrase, score in scored:
+        parts = [scores[key] for key in map(singular_key, _parts(phrase)) if key in scores]
+        if parts and all(score >= PHRASE_MARGIN * part for part in parts):
+            score = max(score, *parts)
+        ranked.append((phrase, score))
+    ranked.sort(key=lambda item: (-item[1], -item[0].count(" "), item[0]))
+
+    chosen: list[str] = []
+    padded: list[str] = []
+    for phrase, _ in ranked:
+        candidate = f" {singular_key(phrase)} "
+        if any(candidate in other or other in candidate for other in padded):
+            continue
+        chosen.append(phrase)
+        padded.append(candidate)
+        if len(chosen) == top_k:
+            break
+    return chosen
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Keywords of one competitor page, against our blog corpus and every stored
+snapshot:
+
+```python
+from competitor_analyzer import analyze_competitor_page
+from competitor_batch import load_competitor_frequency
+
+corpus = load_competitor_frequency()
+analysis = analyze_competitor_page(url, html, corpus)
+print(analysis.keywords_detected)
+print([k for k in analysis.keywords_detected if not corpus.covered(k)])  # nothing of ours mentions these
+```
+
+Against our posts only (the shared cache also holds counted snapshots,
+so bypass it):
+
+```python
+from keyword_extractor import blog_documents, extract_keywords, load_document_frequency
+
+corpus = load_document_frequency(blog_documents(), cache_dir=None)
+print(extract_keywords(page_text, corpus, top_k=20))
+```
+
+competitor_batch.analyze_competitor_batch() does this for every page and
+lists per cluster the phrases competitors share that none of our pages
+cover (ClusterSummary.keyword_gaps).
+"""
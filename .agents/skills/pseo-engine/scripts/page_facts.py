@@ -0,0 +1,378 @@
+"""
+Page Facts Module for pSEO Engine
+
+This module extracts the SEO-relevant facts of one HTML page (title, meta
+tags, canonical, hreflang alternates, JSON-LD, links, images, scripts) in a
+single html.parser pass. The parser is incremental: bytes can be fed as
+they arrive from a socket or file, so whole documents never need to be
+held in memory.
+
+The resulting PageFacts are the common input of the crawler
+(site_crawler.py) and the technical checks in technical_seo_audit.py.
+
+Usage by Claude:
+- Not triggered directly; used by "seo audit"
+- extract_page_facts(path, html) / extract_page_facts_from_file(path, file) -> PageFacts
+"""
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urljoin, urlsplit
+import codecs
+import hashlib
+import json
+import re
+
+from site_routes import BASE_URL
+
+
+# Text inside these elements is not page content
+NON_CONTENT_TAGS = {"script", "style", "noscript", "template", "svg"}
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Links to these are assets or endpoints, not pages
+NON_PAGE_PREFIXES = ("/_next/", "/api/", "/static/")
+NON_PAGE_SUFFIXES = (
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico",
+    ".css", ".js", ".map", ".json", ".xml", ".txt", ".pdf", ".zip", ".gz",
+    ".woff", ".woff2", ".ttf", ".mp4", ".webm", ".mp3",
+)
+
+
+@dataclass
+class ImageFacts:
+    """One <img> element"""
+    src: str
+    alt: Optional[str] = None
+    loading: Optional[str] = None
+    has_srcset: bool = False
+    has_dimensions: bool = False
+
+
+@dataclass
+class PageFacts:
+    """SEO-relevant facts of one fetched or built page"""
+    path: str
+    status: int = 200
+    location: Optional[str] = None  # redirect target for 3xx
+    response_ms: Optional[float] = None  # None when not fetched over HTTP
+    content_type: str = ""
+    content_encoding: Optional[str] = None  # None when unknown (offline build)
+    title: Optional[str] = None
+    meta_description: Optional[str] = None
+    meta_robots: Optional[str] = None
+    canonical: Optional[str] = None
+    og_image: Optional[str] = None
+    og_url: Optional[str] = None
+    viewport: Optional[str] = None
+    lang: Optional[str] = None
+    hreflang: dict[str, str] = field(default_factory=dict)  # hreflang -> href
+    jsonld: list = field(default_factory=list)  # parsed JSON-LD blocks
+    jsonld_errors: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)  # internal page paths, document order
+    external_links: int = 0
+    images: list[ImageFacts] = field(default_factory=list)
+    h1_count: int = 0
+    has_preconnect: bool = False
+    has_touch_icon: bool = False
+    has_font_preload: bool = False
+    blocking_scripts: list[str] = field(default_factory=list)  # <head> scripts without async/defer
+    content_hash: Optional[str] = None  # digest of the visible <body> text
+
+    @property
+    def is_html(self) -> bool:
+        return "html" in self.content_type or (not self.content_type and self.status == 200)
+
+    @property
+    def is_indexable(self) -> bool:
+        return self.status == 200 and "noindex" not in (self.meta_robots or "").lower()
+
+    @property
+    def schema_types(self) -> set[str]:
+        types: set[str] = set()
+        for block in self.jsonld:
+            _collect_types(block, types)
+        return types
+
+
+def _collect_types(node, types: set[str]) -> None:
+    if isinstance(node, list):
+        for item in node:
+            _collect_types(item, types)
+    elif isinstance(node, dict):
+        declared = node.get("@type")
+        if isinstance(declared, str):
+            types.add(declared)
+        elif isinstance(declared, list):
+            types.update(t for t in declared if isinstance(t, str))
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                _collect_types(value, types)
+
+
+def normalize_page_path(href: str, page_url: str, hosts: tuple[str, ...]) -> Optional[str]:
+    """
+    Resolve a link to an internal page path.
+
+    Args:
+        href: Raw href attribute
+        page_url: Absolute URL of the page containing the link
+        hosts: Hostnames treated as internal
+
+    Returns:
+        Path without query/fragment or trailing slash, or None if the link
+        is external, not http(s), or points at an asset
+    """
+    href = href.strip()
+    if not href or href.startswith(("#", "mailto:", "tel:", "javascript:", "data:")):
+        return None
+
+    parts = urlsplit(urljoin(page_url, href))
+    if parts.scheme not in ("http", "https") or parts.hostname not in hosts:
+        return None
+
+    path = parts.path or "/"
+    if path.startswith(NON_PAGE_PREFIXES) or path.lower().endswith(NON_PAGE_SUFFIXES):
+        return None
+    return path.rstrip("/") or "/"
+
+
+class PageFactsParser(HTMLParser):
+    """
+    Incremental extractor: call feed() with str chunks, then close().
+
+    Args:
+        facts: PageFacts to fill in
+        page_url: Absolute URL the page was served from (for relative links)
+        hosts: Hostnames treated as internal
+    """
+
+    def __init__(self, facts: PageFacts, page_url: str, hosts: tuple[str, ...]):
+        super().__init__(convert_charrefs=True)
+        self.facts = facts
+        self.page_url = page_url
+        self.hosts = hosts
+        self._in_head = False
+        self._in_title = False
+        self._title_parts: list[str] = []
+        self._jsonld_parts: Optional[list[str]] = None
+        self._seen_links: set[str] = set()
+        self._in_body = False
+        self._skip_depth = 0
+        self._text_hash = hashlib.blake2b(digest_size=16)
+        self._pending_space = False
+        self._has_text = False
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        a = {name: (value if value is not None else "") for name, value in attrs}
+        facts = self.facts
+        if tag in NON_CONTENT_TAGS:
+            self._skip_depth += 1
+
+        if tag == "html":
+            facts.lang = a.get("lang") or facts.lang
+        elif tag == "head":
+            self._in_head = True
+        elif tag == "body":
+            self._in_head = False
+            self._in_body = True
+        elif tag == "title" and facts.title is None:
+            self._in_title = True
+        elif tag == "h1":
+            facts.h1_count += 1
+        elif tag == "meta":
+            self._meta(a)
+        elif tag == "link":
+            self._link(a)
+        elif tag == "a" and "href" in a:
+            path = normalize_page_path(a["href"], self.page_url, self.hosts)
+            if path is None:
+                if a["href"].startswith(("http://", "https://")):
+                    facts.external_links += 1
+            elif path not in self._seen_links:
+                self._seen_links.add(path)
+                facts.links.append(path)
+        elif tag == "img":
+            facts.images.append(ImageFacts(
+                src=a.get("src", ""),
+                alt=a.get("alt"),
+                loading=a.get("loading"),
+                has_srcset="srcset" in a,
+                has_dimensions="width" in a and "height" in a,
+            ))
+        elif tag == "script":
+            if a.get("type") == "application/ld+json":
+                self._jsonld_parts = []
+            elif self._in_head and a.get("src") and not (
+                "async" in a or "defer" in a or a.get("type") == "module"
+            ):
+                facts.blocking_scripts.append(a["src"])
+
+    def _meta(self, a: dict) -> None:
+        facts = self.facts
+        name = (a.get("name") or a.get("property") or "").lower()
+        content = a.get("content", "")
+        if name == "description":
+            facts.meta_description = content
+        elif name == "robots":
+            facts.meta_robots = content
+        elif name == "viewport":
+            facts.viewport = content
+        elif name == "og:image" and facts.og_image is None:
+            facts.og_image = content
+        elif name == "og:url":
+            facts.og_url = content
+
+    def _link(self, a: dict) -> None:
+        facts = self.facts
+        rel = set((a.get("rel") or "").lower().split())
+        href = a.get("href", "")
+        if "canonical" in rel:
+            facts.canonical = urljoin(self.page_url, href)
+        if "alternate" in rel and a.get("hreflang"):
+            facts.hreflang[a["hreflang"]] = urljoin(self.page_url, href)
+        if "preconnect" in rel or "dns-prefetch" in rel:
+            facts.has_preconnect = True
+        if "apple-touch-icon" in rel:
+            facts.has_touch_icon = True
+        if "preload" in rel and a.get("as") == "font":
+            facts.has_font_preload = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in NON_CONTENT_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.facts.title = "".join(self._title_parts).strip()
+        elif tag == "script" and self._jsonld_parts is not None:
+            raw = "".join(self._jsonld_parts).strip()
+            self._jsonld_parts = None
+            try:
+                self.facts.jsonld.append(json.loads(raw))
+            except ValueError as error:
+                self.facts.jsonld_errors.append(f"Script {len(self.facts.jsonld) + len(self.facts.jsonld_errors) + 1}: {error}")
+        elif tag == "head":
+            self._in_head = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self._title_parts.append(data)
+        elif self._jsonld_parts is not None:
+            self._jsonld_parts.append(data)
+        elif self._in_body and not self._skip_depth:
+            # Collapse whitespace (also across chunk boundaries) and drop it at
+            # the edges, so the digest only changes when the visible text does
+            text = _WHITESPACE.sub(" ", data)
+            core = text.strip(" ")
+            if core:
+                if self._has_text and (self._pending_space or text.startswith(" ")):
+                    self._text_hash.update(b" ")
+                self._text_hash.update(core.encode("utf-8"))
+                self._has_text = True
+                self._pending_space = text.endswith(" ")
+            elif text:
+                self._pending_space = True
+
+    def close(self) -> None:
+        super().close()
+        self.facts.content_hash = self._text_hash.hexdigest() if self._has_text else None
+
+
+def internal_hosts(base_url: str) -> tuple[str, ...]:
+    """
+    Hostnames whose links count as internal when auditing base_url.
+
+    Includes the production host (BASE_URL) so absolute links to the live
+    site are followed on a local build too.
+
+    Args:
+        base_url: Origin being audited
+
+    Returns:
+        Tuple of hostnames
+    """
+    hosts = {urlsplit(base_url).hostname, urlsplit(BASE_URL).hostname}
+    production = urlsplit(BASE_URL).hostname or ""
+    if production.startswith("www."):
+        hosts.add(production[4:])
+    else:
+        hosts.add(f"www.{production}")
+    return tuple(h for h in hosts if h)
+
+
+def extract_page_facts(
+    path: str,
+    html: Union[bytes, memoryview],
+    base_url: str = BASE_URL,
+    hosts: Optional[tuple[str, ...]] = None,
+    chunk_size: int = 1 << 16
+) -> PageFacts:
+    """
+    Parse one page into PageFacts.
+
+    Args:
+        path: Route of the page, e.g. "/blog/my-post"
+        html: Raw HTML bytes or memoryview (decoded as UTF-8, chunk by chunk)
+        base_url: Origin the page was served from
+        hosts: Internal hostnames (defaults to internal_hosts(base_url))
+        chunk_size: Bytes per parser feed
+
+    Returns:
+        PageFacts with the parse results (status fields left at defaults)
+    """
+    view = memoryview(html)
+    chunks = (view[offset:offset + chunk_size] for offset in range(0, len(view), chunk_size))
+    return _parse_chunks(path, chunks, base_url, hosts)
+
+
+def extract_page_facts_from_file(
+    path: str,
+    file_path: Union[str, Path],
+    base_url: str = BASE_URL,
+    hosts: Optional[tuple[str, ...]] = None,
+    chunk_size: int = 1 << 16
+) -> PageFacts:
+    """
+    Parse an HTML file into PageFacts, reading it chunk by chunk.
+
+    Args:
+        path: Route of the page
+        file_path: HTML file on disk
+        base_url: Origin the page will be served from
+        hosts: Internal hostnames (defaults to internal_hosts(base_url))
+        chunk_size: Bytes per read
+
+    Returns:
+        PageFacts with the parse results
+    """
+    with open(file_path, "rb") as handle:
+        return _parse_chunks(path, iter(lambda: handle.read(chunk_size), b""), base_url, hosts)
+
+
+def _parse_chunks(path: str, chunks, base_url: str, hosts: Optional[tuple[str, ...]]) -> PageFacts:
+    facts = PageFacts(path=path, content_type="text/html")
+    parser = PageFactsParser(facts, urljoin(base_url, path), hosts or internal_hosts(base_url))
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return facts
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Usually indirectly, through site_crawler.py. To inspect one page:
+
+```python
+from page_facts import extract_page_facts
+
+facts = extract_page_facts("/blog/my-post", html_bytes, base_url="http://localhost:3000")
+facts.title, facts.canonical, facts.schema_types, facts.links[:10]
+```
+"""
@@ -9,15 +9,22 @@ Usage by Claude:
 - Creates/updates pseo_data.json
 - Generates template pages
 - Updates sitemap
+- Emits a changed-route manifest for incremental rebuilds
+- Precomputes FAQPage/BreadcrumbList JSON-LD per page
 - Verifies build
 """
 
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional
+import hashlib
 import json
 
+from site_routes import BASE_URL
 
-@dataclass
+
+@dataclass(slots=True)
 class Technology:
     """Technology definition for pSEO"""
     slug: str
@@ -29,7 +36,7 @@ class Technology:
     icon: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """Developer role definition for pSEO"""
     slug: str
@@ -40,7 +47,7 @@ class Role:
     goals: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Feature:
     """Feature definition for pSEO"""
     slug: str
@@ -57,6 +64,36 @@ class PSEOData:
     roles: list[Role] = field(default_factory=list)
     features: list[Feature] = field(default_factory=list)
     templates: dict = field(default_factory=dict)
+    faqs: dict = field(default_factory=dict)
+
+
+@dataclass
+class RouteManifest:
+    """Routes that changed between two pSEO generation runs"""
+    generated_at: str
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged_count: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def revalidate(self) -> list[str]:
+        """Routes that need to be rebuilt or revalidated (removed routes included)"""
+        return sorted(self.added + self.changed + self.removed)
+
+
+DEFAULT_PSEO_DATA_PATH = "data/pseo_data.json"
+
+# Where the previous run's page hashes and the latest manifest are kept
+DEFAULT_PAGE_HASHES_PATH = "data/pseo_page_hashes.json"
+DEFAULT_ROUTE_MANIFEST_PATH = "data/pseo_route_manifest.json"
+
+# Precomputed FAQPage/BreadcrumbList JSON-LD, one file per shard
+DEFAULT_JSONLD_DIR = "data/pseo-jsonld"
 
 
 # Default technologies for the portfolio starter kit
@@ -187,13 +224,63 @@ DEFAULT_FEATURES = [
 ]
 
 
-def generate_pseo_data() -> dict:
+# Default page templates and FAQ patterns (used when a catalog doesn't define its own)
+DEFAULT_TEMPLATES = {
+    "techRole": {
+        "titlePattern": "{tech} Portfolio Template for {role}s | Build Your Developer Portfolio",
+        "descriptionPattern": "Create a stunning {role} portfolio powered by {tech}. Features: {features}. Start building your professional presence today.",
+        "h1Pattern": "Best {tech} Portfolio Template for {role}s"
+    },
+    "feature": {
+        "titlePattern": "{feature} Portfolio Template | Modern Developer Portfolio",
+        "descriptionPattern": "Build a portfolio with {feature}. {benefits}. Perfect for developers who want a professional online presence.",
+        "h1Pattern": "Portfolio Template with {feature}"
+    }
+}
+
+DEFAULT_FAQS = {
+    "techRole": [
+        {
+            "questionPattern": "Why use {tech} for a {role} portfolio?",
+            "answerPattern": "{tech} is perfect for {role}s because it offers {features}. This makes it ideal for showcasing your work professionally."
+        },
+        {
+            "questionPattern": "Is this template suitable for {role}s?",
+            "answerPattern": "Absolutely! This template is designed with {role}s in mind, addressing challenges like {challenges} and helping you achieve {goals}."
+        },
+        {
+            "questionPattern": "How do I customize this {tech} template?",
+            "answerPattern": "The template is fully customizable. You can modify colors, layouts, and content using {tech}'s component system and Tailwind CSS utilities."
+        }
+    ],
+    "feature": [
+        {
+            "questionPattern": "How does {feature} work in this template?",
+            "answerPattern": "{technicalDetails}"
+        },
+        {
+            "questionPattern": "What are the benefits of {feature}?",
+            "answerPattern": "{feature} provides: {benefits}."
+        }
+    ]
+}
+
+
+def generate_pseo_data(catalog: Optional[PSEOData] = None) -> dict:
     """
     Generate the complete pSEO data structure.
 
+    Args:
+        catalog: Catalog to render (see catalog_loader.load_catalog);
+            defaults to the DEFAULT_* lists in this module
+
     Returns:
         Dictionary ready to be saved as JSON
     """
+    technologies = catalog.technologies if catalog else DEFAULT_TECHNOLOGIES
+    roles = catalog.roles if catalog else DEFAULT_ROLES
+    features = catalog.features if catalog else DEFAULT_FEATURES
+
     data = {
         "technologies": [
             {
@@ -205,7 +292,7 @@ def generate_pseo_data() -> dict:
                 "relatedPosts": t.related_posts,
                 "icon": t.icon
             }
-            for t in DEFAULT_TECHNOLOGIES
+            for t in technologies
         ],
         "roles": [
             {
@@ -216,7 +303,7 @@ def generate_pseo_data() -> dict:
                 "challenges": r.challenges,
                 "goals": r.goals
             }
-            for r in DEFAULT_ROLES
+            for r in roles
         ],
         "features": [
             {
@@ -226,51 +313,39 @@ def generate_pseo_data() -> dict:
                 "benefits": f.benefits,
                 "technicalDetails": f.technical_details
             }
-            for f in DEFAULT_FEATURES
+            for f in features
         ],
-        "templates": {
-            "techRole": {
-                "titlePattern": "{tech} Portfolio Template for {role}s | Build Your Developer Portfolio",
-                "descriptionPattern": "Create a stunning {role} portfolio powered by {tech}. Features: {features}. Start building your professional presence today.",
-                "h1Pattern": "Best {tech} Portfolio Template for {role}s"
-            },
-            "feature": {
-                "titlePattern": "{feature} Portfolio Template | Modern Developer Portfolio",
-                "descriptionPattern": "Build a portfolio with {feature}. {benefits}. Perfect for developers who want a professional online presence.",
-                "h1Pattern": "Portfolio Template with {feature}"
-            }
-        },
-        "faqs": {
-            "techRole": [
-                {
-                    "questionPattern": "Why use {tech} for a {role} portfolio?",
-                    "answerPattern": "{tech} is perfect for {role}s because it offers {features}. This makes it ideal for showcasing your work professionally."
-                },
-                {
-                    "questionPattern": "Is this template suitable for {role}s?",
-                    "answerPattern": "Absolutely! This template is designed with {role}s in mind, addressing challenges like {challenges} and helping you achieve {goals}."
-                },
-                {
-                    "questionPattern": "How do I customize this {tech} template?",
-                    "answerPattern": "The template is fully customizable. You can modify colors, layouts, and content using {tech}'s component system and Tailwind CSS utilities."
-                }
-            ],
-            "feature": [
-                {
-                    "questionPattern": "How does {feature} work in this template?",
-                    "answerPattern": "{technicalDetails}"
-                },
-                {
-                    "questionPattern": "What are the benefits of {feature}?",
-                    "answerPattern": "{feature} provides: {benefits}."
-                }
-            ]
-        }
+        "templates": catalog.templates if catalog and catalog.templates else DEFAULT_TEMPLATES,
+        "faqs": catalog.faqs if catalog and catalog.faqs else DEFAULT_FAQS
     }
 
     return data
 
 
+def write_pseo_data(data: dict, path: str = DEFAULT_PSEO_DATA_PATH, minify: bool = False) -> int:
+    """
+    Write pSEO data as JSON.
+
+    Args:
+        data: Dictionary as returned by generate_pseo_data()
+        path: Output file
+        minify: Drop indentation and spaces (for a copy that is only bundled)
+
+    Returns:
+        Number of bytes written
+    """
+    if minify:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False)
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    encoded = (payload + "\n").encode("utf-8")
+    with open(path, "wb") as handle:
+        handle.write(encoded)
+    return len(encoded)
+
+
 def generate_static_params_code(technologies: list, roles: list) -> str:
     """
     Generate TypeScript code for generateStaticParams.
@@ -328,6 +403,433 @@ def calculate_total_pages(technologies: list, roles: list, features: list) -> di
     }
 
 
+def fill_pattern(pattern: str, values: dict) -> str:
+    """
+    Substitute {placeholders} in a template pattern.
+
+    Matches the `.replace()` chains used by the TSX templates: values are
+    applied in order, each replaces only the first occurrence of its
+    placeholder, and unknown placeholders are left untouched.
+
+    Args:
+        pattern: Pattern string from pseo_data.json
+        values: Placeholder name -> replacement text, in the TSX chain's order
+
+    Returns:
+        Filled string
+    """
+    result = pattern
+    for key, value in values.items():
+        result = result.replace("{" + key + "}", value, 1)
+    return result
+
+
+def template_page_description(tech: dict, role: dict) -> str:
+    """
+    The meta description of a /templates/[tech]/[role] page.
+
+    Exact port of buildTemplateDescription() in
+    app/templates/[tech]/[role]/page.tsx (techRole.descriptionPattern is
+    not rendered); keep the two in sync.
+
+    Args:
+        tech: Technology record from pseo_data.json
+        role: Role record from pseo_data.json
+
+    Returns:
+        Description string
+    """
+    goals = " and ".join(role.get("goals", [])[:2]).lower()
+    challenges = " and ".join(role.get("challenges", [])[:2])
+    features = ", ".join(tech.get("features", [])[:2])
+    return (
+        f"A {tech['name']} portfolio template for {role['name']}s who need to {goals}, "
+        f"address {challenges}, and frame their work around {features}."
+    )
+
+
+def feature_page_description(feature: dict) -> str:
+    """
+    The meta description of a /solutions/[feature] page.
+
+    Exact port of buildFeatureDescription() in
+    app/solutions/[feature]/page.tsx (feature.descriptionPattern is not
+    rendered); keep the two in sync.
+
+    Args:
+        feature: Feature record from pseo_data.json
+
+    Returns:
+        Description string
+    """
+    benefits = ", ".join(feature.get("benefits", [])[:3])
+    return (
+        f"{feature['name']} templates for developers who care about {benefits} "
+        "and want a portfolio system that can support those outcomes in production."
+    )
+
+
+def template_page_faqs(tech: dict, role: dict) -> list[dict]:
+    """
+    The FAQs a /templates/[tech]/[role] page renders.
+
+    Exact port of generateFAQs() in app/templates/[tech]/[role]/page.tsx
+    (the faqs.techRole patterns in pseo_data.json are not rendered);
+    keep the two in sync.
+
+    Args:
+        tech: Technology record from pseo_data.json
+        role: Role record from pseo_data.json
+
+    Returns:
+        List of {"question", "answer"} dictionaries
+    """
+    features = ", ".join(tech.get("features", [])[:3])
+    goals = " and ".join(role.get("goals", [])[:2])
+    keywords = ", ".join(role.get("keywords", [])[:3])
+    return [
+        {
+            "question": f"Why use {tech['name']} for a {role['name']} portfolio?",
+            "answer": f"{tech['name']} fits {role['name']}s well because it supports {features} "
+                      f"and maps cleanly to goals like {goals}.",
+        },
+        {
+            "question": f"What does this {tech['name']} template emphasize?",
+            "answer": f"It emphasizes {keywords} while keeping the portfolio easy to adapt for a "
+                      "specific hiring story.",
+        },
+        {
+            "question": "Can this template be customized heavily?",
+            "answer": "Yes. The structure is intended to be customized for content, styling, layout, "
+                      "and feature emphasis without changing the core publishing flow.",
+        },
+    ]
+
+
+def feature_page_faqs(feature: dict) -> list[dict]:
+    """
+    The FAQs a /solutions/[feature] page renders.
+
+    Exact port of generateFAQs() in app/solutions/[feature]/page.tsx (the
+    faqs.feature patterns are not rendered); keep the two in sync.
+
+    Args:
+        feature: Feature record from pseo_data.json
+
+    Returns:
+        List of {"question", "answer"} dictionaries
+    """
+    return [
+        {
+            "question": f"How is {feature['name']} implemented?",
+            "answer": feature.get("technicalDetails", ""),
+        },
+        {
+            "question": f"Why does {feature['name']} matter?",
+            "answer": f"{feature['name']} improves the portfolio through {', '.join(feature.get('benefits', []))}.",
+        },
+        {
+            "question": f"Can the {feature['name']} behavior be adjusted?",
+            "answer": "Yes. The implementation is meant to be customized to fit the brand, preferences, "
+                      "and content structure of the site.",
+        },
+    ]
+
+
+def render_page_set(data: dict) -> dict[str, dict]:
+    """
+    Render every pSEO page from a pseo_data.json structure.
+
+    Each page carries the title (from titlePattern), the description and
+    h1 the TSX page builds, the FAQs the page renders and every pseo_data record the TSX page reads: its own
+    records plus the cross-linked ones (a template page lists three other
+    technologies and roles; a solution page counts and lists the other
+    features and resolves its starter templates against all technologies
+    and roles). Any data change that alters a rendered page therefore
+    changes that page's content hash.
+
+    Args:
+        data: Dictionary as returned by generate_pseo_data()
+
+    Returns:
+        Dictionary mapping route -> rendered page
+    """
+    templates = data.get("templates", {})
+    tech_role = templates.get("techRole", {})
+    feature_template = templates.get("feature", {})
+    technologies = data.get("technologies", [])
+    roles = data.get("roles", [])
+    features = data.get("features", [])
+
+    pages = {}
+
+    for tech in technologies:
+        # otherTechs / otherRoles in app/templates/[tech]/[role]/page.tsx
+        other_techs = [item for item in technologies if item["slug"] != tech["slug"]][:3]
+        for role in roles:
+            route = f"/templates/{tech['slug']}/{role['slug']}"
+            pages[route] = {
+                "title": fill_pattern(tech_role.get("titlePattern", ""), {"tech": tech["name"], "role": role["name"]}),
+                "description": template_page_description(tech, role),
+                "h1": f"Best {tech['name']} portfolio template for {role['name']}s",
+                "faqs": template_page_faqs(tech, role),
+                "source": {
+                    "technology": tech,
+                    "role": role,
+                    "otherTechnologies": other_techs,
+                    "otherRoles": [item for item in roles if item["slug"] != role["slug"]][:3],
+                },
+            }
+
+    for feature in features:
+        route = f"/solutions/{feature['slug']}"
+        pages[route] = {
+            "title": fill_pattern(feature_template.get("titlePattern", ""), {"feature": feature["name"]}),
+            "description": feature_page_description(feature),
+            "h1": f"Portfolio template with {feature['name']}",
+            "faqs": feature_page_faqs(feature),
+            "source": {
+                "feature": feature,
+                "otherFeatures": [item for item in features if item["slug"] != feature["slug"]],
+                "technologies": technologies,
+                "roles": roles,
+            },
+        }
+
+    return pages
+
+
+def page_content_hash(page: dict) -> str:
+    """
+    Hash a rendered page in a key-order independent way.
+
+    Args:
+        page: Rendered page from render_page_set()
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(page, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_page_hashes(path: str = DEFAULT_PAGE_HASHES_PATH) -> dict[str, dict]:
+    """
+    Load the page hashes recorded by the previous run.
+
+    Args:
+        path: Hash state file
+
+    Returns:
+        Dictionary mapping route -> {"hash": ..., "lastmod": ...};
+        empty if no previous run exists
+    """
+    state_file = Path(path)
+    if not state_file.exists():
+        return {}
+    with state_file.open("r", encoding="utf-8") as handle:
+        return json.load(handle).get("pages", {})
+
+
+def diff_page_hashes(
+    previous: dict[str, dict],
+    pages: dict[str, dict],
+    generated_at: Optional[str] = None
+) -> tuple[RouteManifest, dict[str, dict]]:
+    """
+    Compare the current page set against the previous run's hashes.
+
+    Unchanged pages keep their previous lastmod so downstream consumers
+    (sitemap, ISR) only see a new timestamp when the content really moved.
+
+    Args:
+        previous: Hash state from load_page_hashes()
+        pages: Rendered pages from render_page_set()
+        generated_at: ISO timestamp for this run (defaults to now)
+
+    Returns:
+        Tuple of (manifest, new hash state)
+    """
+    generated_at = generated_at or datetime.now(timezone.utc).isoformat()
+    manifest = RouteManifest(generated_at=generated_at)
+    state = {}
+
+    for route in sorted(pages):
+        digest = page_content_hash(pages[route])
+        before = previous.get(route)
+
+        if before is None:
+            manifest.added.append(route)
+            state[route] = {"hash": digest, "lastmod": generated_at}
+        elif before.get("hash") != digest:
+            manifest.changed.append(route)
+            state[route] = {"hash": digest, "lastmod": generated_at}
+        else:
+            manifest.unchanged_count += 1
+            state[route] = {"hash": digest, "lastmod": before.get("lastmod", generated_at)}
+
+    manifest.removed = sorted(route for route in previous if route not in pages)
+    return manifest, state
+
+
+def write_incremental_outputs(
+    data: dict,
+    hashes_path: str = DEFAULT_PAGE_HASHES_PATH,
+    manifest_path: str = DEFAULT_ROUTE_MANIFEST_PATH
+) -> RouteManifest:
+    """
+    Diff the pSEO page set against the last run and persist the results.
+
+    Writes the changed-route manifest for revalidation and replaces the
+    hash state so the next run diffs against this one.
+
+    Args:
+        data: Dictionary as returned by generate_pseo_data()
+        hashes_path: Hash state file
+        manifest_path: Manifest output file
+
+    Returns:
+        The route manifest for this run
+    """
+    manifest, state = diff_page_hashes(load_page_hashes(hashes_path), render_page_set(data))
+
+    for path, payload in (
+        (manifest_path, {
+            "generatedAt": manifest.generated_at,
+            "added": manifest.added,
+            "changed": manifest.changed,
+            "removed": manifest.removed,
+            "unchangedCount": manifest.unchanged_count,
+            "revalidate": manifest.revalidate,
+        }),
+        (hashes_path, {"generatedAt": manifest.generated_at, "pages": state}),
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, ensure_ascii=False)
+            handle.write("\n")
+
+    return manifest
+
+
+def build_page_jsonld(route: str, page: dict, base_url: str = BASE_URL) -> list[dict]:
+    """
+    Build the BreadcrumbList and FAQPage schemas for one rendered page.
+
+    Mirrors generateBreadcrumbSchema() in app/lib/schemas.ts and the
+    faqSchema the template/solution pages build from generateFAQs()
+    (ported as template_page_faqs() / feature_page_faqs()), so the
+    FAQPage matches the questions the page shows.
+
+    Args:
+        route: Page route (e.g. /templates/nextjs/frontend-developer)
+        page: Rendered page from render_page_set()
+        base_url: Site origin
+
+    Returns:
+        List of schema dictionaries
+    """
+    source = page["source"]
+    if "feature" in source:
+        trail = [
+            ("Home", base_url),
+            ("Solutions", f"{base_url}/solutions"),
+            (source["feature"]["name"], f"{base_url}{route}"),
+        ]
+    else:
+        trail = [
+            ("Home", base_url),
+            ("Templates", f"{base_url}/templates"),
+            (f"{source['technology']['name']} for {source['role']['name']}s", f"{base_url}{route}"),
+        ]
+
+    schemas = [{
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": position, "name": name, "item": url}
+            for position, (name, url) in enumerate(trail, 1)
+        ],
+    }]
+
+    if page["faqs"]:
+        schemas.append({
+            "@context": "https://schema.org",
+            "@type": "FAQPage",
+            "mainEntity": [
+                {
+                    "@type": "Question",
+                    "name": faq["question"],
+                    "acceptedAnswer": {"@type": "Answer", "text": faq["answer"]},
+                }
+                for faq in page["faqs"]
+            ],
+        })
+
+    return schemas
+
+
+def serialize_jsonld(schemas: list[dict]) -> str:
+    """
+    Serialize schemas for direct use in a <script type="application/ld+json">.
+
+    `</` is escaped so content can never close the script element early.
+    """
+    return json.dumps(schemas, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+
+
+def jsonld_shard_key(route: str) -> str:
+    """Shard name for a route: one shard per technology, one for solutions."""
+    parts = route.strip("/").split("/")
+    return f"templates-{parts[1]}" if parts[0] == "templates" else parts[0]
+
+
+def write_jsonld_shards(
+    data: dict,
+    output_dir: str = DEFAULT_JSONLD_DIR,
+    base_url: str = BASE_URL
+) -> dict[str, list[str]]:
+    """
+    Precompute JSON-LD for every pSEO page and write it as per-shard files.
+
+    Each shard maps route -> serialized JSON-LD string, so a page imports
+    its shard and embeds the string as-is instead of assembling schema
+    objects during the build. Shards whose content is unchanged are not
+    rewritten, keeping file mtimes stable for incremental builds.
+
+    Args:
+        data: Dictionary as returned by generate_pseo_data()
+        output_dir: Directory for shard files
+        base_url: Site origin
+
+    Returns:
+        Dictionary mapping shard file name -> routes it contains
+    """
+    shards: dict[str, dict[str, str]] = {}
+    for route, page in render_page_set(data).items():
+        shards.setdefault(jsonld_shard_key(route), {})[route] = serialize_jsonld(
+            build_page_jsonld(route, page, base_url)
+        )
+
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    index = {}
+
+    for key, entries in sorted(shards.items()):
+        filename = f"{key}.json"
+        payload = (json.dumps(entries, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
+        target = directory / filename
+        if not target.exists() or target.read_bytes() != payload:
+            target.write_bytes(payload)
+        index[filename] = sorted(entries)
+
+    for stale in directory.glob("*.json"):
+        if stale.name not in index:
+            stale.unlink()
+
+    return index
+
+
 # Usage documentation for Claude
 USAGE_EXAMPLE = """
 ## How Claude Should Use This Module
@@ -384,10 +886,8 @@ export async function generateMetadata({ params }: Props) {
 
   return {
     title,
-    description: pseoData.templates.techRole.descriptionPattern
-      .replace('{tech}', technology.name)
-      .replace('{role}', roleData.name)
-      .replace('{features}', technology.features.slice(0, 3).join(', ')),
+    // render_page_set() hashes this text via template_page_description(); change both together
+    description: buildTemplateDescription(technology, roleData),
   }
 }
 
@@ -426,7 +926,39 @@ const solutionRoutes = pseoData.features.map(feature => ({
 }))
 ```
 
-### Step 5: Verify Build
+### Step 5: Emit Changed-Route Manifest
+
+```python
+from pseo_generator import generate_pseo_data, write_incremental_outputs
+
+manifest = write_incremental_outputs(generate_pseo_data())
+```
+
+This renders every page, hashes it, and diffs against `data/pseo_page_hashes.json`
+from the previous run. `data/pseo_route_manifest.json` lists the `added`,
+`changed` and `removed` routes; pass `revalidate` to `revalidatePath()` or an
+on-demand ISR hook instead of rebuilding every template page. If
+`manifest.has_changes` is false, skip the rebuild entirely.
+
+### Step 6: Precompute JSON-LD
+
+```python
+from pseo_generator import write_jsonld_shards
+write_jsonld_shards(data)
+```
+
+Writes `data/pseo-jsonld/templates-{tech}.json` and `data/pseo-jsonld/solutions.json`,
+each mapping route -> serialized `[BreadcrumbList, FAQPage]`. The FAQPage is
+built from template_page_faqs() / feature_page_faqs(), ports of the pages'
+generateFAQs(); change both together so the schema matches the visible FAQs.
+Pages embed the string directly instead of building schema objects:
+
+```tsx
+const shard = (await import(`@/data/pseo-jsonld/templates-${params.tech}.json`)).default
+<script type="application/ld+json" dangerouslySetInnerHTML={{ __html: shard[`/templates/${params.tech}/${params.role}`] }} />
+```
+
+### Step 7: Verify Build
 
 Run `npm run build` to verify all pages generate correctly.
 
@@ -451,6 +983,10 @@ Run `npm run build` to verify all pages generate correctly.
 ### Sitemap Updated
 - Added 30 new URLs to sitemap.xml
 
+### Changed Routes
+- Added: 0 / Changed: 5 / Removed: 0 / Unchanged: 25
+- Revalidate: /templates/nextjs/backend-developer, ...
+
 ### Build Status
 - [x] Build successful
 - [x] All pages generated
@@ -0,0 +1,714 @@
+"""
+Redirect Analyzer Module for pSEO Engine
+
+This module builds the site's redirect graph from configuration instead of
+probing URLs over HTTP:
+
+- vercel.json: `redirects` and `rewrites` (path-to-regexp sources, host
+  conditions), plus the implicit `cleanUrls` and `trailingSlash` redirects
+  and Vercel's HTTP -> HTTPS upgrade
+- next.config.js: `redirects()` / `rewrites()` entries
+- middleware.ts: the blogRedirects map, legacy post patterns, block
+  patterns, tag/category slug normalization and the locale fallbacks
+  (rule tables are read from the source; the control flow is ported)
+
+URLs are resolved hop by hop with a shared memo, so resolving every
+sitemap URL and its common variants (www, http, trailing slash, .html)
+is a single pass. Chains of more than one path-changing hop and cycles
+are reported; scheme and host canonicalization (http://www ->
+https://www -> https://) is expected and does not make a chain.
+
+Usage by Claude:
+- Trigger: "seo audit" (Redirect Chain Analysis), "check redirects"
+- analyze_redirects(sitemap_urls=...) -> RedirectAnalysis
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlsplit, urlunsplit
+import json
+import re
+
+from site_routes import (
+    BASE_URL,
+    DEFAULT_LOCALE,
+    DEFAULT_PROJECT_ROOT,
+    LOCALES,
+    localize_path,
+    normalize_path,
+    slugify,
+    strip_locale,
+)
+
+
+VERCEL_CONFIG = "vercel.json"
+NEXT_CONFIG = "next.config.js"
+MIDDLEWARE = "middleware.ts"
+I18N_PATHS = "app/lib/i18n-paths.js"
+TRANSLATION_MANIFEST = "app/lib/blog-translation-manifest.js"
+
+MAX_HOPS = 20
+
+# Prefixes/names middleware.ts leaves alone (shouldSkipMiddleware)
+MIDDLEWARE_SKIP_PREFIXES = (
+    "/_next/", "/api/", "/static/", "/favicon", "/robots", "/sitemap",
+    "/manifest", "/ads.txt", "/llms.txt",
+)
+
+_PARAM_PATTERN = re.compile(r":(\w+)(\([^)]*\))?([*+?])?|\(([^)]*)\)")
+
+
+@dataclass
+class RedirectRule:
+    """One configured redirect or rewrite"""
+    origin: str  # config file the rule came from
+    source: str  # rule source as written
+    destination: str
+    status: int  # 0 for rewrites
+    reason: str
+    pattern: Optional[re.Pattern] = None
+    host: Optional[str] = None
+
+    @property
+    def is_rewrite(self) -> bool:
+        return self.status == 0
+
+
+@dataclass
+class RedirectHop:
+    """A single redirect response"""
+    source: str
+    target: str
+    status: int
+    origin: str
+    reason: str
+
+
+@dataclass
+class Resolution:
+    """Where a URL ends up"""
+    url: str
+    final_url: str
+    hops: list[RedirectHop] = field(default_factory=list)
+    loop: bool = False
+
+    @property
+    def path_hops(self) -> int:
+        """Hops that change the path or query (scheme/host canonicalization is expected)."""
+        count = 0
+        for hop in self.hops:
+            source, target = urlsplit(hop.source), urlsplit(hop.target)
+            if (source.path or "/", source.query) != (target.path or "/", target.query):
+                count += 1
+        return count
+
+    @property
+    def is_chain(self) -> bool:
+        return self.path_hops > 1
+
+
+@dataclass
+class RedirectAnalysis:
+    """Result of resolving a set of URLs through the redirect graph"""
+    rules: list[RedirectRule] = field(default_factory=list)
+    resolved: int = 0
+    redirecting_sitemap_urls: list[Resolution] = field(default_factory=list)
+    chains: list[Resolution] = field(default_factory=list)
+    loops: list[Resolution] = field(default_factory=list)
+
+
+# --- path-to-regexp -------------------------------------------------------
+
+def compile_path_pattern(source: str) -> re.Pattern:
+    """
+    Compile a Next.js/Vercel path-to-regexp source to a Python regex.
+
+    Supports `:name`, `:name*`, `:name+`, `:name?`, `:name(regex)` and
+    unnamed `(regex)` groups.
+
+    Args:
+        source: e.g. "/:path*", "/index.:ext(html|php|htm)", "/(.*)"
+
+    Returns:
+        Anchored compiled pattern with named groups
+    """
+    out = []
+    position = 0
+    unnamed = 0
+    for match in _PARAM_PATTERN.finditer(source):
+        literal = source[position:match.start()]
+        name, custom, modifier, bare = match.groups()
+        if bare is not None:
+            out.append(re.escape(literal))
+            out.append(f"(?P<_{unnamed}>{bare})")
+            unnamed += 1
+        else:
+            body = custom[1:-1] if custom else ("[^/]+" if modifier not in ("*", "+") else ".+")
+            if literal.endswith("/") and modifier in ("*", "?"):
+                # "/:path*" also matches the bare prefix
+                out.append(re.escape(literal[:-1]))
+                out.append(f"(?:/(?P<{name}>{body}))?")
+            else:
+                out.append(re.escape(literal))
+                out.append(f"(?P<{name}>{body})" + ("?" if modifier == "?" else ""))
+        position = match.end()
+    out.append(re.escape(source[position:]))
+    return re.compile("^" + "".join(out) + "$")
+
+
+def _fill_destination(destination: str, match: re.Match) -> str:
+    values = {k: v or "" for k, v in match.groupdict().items()}
+
+    def param(m: re.Match) -> str:
+        name = m.group(1)
+        return values.get(name, "")
+
+    filled = re.sub(r":(\w+)(?:\([^)]*\))?[*+?]?", param, destination.replace("://", "\0"))
+    filled = filled.replace("\0", "://")
+    # "$1"-style references to unnamed groups
+    return re.sub(r"\$(\d+)", lambda m: values.get(f"_{int(m.group(1)) - 1}", ""), filled)
+
+
+# --- Config extraction ----------------------------------------------------
+
+def load_vercel_rules(root: Path) -> list[RedirectRule]:
+    """
+    Read redirects, rewrites and implicit URL normalization from vercel.json.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Rules in evaluation order
+    """
+    path = root / VERCEL_CONFIG
+    if not path.exists():
+        return []
+    with path.open("r", encoding="utf-8") as handle:
+        config = json.load(handle)
+
+    rules = []
+    for entry in config.get("redirects", []):
+        host = next((h.get("value") for h in entry.get("has", []) if h.get("type") == "host"), None)
+        status = entry.get("statusCode") or (308 if entry.get("permanent", True) else 307)
+        rules.append(RedirectRule(
+            origin=VERCEL_CONFIG,
+            source=entry["source"],
+            destination=entry["destination"],
+            status=status,
+            reason="vercel-redirect",
+            pattern=compile_path_pattern(entry["source"]),
+            host=host,
+        ))
+
+    if config.get("cleanUrls"):
+        rules.append(RedirectRule(
+            origin=VERCEL_CONFIG, source="cleanUrls", destination="/:path", status=308,
+            reason="clean-urls", pattern=re.compile(r"^/(?P<path>.+?)(?:/index)?\.html?$"),
+        ))
+    if config.get("trailingSlash") is False:
+        rules.append(RedirectRule(
+            origin=VERCEL_CONFIG, source="trailingSlash: false", destination="/:path", status=308,
+            reason="trailing-slash", pattern=re.compile(r"^/(?P<path>.+)/$"),
+        ))
+
+    for entry in config.get("rewrites", []):
+        rules.append(RedirectRule(
+            origin=VERCEL_CONFIG, source=entry["source"], destination=entry["destination"], status=0,
+            reason="vercel-rewrite", pattern=compile_path_pattern(entry["source"]),
+        ))
+    return rules
+
+
+_JS_ENTRY = re.compile(
+    r"\{[^{}]*?source:\s*['\"]([^'\"]+)['\"][^{}]*?destination:\s*['\"]([^'\"]+)['\"][^{}]*?\}", re.S
+)
+
+
+def load_next_config_rules(root: Path) -> list[RedirectRule]:
+    """
+    Extract literal entries from the redirects()/rewrites() functions in next.config.js.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Rules in evaluation order
+    """
+    path = root / NEXT_CONFIG
+    if not path.exists():
+        return []
+    source = path.read_text(encoding="utf-8")
+    rules = []
+    for kind in ("redirects", "rewrites"):
+        block = re.search(rf"{kind}\s*:\s*async\s*\(\)\s*=>\s*\{{(.*?)\n  \}}", source, re.S)
+        if not block:
+            continue
+        body = re.sub(r"//[^\n]*", "", block.group(1))
+        for entry in _JS_ENTRY.finditer(body):
+            text = entry.group(0)
+            status_match = re.search(r"statusCode:\s*(\d{3})", text)
+            if kind == "rewrites":
+                status = 0
+            elif status_match:
+                status = int(status_match.group(1))
+            else:
+                status = 307 if re.search(r"permanent:\s*false", text) else 308
+            rules.append(RedirectRule(
+                origin=NEXT_CONFIG,
+                source=entry.group(1),
+                destination=entry.group(2),
+                status=status,
+                reason=f"next-config-{kind[:-1]}",
+                pattern=compile_path_pattern(entry.group(1)),
+            ))
+    return rules
+
+
+def _js_regex(literal: str) -> re.Pattern:
+    return re.compile(literal.replace("\\/", "/"))
+
+
+def _js_strings(text: str) -> list[str]:
+    return re.findall(r"'([^']*)'", text)
+
+
+@dataclass
+class MiddlewareRules:
+    """Rule tables read from middleware.ts and its helpers"""
+    blog_redirects: dict[str, str] = field(default_factory=dict)
+    post_patterns: list[tuple[re.Pattern, str, str]] = field(default_factory=list)
+    block_patterns: list[tuple[re.Pattern, str]] = field(default_factory=list)
+    tracking_params: set[str] = field(default_factory=set)
+    localizable_paths: set[str] = field(default_factory=set)
+    translations: dict[str, set[str]] = field(default_factory=dict)
+
+
+def load_middleware_rules(root: Path) -> MiddlewareRules:
+    """
+    Read the redirect tables from middleware.ts, i18n-paths.js and the translation manifest.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        MiddlewareRules (empty tables for missing files)
+    """
+    rules = MiddlewareRules()
+
+    middleware = root / MIDDLEWARE
+    if middleware.exists():
+        source = middleware.read_text(encoding="utf-8")
+        block = re.search(r"const blogRedirects[^=]*=\s*\{(.*?)\}", source, re.S)
+        if block:
+            rules.blog_redirects = dict(re.findall(r"'([^']+)':\s*'([^']+)'", block.group(1)))
+        for pattern, replacement, reason in re.findall(
+            r"pattern:\s*/(.+?)/,\s*replacement:\s*'([^']*)',\s*reason:\s*'([^']+)'", source
+        ):
+            rules.post_patterns.append((_js_regex(pattern), re.sub(r"\$(\d)", r"\\g<\1>", replacement), reason))
+        for pattern, reason in re.findall(r"pattern:\s*/(.+?)/,\s*reason:\s*'([^']+)'", source):
+            rules.block_patterns.append((_js_regex(pattern), reason))
+        tracking = re.search(r"trackingParamNames\s*=\s*new Set\(\[(.*?)\]\)", source, re.S)
+        if tracking:
+            rules.tracking_params = set(_js_strings(tracking.group(1)))
+
+    i18n = root / I18N_PATHS
+    if i18n.exists():
+        block = re.search(r"localizableStaticPaths\s*=\s*Object\.freeze\(new Set\(\[(.*?)\]\)", i18n.read_text(encoding="utf-8"), re.S)
+        if block:
+            rules.localizable_paths = set(_js_strings(block.group(1)))
+
+    manifest = root / TRANSLATION_MANIFEST
+    if manifest.exists():
+        text = manifest.read_text(encoding="utf-8")
+        for locale, body in re.findall(r"(\w+):\s*Object\.freeze\(\[(.*?)\]\)", text, re.S):
+            rules.translations[locale] = set(_js_strings(body))
+
+    return rules
+
+
+# --- Middleware port ------------------------------------------------------
+
+def _normalize_slug(value: str) -> str:
+    # Port of normalizeSlug() in middleware.ts
+    decoded = unquote(value)
+    return slugify(decoded) or re.sub(r"\s+", "-", decoded.strip().lower())
+
+
+# Tag/category route normalization in middleware.ts, in evaluation order
+SLUG_ROUTES = (
+    (r"^/tag/(.+)$", "/tags/", "tag-route-normalization"),
+    (r"^/tags/(.+)$", "/tags/", "tag-slug-normalization"),
+    (r"^/(?:blog/)?category/(.+)$", "/categories/", "category-route-normalization"),
+    (r"^/categories/(.+)$", "/categories/", "category-slug-normalization"),
+)
+
+
+class MiddlewareModel:
+    """
+    Python port of the redirect decisions in middleware.ts.
+
+    Args:
+        rules: Rule tables from load_middleware_rules()
+    """
+
+    def __init__(self, rules: MiddlewareRules):
+        self.rules = rules
+
+    def _is_article(self, path: str) -> bool:
+        return re.match(r"^/blog/[^/]+$", normalize_path(strip_locale(path)[1])) is not None
+
+    def _is_localizable(self, path: str) -> bool:
+        content = normalize_path(strip_locale(path)[1])
+        return content in self.rules.localizable_paths or self._is_article(content)
+
+    def _localize(self, path: str, locale: str) -> str:
+        content = normalize_path(strip_locale(path)[1])
+        if locale == DEFAULT_LOCALE or not self._is_localizable(content):
+            return content
+        return localize_path(content, locale)
+
+    def step(self, path: str, query: str = "") -> Optional[tuple[str, str, int, str]]:
+        """
+        Decide the redirect middleware.ts issues for one request.
+
+        Args:
+            path: Request pathname
+            query: Raw query string
+
+        Returns:
+            (new path, new query, status, reason) or None if the request passes through
+        """
+        if (
+            path.startswith(MIDDLEWARE_SKIP_PREFIXES)
+            or ("." in path and not path.endswith((".html", ".php", ".htm")))
+        ):
+            return None
+
+        reasons = []
+        params = parse_qsl(query, keep_blank_values=True)
+        kept = [(k, v) for k, v in params if not (k.lower().startswith("utm_") or k.lower() in self.rules.tracking_params)]
+        new_query = urlencode(kept) if len(kept) != len(params) else query
+        if len(kept) != len(params):
+            reasons.append("tracking-param-cleanup")
+
+        new_path = path
+        modified = False
+        if path != "/" and path.endswith("/"):
+            new_path, modified = path[:-1], True
+            reasons.append("trailing-slash-removal")
+        if "//" in path:
+            new_path, modified = re.sub(r"/+", "/", path), True
+            reasons.append("double-slash-cleanup")
+
+        locale, content = strip_locale(new_path)
+
+        if locale != DEFAULT_LOCALE and self._is_article(content):
+            slug = unquote(content.split("/")[-1])
+            if slug not in self.rules.translations.get(locale, set()):
+                return content, new_query, 302, "localized-article-fallback"
+
+        if not modified and content in self.rules.blog_redirects:
+            new_path, modified = self._redirect_target(self.rules.blog_redirects[content], locale), True
+            reasons.append("url-structure-normalization")
+
+        if not modified:
+            for pattern, replacement, reason in self.rules.post_patterns:
+                if pattern.search(content):
+                    new_path, modified = self._redirect_target(pattern.sub(replacement, content), locale), True
+                    reasons.append(reason)
+                    break
+
+        current = new_path
+        next_locale, next_content = strip_locale(current)
+        for regex, prefix, reason in SLUG_ROUTES:
+            match = re.match(regex, next_content)
+            if match:
+                canonical = self._localize(f"{prefix}{_normalize_slug(match.group(1))}", next_locale)
+                if canonical != current:
+                    new_path, modified = canonical, True
+                    reasons.append(reason)
+
+        if not modified:
+            for pattern, reason in self.rules.block_patterns:
+                if pattern.search(next_content):
+                    new_path, modified = self._localize("/", next_locale), True
+                    reasons.append(reason)
+                    break
+
+        if reasons:
+            return new_path, new_query, 301, ",".join(reasons)
+
+        canonical = strip_locale(path)[1]
+        if canonical != path:
+            if not self._is_localizable(canonical):
+                return canonical, query, 302, "localized-route-fallback"
+            if strip_locale(path)[0] == DEFAULT_LOCALE:
+                # next-intl with localePrefix "as-needed" drops the default locale prefix
+                return canonical, query, 307, "next-intl-default-locale"
+        return None
+
+    def _redirect_target(self, path: str, locale: str) -> str:
+        # localizedRedirectPath(): /rss is never localized
+        return path if path == "/rss" else self._localize(path, locale)
+
+
+# --- Graph ----------------------------------------------------------------
+
+class RedirectGraph:
+    """
+    Redirect graph over absolute URLs with memoized resolution.
+
+    Args:
+        rules: Config rules (vercel.json, next.config.js) in evaluation order
+        middleware: Middleware model (None to ignore middleware.ts)
+        base_url: Canonical origin; its scheme/host are "the site"
+    """
+
+    def __init__(
+        self,
+        rules: list[RedirectRule],
+        middleware: Optional[MiddlewareModel] = None,
+        base_url: str = BASE_URL
+    ):
+        self.rules = rules
+        self.middleware = middleware
+        self.base_url = base_url.rstrip("/")
+        self.site_host = urlsplit(self.base_url).hostname
+        self._memo: dict[str, Resolution] = {}
+        self._steps: dict[str, Optional[RedirectHop]] = {}
+
+    def _site_url(self, url: str) -> bool:
+        host = urlsplit(url).hostname or ""
+        return host == self.site_host or host == f"www.{self.site_host}"
+
+    def step(self, url: str) -> Optional[RedirectHop]:
+        """
+        The single redirect served for url, if any (cached).
+
+        Args:
+            url: Absolute URL
+
+        Returns:
+            RedirectHop or None
+        """
+        if url in self._steps:
+            return self._steps[url]
+        hop = self._step(url)
+        self._steps[url] = hop
+        return hop
+
+    def _step(self, url: str) -> Optional[RedirectHop]:
+        if not self._site_url(url):
+            return None
+        parts = urlsplit(url)
+
+        if parts.scheme == "http":
+            return RedirectHop(url, urlunsplit(("https",) + tuple(parts[1:])), 308, VERCEL_CONFIG, "https-upgrade")
+
+        path = parts.path or "/"
+        for rule in self.rules:
+            if rule.host and rule.host != parts.hostname:
+                continue
+            match = rule.pattern.match(path) if rule.pattern else None
+            if not match:
+                continue
+            if rule.is_rewrite:
+                break  # rewrites are served in place; the URL does not change
+            target = urljoin(url, _fill_destination(rule.destination, match))
+            if parts.query and "?" not in target:
+                target += f"?{parts.query}"
+            if target != url:
+                return RedirectHop(url, target, rule.status, rule.origin, rule.reason)
+
+        if self.middleware:
+            decision = self.middleware.step(path, parts.query)
+            if decision:
+                new_path, new_query, status, reason = decision
+                target = urlunsplit((parts.scheme, parts.netloc, new_path, new_query, ""))
+                if target != url:
+                    return RedirectHop(url, target, status, MIDDLEWARE, reason)
+        return None
+
+    def resolve(self, url: str) -> Resolution:
+        """
+        Follow redirects from url to its final URL, reusing earlier results.
+
+        Args:
+            url: Absolute URL
+
+        Returns:
+            Resolution with the hops taken (loop=True if a cycle was hit)
+        """
+        if url in self._memo:
+            return self._memo[url]
+
+        trail: list[RedirectHop] = []
+        seen = {url}
+        current = url
+        tail: Optional[Resolution] = None
+        loop = False
+
+        while len(trail) < MAX_HOPS:
+            if current in self._memo and current != url:
+                tail = self._memo[current]
+                break
+            hop = self.step(current)
+            if hop is None:
+                break
+            trail.append(hop)
+            if hop.target in seen:
+                loop = True
+                break
+            seen.add(hop.target)
+            current = hop.target
+        else:
+            loop = True
+
+        tail_hops = tail.hops if tail else []
+        final = tail.final_url if tail else current
+        loop = loop or bool(tail and tail.loop)
+
+        # Every URL on the trail now has a known resolution
+        for index, hop in enumerate(trail):
+            self._memo.setdefault(hop.source, Resolution(
+                url=hop.source, final_url=final, hops=trail[index:] + tail_hops, loop=loop
+            ))
+        if not trail:
+            self._memo[url] = Resolution(url=url, final_url=final, hops=tail_hops, loop=loop)
+        return self._memo[url]
+
+    @property
+    def resolved_count(self) -> int:
+        return len(self._memo)
+
+
+def load_redirect_graph(root: Path = DEFAULT_PROJECT_ROOT, base_url: str = BASE_URL) -> RedirectGraph:
+    """
+    Build the redirect graph from the repository's configuration.
+
+    Args:
+        root: Repository root
+        base_url: Canonical origin
+
+    Returns:
+        RedirectGraph
+    """
+    root = Path(root)
+    rules = load_vercel_rules(root) + load_next_config_rules(root)
+    return RedirectGraph(rules, MiddlewareModel(load_middleware_rules(root)), base_url)
+
+
+def url_variants(url: str) -> list[str]:
+    """
+    Common inbound variants of a canonical URL (links, typos, old bookmarks).
+
+    Args:
+        url: Canonical absolute URL
+
+    Returns:
+        http://, www., trailing-slash and .html variants
+    """
+    parts = urlsplit(url)
+    host = parts.netloc
+    path = parts.path or "/"
+    variants = [
+        urlunsplit(("http", host, path, parts.query, "")),
+        urlunsplit(("https", f"www.{host}", path, parts.query, "")),
+        urlunsplit(("http", f"www.{host}", path, parts.query, "")),
+    ]
+    if path != "/":
+        variants.append(urlunsplit((parts.scheme, host, path + "/", parts.query, "")))
+        variants.append(urlunsplit(("http", f"www.{host}", path + "/", parts.query, "")))
+        variants.append(urlunsplit((parts.scheme, host, path + ".html", parts.query, "")))
+    return variants
+
+
+def analyze_redirects(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    sitemap_urls: Iterable[str] = (),
+    include_variants: bool = True,
+    graph: Optional[RedirectGraph] = None
+) -> RedirectAnalysis:
+    """
+    Resolve sitemap URLs, configured redirect sources and URL variants.
+
+    Args:
+        root: Repository root
+        sitemap_urls: Absolute URLs listed in the sitemap
+        include_variants: Also resolve url_variants() of every sitemap URL
+        graph: Prebuilt graph (defaults to load_redirect_graph(root))
+
+    Returns:
+        RedirectAnalysis
+    """
+    graph = graph or load_redirect_graph(root)
+    analysis = RedirectAnalysis(rules=graph.rules)
+    sitemap_urls = list(sitemap_urls)
+
+    for url in sitemap_urls:
+        resolution = graph.resolve(url)
+        if resolution.hops:
+            analysis.redirecting_sitemap_urls.append(resolution)
+
+    candidates: list[str] = []
+    if graph.middleware:
+        for source in graph.middleware.rules.blog_redirects:
+            for locale in LOCALES:
+                candidates.append(graph.base_url + localize_path(source, locale))
+    for rule in graph.rules:
+        if rule.pattern and ":" not in rule.source and "(" not in rule.source and not rule.host:
+            candidates.append(graph.base_url + rule.source)
+    if include_variants:
+        for url in sitemap_urls:
+            candidates.extend(url_variants(url))
+
+    seen_chains = set()
+    for url in candidates + sitemap_urls:
+        resolution = graph.resolve(url)
+        if resolution.loop and url not in seen_chains:
+            analysis.loops.append(resolution)
+            seen_chains.add(url)
+        elif resolution.is_chain and url not in seen_chains:
+            analysis.chains.append(resolution)
+            seen_chains.add(url)
+
+    analysis.resolved = graph.resolved_count
+    return analysis
+
+
+def format_resolution(resolution: Resolution) -> str:
+    """One-line rendering: url -(301 reason)-> url -> ..."""
+    text = resolution.url
+    for hop in resolution.hops:
+        text += f" -({hop.status} {hop.reason})-> {hop.target}"
+    return text + (" [LOOP]" if resolution.loop else "")
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+When auditing redirects (no server needed):
+
+```python
+from redirect_analyzer import analyze_redirects, format_resolution
+from site_routes import absolute_url, iter_site_routes
+
+urls = [absolute_url(r.path) for r in iter_site_routes(use_git=False)]
+analysis = analyze_redirects(sitemap_urls=urls)
+
+print(f"{len(analysis.rules)} config rules, {analysis.resolved} URLs resolved")
+for r in analysis.redirecting_sitemap_urls:
+    print("SITEMAP REDIRECTS:", format_resolution(r))
+for r in analysis.loops:
+    print("LOOP:", format_resolution(r))
+for r in analysis.chains[:20]:
+    print("CHAIN:", format_resolution(r))
+```
+
+Typical fix for chains: make the first hop go straight to the final URL
+(e.g. one vercel.json rule for http://www -> https://apex without the
+trailing slash), and list only final URLs in the sitemap.
+"""
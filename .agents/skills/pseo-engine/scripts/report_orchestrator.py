@@ -0,0 +1,678 @@
+"""
+SEO Report Orchestrator Module for pSEO Engine
+
+This module runs the five-step "seo analysis" workflow described in
+seo_report.py as a single command and returns a filled-in SEOReport.
+
+Independent stages run concurrently: content analysis and link-graph
+construction are CPU-bound and go to a process pool, the technical audit
+and keyword lookup are I/O-bound and run on the event loop. Each stage's
+wall time is recorded in SEOReport.stage_timings, so a full report takes
+roughly as long as its slowest stage.
+
+Stage outputs are cached on disk keyed by fingerprints of their inputs
+(post file hashes, keyword database, base URL, analysis code), so a
+refresh only recomputes stale stages before re-aggregating the scores.
+
+Usage by Claude:
+- Trigger: "seo analysis" or "SEO分析"
+- generate_seo_report(base_url=...) -> SEOReport
+- format_report_markdown(report) for the user-facing output
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Optional, TypeVar, Union
+import asyncio
+import hashlib
+import json
+import pickle
+import re
+import time
+import urllib.error
+import urllib.request
+
+import content_optimizer
+import technical_seo_audit
+from content_optimizer import ContentAnalysis, IssueCategory, IssueSeverity, SEOIssue
+from internal_link_builder import LinkGraph, PageNode, classify_page_type, find_orphan_pages
+from seo_report import (
+    ActionItem,
+    CategoryScore,
+    EffortLevel,
+    ImpactLevel,
+    SEOReport,
+    calculate_overall_score,
+    generate_executive_summary,
+    group_actions,
+    identify_quick_wins,
+    prioritize_actions,
+)
+from site_routes import BLOG_POSTS_DIR, DEFAULT_PROJECT_ROOT, create_clean_slug, parse_list_value, read_mdx
+from technical_seo_audit import BASE_CHECKS, CheckStatus, Priority, SEOCheck
+
+
+T = TypeVar("T")
+
+KEYWORD_DATABASE_PATH = Path(__file__).resolve().parent.parent / "references" / "keyword-database.json"
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_CACHE_DIR = SCRIPTS_DIR.parent / "outputs" / ".report_cache"
+
+# Bump when StageOutputs/PostAnalysis change shape so stale pickles are ignored
+CACHE_VERSION = 1
+
+# Modules whose code determines stage outputs
+RULE_MODULES = ("content_optimizer", "internal_link_builder", "report_orchestrator", "site_routes", "technical_seo_audit")
+
+# The live site can change without any local input changing
+AUDIT_CACHE_SECONDS = 15 * 60
+
+HEALTH_ENDPOINT = "/api/seo-health"
+HEALTH_ENDPOINT_CHECK = "SEO Health Endpoint"  # reported when the endpoint cannot be reached
+HEALTH_TIMEOUT_SECONDS = 30
+
+# A post scoring at or above this counts as a passed content check
+CONTENT_PASS_SCORE = 75
+
+_INTERNAL_LINK_PATTERN = re.compile(r"\]\((/[^)\s#?]*)|href=[\"'](/[^\"'#?]*)")
+
+_SEVERITY_IMPACT = {
+    IssueSeverity.CRITICAL: ImpactLevel.HIGH,
+    IssueSeverity.WARNING: ImpactLevel.MEDIUM,
+    IssueSeverity.INFO: ImpactLevel.LOW,
+}
+
+_PRIORITY_IMPACT = {
+    Priority.CRITICAL: ImpactLevel.HIGH,
+    Priority.HIGH: ImpactLevel.HIGH,
+    Priority.MEDIUM: ImpactLevel.MEDIUM,
+    Priority.LOW: ImpactLevel.LOW,
+}
+
+
+@dataclass
+class PostAnalysis:
+    """Content analysis of one blog post plus the facts the report needs"""
+    route: str
+    analysis: ContentAnalysis
+    has_schema: bool = False
+    needs_update: bool = False
+
+
+@dataclass
+class StageOutputs:
+    """Raw outputs of the analysis stages, before compilation"""
+    technical_checks: list[SEOCheck] = field(default_factory=list)
+    posts: list[PostAnalysis] = field(default_factory=list)
+    link_graph: LinkGraph = field(default_factory=LinkGraph)
+    keyword_opportunities: list[str] = field(default_factory=list)
+
+
+# --- Stage 1: technical audit (I/O) -------------------------------------
+
+def _fetch_json(url: str) -> dict:
+    request = urllib.request.Request(url, headers={"Accept": "application/json"})
+    with urllib.request.urlopen(request, timeout=HEALTH_TIMEOUT_SECONDS) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+async def run_technical_audit(base_url: Optional[str]) -> list[SEOCheck]:
+    """
+    Run the base checks through the site's /api/seo-health endpoint.
+
+    Args:
+        base_url: Origin of a running site; None skips the stage
+
+    Returns:
+        SEOCheck per base check
+    """
+    categories = {check["name"]: check for check in BASE_CHECKS}
+
+    if not base_url:
+        return [
+            SEOCheck(
+                name=check["name"],
+                category=check["category"],
+                status=CheckStatus.SKIPPED,
+                message="No base URL given",
+                impact=check["impact"],
+            )
+            for check in BASE_CHECKS
+        ]
+
+    try:
+        payload = await asyncio.to_thread(_fetch_json, base_url.rstrip("/") + HEALTH_ENDPOINT)
+    except (urllib.error.URLError, OSError, ValueError) as error:
+        return [SEOCheck(
+            name=HEALTH_ENDPOINT_CHECK,
+            category="accessibility",
+            status=CheckStatus.FAILED,
+            message=f"Could not reach {HEALTH_ENDPOINT}: {error}",
+            impact="Technical health could not be measured",
+            priority=Priority.HIGH,
+        )]
+
+    checks = []
+    for result in payload.get("checks", []):
+        declared = categories.get(result.get("name"), {})
+        passed = bool(result.get("passed"))
+        checks.append(SEOCheck(
+            name=result.get("name", "Unknown check"),
+            category=declared.get("category", "technical"),
+            status=CheckStatus.PASSED if passed else CheckStatus.FAILED,
+            message=result.get("message", ""),
+            impact=declared.get("impact", ""),
+            priority=Priority.MEDIUM if passed else Priority.HIGH,
+            details=result.get("details") or {},
+        ))
+    return checks
+
+
+# --- Stage 2: content analysis (CPU, one task per post) ------------------
+
+def analyze_post(path: str) -> PostAnalysis:
+    """
+    Score one blog post with the content_optimizer rules.
+
+    Top-level so it can run in a worker process.
+
+    Args:
+        path: MDX file path
+
+    Returns:
+        PostAnalysis for the post
+    """
+    source = Path(path)
+    metadata, body = read_mdx(source)
+
+    issues: list[SEOIssue] = []
+    issues += content_optimizer.analyze_title(metadata.get("seoTitle") or metadata.get("title", ""))
+    issues += content_optimizer.analyze_meta_description(
+        metadata.get("seoDescription") or metadata.get("summary", "")
+    )
+    issues += content_optimizer.analyze_headings(body)
+    issues += content_optimizer.analyze_images(body)
+    issues += content_optimizer.analyze_internal_links(body, [])
+    issues += content_optimizer.analyze_content_freshness(body)
+
+    analysis = ContentAnalysis(
+        file_path=str(source),
+        seo_score=content_optimizer.calculate_seo_score(issues),
+        issues=issues,
+        auto_fixes=[i for i in issues if i.auto_fixable],
+        manual_review=[i for i in issues if not i.auto_fixable],
+        schema_suggestions=content_optimizer.suggest_schema_types(body, metadata),
+    )
+
+    return PostAnalysis(
+        route=f"/blog/{create_clean_slug(source.name)}",
+        analysis=analysis,
+        has_schema=bool(metadata.get("faq") or metadata.get("howto")),
+        needs_update=any(i.category == IssueCategory.FRESHNESS for i in issues),
+    )
+
+
+# --- Stage 3: link analysis (CPU) ----------------------------------------
+
+def _normalize_link(target: str) -> str:
+    target = target.rstrip("/") or "/"
+    if target.startswith("/blog/"):
+        return "/blog/" + target[len("/blog/"):].lower()
+    return target
+
+
+def build_link_graph(root: str) -> LinkGraph:
+    """
+    Build the internal link graph of the blog corpus.
+
+    Top-level so it can run in a worker process.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        LinkGraph with incoming/outgoing links and orphan pages
+    """
+    graph = LinkGraph()
+    bodies = {}
+
+    for source in sorted((Path(root) / BLOG_POSTS_DIR).glob("*.mdx")):
+        metadata, body = read_mdx(source)
+        path = f"/blog/{create_clean_slug(source.name)}"
+        graph.pages[path] = PageNode(
+            path=path,
+            title=metadata.get("title", path),
+            category=metadata.get("category") or None,
+            tags=parse_list_value(metadata.get("tags", "")),
+            page_type=classify_page_type(path),
+        )
+        bodies[path] = body
+
+    for path, body in bodies.items():
+        node = graph.pages[path]
+        for match in _INTERNAL_LINK_PATTERN.finditer(body):
+            target = _normalize_link(match.group(1) or match.group(2))
+            if target == path or target in node.outgoing_links:
+                continue
+            node.outgoing_links.append(target)
+            if target in graph.pages:
+                graph.pages[target].incoming_links.append(path)
+
+    total = len(graph.pages) or 1
+    graph.orphan_pages = find_orphan_pages(graph)
+    graph.hub_pages = [p for p, n in graph.pages.items() if n.page_type == "hub"]
+    graph.average_incoming = round(sum(len(n.incoming_links) for n in graph.pages.values()) / total, 2)
+    graph.average_outgoing = round(sum(len(n.outgoing_links) for n in graph.pages.values()) / total, 2)
+    return graph
+
+
+# --- Stage 4: keyword analysis (I/O) -------------------------------------
+
+def _keyword_opportunities(root: Path) -> list[str]:
+    with KEYWORD_DATABASE_PATH.open("r", encoding="utf-8") as handle:
+        database = json.load(handle)
+
+    covered = []
+    for source in (root / BLOG_POSTS_DIR).glob("*.mdx"):
+        metadata, _ = read_mdx(source)
+        covered.append(" ".join([
+            metadata.get("title", ""), metadata.get("summary", ""), metadata.get("tags", "")
+        ]).lower())
+    corpus = "\n".join(covered)
+
+    candidates = [entry["keyword"] for entry in database.get("primaryKeywords", [])]
+    for group in database.get("longTailKeywords", {}).values():
+        candidates.extend(group)
+    candidates.extend(gap["keyword"] for gap in database.get("competitorKeywords", {}).get("gaps", []))
+
+    return [keyword for keyword in dict.fromkeys(candidates) if keyword.lower() not in corpus]
+
+
+async def run_keyword_analysis(root: Path) -> list[str]:
+    """
+    List cached keyword targets that no post title, summary or tag covers.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Keyword opportunities in database order
+    """
+    return await asyncio.to_thread(_keyword_opportunities, root)
+
+
+# --- Stage 5: compile ----------------------------------------------------
+
+def _technical_category(checks: list[SEOCheck]) -> CategoryScore:
+    score, _ = technical_seo_audit.calculate_overall_score(checks)
+    counted = [c for c in checks if c.status != CheckStatus.SKIPPED]
+    return CategoryScore(
+        name="Technical SEO",
+        score=score,
+        checks_passed=sum(1 for c in counted if c.status == CheckStatus.PASSED),
+        checks_total=len(counted),
+        issues=[f"{c.name}: {c.message}" for c in counted if c.status != CheckStatus.PASSED],
+    )
+
+
+def _ratio_score(passed: int, total: int) -> int:
+    return round(100 * passed / total) if total else 0
+
+
+def compile_report(outputs: StageOutputs, stage_timings: Optional[dict] = None) -> SEOReport:
+    """
+    Turn raw stage outputs into a scored, prioritized SEOReport.
+
+    Args:
+        outputs: Results of the analysis stages
+        stage_timings: Stage name -> seconds
+
+    Returns:
+        Complete SEOReport
+    """
+    posts = outputs.posts
+    graph = outputs.link_graph
+    category_scores = []
+    actions: list[ActionItem] = []
+
+    if any(c.status != CheckStatus.SKIPPED for c in outputs.technical_checks):
+        category_scores.append(_technical_category(outputs.technical_checks))
+
+    for check in outputs.technical_checks:
+        if check.status in (CheckStatus.FAILED, CheckStatus.WARNING):
+            actions.append(ActionItem(
+                title=check.name,
+                description=f"{check.message}. {check.impact}".strip(". "),
+                impact=_PRIORITY_IMPACT[check.priority],
+                effort=EffortLevel.MODERATE,
+                category="Technical SEO",
+                fix_command="seo audit",
+            ))
+
+    if posts:
+        average = round(sum(p.analysis.seo_score for p in posts) / len(posts))
+        category_scores.append(CategoryScore(
+            name="Content Quality",
+            score=average,
+            checks_passed=sum(1 for p in posts if p.analysis.seo_score >= CONTENT_PASS_SCORE),
+            checks_total=len(posts),
+            issues=[p.route for p in posts if p.analysis.seo_score < CONTENT_PASS_SCORE],
+        ))
+
+        with_schema = sum(1 for p in posts if p.has_schema)
+        category_scores.append(CategoryScore(
+            name="Structured Data",
+            score=_ratio_score(with_schema, len(posts)),
+            checks_passed=with_schema,
+            checks_total=len(posts),
+            issues=[p.route for p in posts if not p.has_schema],
+        ))
+
+        for post in posts:
+            for issue in post.analysis.issues:
+                actions.append(ActionItem(
+                    title=issue.message,
+                    description=issue.suggested_fix or issue.message,
+                    impact=_SEVERITY_IMPACT[issue.severity],
+                    effort=EffortLevel.QUICK if issue.auto_fixable else EffortLevel.MODERATE,
+                    category="Content Quality",
+                    auto_fixable=issue.auto_fixable,
+                    affected_pages=[post.route],
+                    fix_command="apply seo fixes" if issue.auto_fixable else None,
+                ))
+
+    if graph.pages:
+        linked = len(graph.pages) - len(graph.orphan_pages)
+        category_scores.append(CategoryScore(
+            name="Internal Linking",
+            score=_ratio_score(linked, len(graph.pages)),
+            checks_passed=linked,
+            checks_total=len(graph.pages),
+            issues=list(graph.orphan_pages),
+        ))
+
+        if graph.orphan_pages:
+            actions.append(ActionItem(
+                title="Rescue orphan pages",
+                description=(
+                    f"{len(graph.orphan_pages)} pages have no contextual internal links "
+                    "pointing to them and may not be discovered by search engines."
+                ),
+                impact=ImpactLevel.HIGH,
+                effort=EffortLevel.MODERATE,
+                category="Internal Linking",
+                affected_pages=list(graph.orphan_pages),
+                fix_command="build internal links",
+            ))
+
+    actions = group_actions(actions)
+    overall, status = calculate_overall_score(category_scores)
+    technical_score, technical_status = technical_seo_audit.calculate_overall_score(outputs.technical_checks)
+
+    report = SEOReport(
+        generated_at=datetime.now(timezone.utc).isoformat(),
+        overall_score=overall,
+        status=status,
+        executive_summary="",
+        category_scores=category_scores,
+        quick_wins=identify_quick_wins(actions),
+        priority_actions=prioritize_actions(actions),
+        all_actions=actions,
+        content_stats={
+            "total_posts": len(posts),
+            "average_score": round(sum(p.analysis.seo_score for p in posts) / len(posts)) if posts else 0,
+            "with_schema": sum(1 for p in posts if p.has_schema),
+            "needs_update": sum(1 for p in posts if p.needs_update),
+        },
+        technical_health={
+            "score": technical_score,
+            "status": technical_status,
+            "checks": [
+                {"name": c.name, "status": c.status.value, "message": c.message}
+                for c in outputs.technical_checks
+            ],
+        },
+        keyword_opportunities=outputs.keyword_opportunities,
+        stage_timings=dict(stage_timings or {}),
+        page_scores={p.route: p.analysis.seo_score for p in posts},
+    )
+    report.executive_summary = generate_executive_summary(report)
+    return report
+
+
+# --- Orchestration -------------------------------------------------------
+
+async def _timed(name: str, awaitable: Awaitable[T], timings: dict) -> T:
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[name] = round(time.perf_counter() - started, 3)
+
+
+# --- Stage cache ---------------------------------------------------------
+
+def _digest(*parts: Union[str, bytes]) -> str:
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode("utf-8"))
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def rules_fingerprint() -> str:
+    """
+    Fingerprint of the analysis code, so cached outputs expire when rules change.
+
+    Returns:
+        Hex SHA-256 over the analysis modules' source
+    """
+    return _digest(*(
+        (SCRIPTS_DIR / f"{module}.py").read_bytes() for module in RULE_MODULES
+    ))
+
+
+def _load_stage(cache_dir: Optional[Path], stage: str) -> Optional[dict]:
+    if cache_dir is None:
+        return None
+    cache_file = cache_dir / f"{stage}.pickle"
+    if not cache_file.exists():
+        return None
+    try:
+        with cache_file.open("rb") as handle:
+            return pickle.load(handle)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        cache_file.unlink(missing_ok=True)
+        return None
+
+
+def _store_stage(cache_dir: Optional[Path], stage: str, entry: dict) -> None:
+    if cache_dir is None:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_dir / f"{stage}.pickle"
+    tmp_file = cache_file.with_suffix(".tmp")
+    with tmp_file.open("wb") as handle:
+        pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_file.replace(cache_file)
+
+
+async def _cached_stage(
+    cache_dir: Optional[Path],
+    stage: str,
+    fingerprint: str,
+    compute: Callable[[], Awaitable[T]],
+    max_age: Optional[float] = None,
+    cacheable: Optional[Callable[[T], bool]] = None
+) -> T:
+    cached = _load_stage(cache_dir, stage)
+    if (
+        cached
+        and cached["fingerprint"] == fingerprint
+        and (max_age is None or time.time() - cached["created"] <= max_age)
+    ):
+        return cached["value"]
+
+    value = await compute()
+    if cacheable is None or cacheable(value):
+        _store_stage(cache_dir, stage, {"fingerprint": fingerprint, "created": time.time(), "value": value})
+    return value
+
+
+def _audit_reached_site(checks: list[SEOCheck]) -> bool:
+    # A failed connection says nothing about the site; the next run should retry
+    return not any(c.name == HEALTH_ENDPOINT_CHECK and c.status == CheckStatus.FAILED for c in checks)
+
+
+async def _analyze_posts(
+    loop: asyncio.AbstractEventLoop,
+    pool: ProcessPoolExecutor,
+    post_digests: dict[str, str],
+    fingerprint: str,
+    cache_dir: Optional[Path]
+) -> list[PostAnalysis]:
+    # Per-post cache: only posts whose bytes (or the rules, or the day) changed are re-analyzed
+    cached = _load_stage(cache_dir, "content_analysis")
+    entries = cached["value"] if cached and cached["fingerprint"] == fingerprint else {}
+
+    stale = [path for path, digest in post_digests.items() if entries.get(path, (None,))[0] != digest]
+    fresh = await asyncio.gather(*(loop.run_in_executor(pool, analyze_post, path) for path in stale))
+
+    if stale or entries.keys() != post_digests.keys():
+        entries = {path: entries[path] for path in post_digests if path not in stale}
+        entries.update((path, (post_digests[path], result)) for path, result in zip(stale, fresh))
+        _store_stage(cache_dir, "content_analysis", {"fingerprint": fingerprint, "created": time.time(), "value": entries})
+
+    return [entries[path][1] for path in post_digests]
+
+
+async def run_analysis_stages(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    base_url: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    timings: Optional[dict] = None,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    audit_max_age: float = AUDIT_CACHE_SECONDS
+) -> StageOutputs:
+    """
+    Run stages 1-4 concurrently, reusing cached outputs whose inputs are unchanged.
+
+    Cache keys: content analysis per post file hash and today's date
+    (freshness is judged against it); link and keyword analysis by the
+    hash of every post (plus the keyword database); the technical audit by
+    base_url, expiring after audit_max_age and never stored when the site
+    could not be reached. All keys include rules_fingerprint().
+
+    Args:
+        root: Repository root
+        base_url: Origin of a running site for the technical audit
+        max_workers: Process pool size (defaults to CPU count)
+        timings: Dictionary that receives stage name -> seconds
+        cache_dir: Stage cache directory (None recomputes everything)
+        audit_max_age: Seconds a cached technical audit stays valid
+
+    Returns:
+        StageOutputs
+    """
+    timings = {} if timings is None else timings
+    loop = asyncio.get_running_loop()
+    rules = rules_fingerprint()
+    post_digests = {str(p): _file_digest(p) for p in sorted((root / BLOG_POSTS_DIR).glob("*.mdx"))}
+    corpus = _digest(rules, *(f"{path}={digest}" for path, digest in post_digests.items()))
+    content_key = _digest(rules, datetime.now(timezone.utc).date().isoformat())
+
+    # Worker processes only start if a stale CPU-bound stage submits work
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        technical, posts, graph, keywords = await asyncio.gather(
+            _timed("technical_audit", _cached_stage(
+                cache_dir, "technical_audit", _digest(rules, base_url or ""),
+                lambda: run_technical_audit(base_url), max_age=audit_max_age, cacheable=_audit_reached_site,
+            ), timings),
+            _timed("content_analysis", _analyze_posts(loop, pool, post_digests, content_key, cache_dir), timings),
+            _timed("link_analysis", _cached_stage(
+                cache_dir, "link_analysis", corpus,
+                lambda: loop.run_in_executor(pool, build_link_graph, str(root)),
+            ), timings),
+            _timed("keyword_analysis", _cached_stage(
+                cache_dir, "keyword_analysis", _digest(corpus, _file_digest(KEYWORD_DATABASE_PATH)),
+                lambda: run_keyword_analysis(root),
+            ), timings),
+        )
+
+    return StageOutputs(
+        technical_checks=technical,
+        posts=posts,
+        link_graph=graph,
+        keyword_opportunities=keywords,
+    )
+
+
+async def run_seo_analysis(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    base_url: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> SEOReport:
+    """
+    Run the full five-step workflow and return the compiled report.
+
+    Args:
+        root: Repository root
+        base_url: Origin of a running site for the technical audit
+        max_workers: Process pool size (defaults to CPU count)
+        cache_dir: Stage cache directory (None recomputes everything)
+
+    Returns:
+        SEOReport with stage_timings filled in
+    """
+    timings: dict = {}
+    started = time.perf_counter()
+    outputs = await run_analysis_stages(root, base_url, max_workers, timings, cache_dir)
+
+    compile_started = time.perf_counter()
+    report = compile_report(outputs, timings)
+    report.stage_timings["compile"] = round(time.perf_counter() - compile_started, 3)
+    report.stage_timings["total"] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def generate_seo_report(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    base_url: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> SEOReport:
+    """Synchronous entry point for run_seo_analysis()."""
+    return asyncio.run(run_seo_analysis(Path(root), base_url, max_workers, cache_dir))
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+When user triggers "seo analysis" or "SEO分析":
+
+```python
+from report_orchestrator import generate_seo_report
+from seo_report import format_report_markdown
+
+report = generate_seo_report(base_url="http://localhost:3000")  # or the production URL
+print(format_report_markdown(report))
+```
+
+- Without `base_url` the technical audit is skipped and excluded from scoring
+- Stage outputs are cached in `outputs/.report_cache/`; a refresh after editing
+  one post re-analyzes only that post and rebuilds the link/keyword stages.
+  Pass `cache_dir=None` to force a full run
+- `report.stage_timings` shows where the time went, e.g.
+  `{"technical_audit": 0.41, "content_analysis": 0.88, "link_analysis": 0.35,
+  "keyword_analysis": 0.12, "compile": 0.01, "total": 0.91}`
+"""
@@ -0,0 +1,323 @@
+"""
+Report Store Module for pSEO Engine
+
+This module keeps every SEOReport in a local SQLite database so that
+history questions are lookups instead of re-running the audit:
+
+- How has the overall / per-category / per-page score moved?
+- Which issues appeared since the last run?
+- Which issues were resolved between two runs?
+
+An issue is identified by its category, its title with numbers masked
+("Meta description too long (# chars)...") and the affected page, so an
+issue whose measured value changes between runs is not reported as new.
+
+Usage by Claude:
+- Trigger: "seo analysis" (save every run), "seo trend", "what changed since last audit"
+- save_report(conn, report) after each run, then score_trend / new_issues / resolved_issues
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+import hashlib
+import sqlite3
+
+from seo_report import SEOReport, calculate_priority_score, normalize_action_title
+
+
+DEFAULT_STORE_PATH = Path(__file__).resolve().parent.parent / "outputs" / "seo_history.sqlite3"
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    generated_at TEXT NOT NULL,
+    overall_score INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    executive_summary TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS runs_generated_at ON runs (generated_at);
+
+CREATE TABLE IF NOT EXISTS category_scores (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    checks_passed INTEGER NOT NULL,
+    checks_total INTEGER NOT NULL,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS category_scores_name ON category_scores (name, run_id);
+
+CREATE TABLE IF NOT EXISTS actions (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    issue_key TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    impact TEXT NOT NULL,
+    effort TEXT NOT NULL,
+    auto_fixable INTEGER NOT NULL,
+    fix_command TEXT,
+    priority REAL NOT NULL,
+    PRIMARY KEY (run_id, issue_key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS issues (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    issue_key TEXT NOT NULL,
+    page TEXT NOT NULL,
+    PRIMARY KEY (run_id, issue_key, page)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS issues_page ON issues (page, run_id);
+
+CREATE TABLE IF NOT EXISTS page_scores (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    route TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (run_id, route)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS page_scores_route ON page_scores (route, run_id);
+"""
+
+
+@dataclass
+class ScorePoint:
+    """One run's score for the report, a category or a page"""
+    run_id: int
+    generated_at: str
+    score: int
+
+
+@dataclass
+class IssueRecord:
+    """An issue on one page (page is "" for site-wide issues)"""
+    issue_key: str
+    title: str
+    category: str
+    impact: str
+    page: str
+    fix_command: Optional[str] = None
+
+
+def issue_key(category: str, title: str) -> str:
+    """
+    Stable identifier for an issue across runs.
+
+    Args:
+        category: Action category
+        title: Action title (numbers are masked)
+
+    Returns:
+        Short hex digest
+    """
+    normalized = normalize_action_title(title)
+    return hashlib.sha1(f"{category}\0{normalized}".encode("utf-8")).hexdigest()[:16]
+
+
+def open_store(path: Union[str, Path] = DEFAULT_STORE_PATH) -> sqlite3.Connection:
+    """
+    Open (and create if needed) the report store.
+
+    Args:
+        path: SQLite file, or ":memory:"
+
+    Returns:
+        Connection with the schema applied
+    """
+    if str(path) != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def save_report(conn: sqlite3.Connection, report: SEOReport) -> int:
+    """
+    Persist a report in one transaction.
+
+    Args:
+        conn: Store connection
+        report: The SEO report
+
+    Returns:
+        run_id of the stored report
+    """
+    with conn:
+        run_id = conn.execute(
+            "INSERT INTO runs (generated_at, overall_score, status, executive_summary) VALUES (?, ?, ?, ?)",
+            (report.generated_at, report.overall_score, report.status, report.executive_summary),
+        ).lastrowid
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO category_scores VALUES (?, ?, ?, ?, ?)",
+            ((run_id, cs.name, cs.score, cs.checks_passed, cs.checks_total) for cs in report.category_scores),
+        )
+
+        actions = {}
+        pages = set()
+        for action in report.all_actions or report.priority_actions:
+            key = issue_key(action.category, action.title)
+            actions.setdefault(key, (
+                run_id, key, action.title, action.description, action.category,
+                action.impact.value, action.effort.value, int(action.auto_fixable),
+                action.fix_command, calculate_priority_score(action),
+            ))
+            for page in action.affected_pages or [""]:
+                pages.add((run_id, key, page))
+
+        conn.executemany("INSERT INTO actions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", actions.values())
+        conn.executemany("INSERT INTO issues VALUES (?, ?, ?)", pages)
+        conn.executemany(
+            "INSERT INTO page_scores VALUES (?, ?, ?)",
+            ((run_id, route, score) for route, score in report.page_scores.items()),
+        )
+    return run_id
+
+
+def latest_run_ids(conn: sqlite3.Connection, count: int = 2) -> list[int]:
+    """
+    Most recent run ids, newest first.
+
+    Args:
+        conn: Store connection
+        count: Number of runs
+
+    Returns:
+        List of run ids
+    """
+    rows = conn.execute(
+        "SELECT id FROM runs ORDER BY generated_at DESC, id DESC LIMIT ?", (count,)
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def score_trend(
+    conn: sqlite3.Connection,
+    category: Optional[str] = None,
+    limit: int = 30
+) -> list[ScorePoint]:
+    """
+    Overall or per-category score history, oldest first.
+
+    Args:
+        conn: Store connection
+        category: Category name (None for the overall score)
+        limit: Maximum number of most recent runs
+
+    Returns:
+        List of ScorePoint
+    """
+    if category is None:
+        rows = conn.execute(
+            "SELECT id, generated_at, overall_score FROM runs ORDER BY generated_at DESC, id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT r.id, r.generated_at, c.score FROM category_scores c JOIN runs r ON r.id = c.run_id "
+            "WHERE c.name = ? ORDER BY r.generated_at DESC, r.id DESC LIMIT ?",
+            (category, limit),
+        ).fetchall()
+    return [ScorePoint(*row) for row in reversed(rows)]
+
+
+def page_score_trend(conn: sqlite3.Connection, route: str, limit: int = 30) -> list[ScorePoint]:
+    """
+    Content score history of one page, oldest first.
+
+    Args:
+        conn: Store connection
+        route: Page route, e.g. "/blog/my-post"
+        limit: Maximum number of most recent runs
+
+    Returns:
+        List of ScorePoint
+    """
+    rows = conn.execute(
+        "SELECT r.id, r.generated_at, p.score FROM page_scores p JOIN runs r ON r.id = p.run_id "
+        "WHERE p.route = ? ORDER BY r.generated_at DESC, r.id DESC LIMIT ?",
+        (route, limit),
+    ).fetchall()
+    return [ScorePoint(*row) for row in reversed(rows)]
+
+
+def _issue_difference(conn: sqlite3.Connection, present_run: int, absent_run: int) -> list[IssueRecord]:
+    rows = conn.execute(
+        """
+        SELECT i.issue_key, a.title, a.category, a.impact, i.page, a.fix_command
+        FROM issues i
+        JOIN actions a ON a.run_id = i.run_id AND a.issue_key = i.issue_key
+        WHERE i.run_id = ?
+          AND NOT EXISTS (
+            SELECT 1 FROM issues o
+            WHERE o.run_id = ? AND o.issue_key = i.issue_key AND o.page = i.page
+          )
+        ORDER BY a.priority DESC, a.category, i.page
+        """,
+        (present_run, absent_run),
+    ).fetchall()
+    return [IssueRecord(*row) for row in rows]
+
+
+def new_issues(conn: sqlite3.Connection, base_run: int, head_run: int) -> list[IssueRecord]:
+    """
+    Issues present in head_run but not in base_run.
+
+    Args:
+        conn: Store connection
+        base_run: Earlier run id
+        head_run: Later run id
+
+    Returns:
+        List of IssueRecord, highest priority first
+    """
+    return _issue_difference(conn, head_run, base_run)
+
+
+def resolved_issues(conn: sqlite3.Connection, base_run: int, head_run: int) -> list[IssueRecord]:
+    """
+    Issues present in base_run that are gone in head_run.
+
+    Args:
+        conn: Store connection
+        base_run: Earlier run id
+        head_run: Later run id
+
+    Returns:
+        List of IssueRecord, highest priority first
+    """
+    return _issue_difference(conn, base_run, head_run)
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Save every "seo analysis" run:
+```python
+from report_orchestrator import generate_seo_report
+from report_store import open_store, save_report
+
+conn = open_store()  # pseo-engine/outputs/seo_history.sqlite3
+save_report(conn, generate_seo_report(base_url="https://tolearn.blog"))
+```
+
+When the user asks "what changed since the last audit?":
+```python
+from report_store import latest_run_ids, new_issues, resolved_issues, score_trend
+
+head, base = latest_run_ids(conn, 2)
+for issue in new_issues(conn, base, head):
+    print(f"NEW  [{issue.impact}] {issue.title} {issue.page}")
+for issue in resolved_issues(conn, base, head):
+    print(f"DONE {issue.title} {issue.page}")
+
+print([p.score for p in score_trend(conn)])                   # overall
+print([p.score for p in score_trend(conn, "Content Quality")])
+```
+"""
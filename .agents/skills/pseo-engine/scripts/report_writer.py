@@ -0,0 +1,254 @@
+"""
+Report Writer Module for pSEO Engine
+
+This module streams an SEOReport to a file handle in one of three formats:
+
+- markdown: the human-readable report (same output as format_report_markdown)
+- jsonl: one JSON record per line, for diffing, grep and downstream tools
+- html: a single self-contained page (inline CSS, no external assets)
+
+Every writer emits records as it walks the report, so output time is linear
+in the number of actions and memory stays bounded by the largest single
+record. Unlike the markdown summary, the jsonl and html formats keep the
+full affected_pages list of every action.
+
+Usage by Claude:
+- Trigger: "seo analysis" when the user wants the report saved or shared
+- write_report(report, path) picks the format from the file extension
+"""
+
+from dataclasses import asdict
+from enum import Enum
+from html import escape
+from pathlib import Path
+from typing import Callable, Optional, TextIO, Union
+import json
+
+from seo_report import ActionItem, SEOReport, write_report_markdown
+
+
+JSONL_SCHEMA = "seo-report/1"
+
+FORMAT_EXTENSIONS = {
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".html": "html",
+    ".htm": "html",
+}
+
+
+def _json_default(value):
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _action_record(rank: int, action: ActionItem, quick_win: bool) -> dict:
+    record = {"type": "action", "rank": rank, "quick_win": quick_win}
+    record.update(asdict(action))
+    return record
+
+
+def write_report_jsonl(report: SEOReport, out: TextIO) -> None:
+    """
+    Stream the report as JSON Lines.
+
+    Record types, in order: report, category, action (ranked, full
+    affected_pages), content_stats, technical_health, keyword, page_score,
+    stage_timing.
+
+    Args:
+        report: The SEO report
+        out: Writable text handle
+    """
+    def emit(record: dict) -> None:
+        out.write(json.dumps(record, ensure_ascii=False, default=_json_default))
+        out.write("\n")
+
+    emit({
+        "type": "report",
+        "schema": JSONL_SCHEMA,
+        "generated_at": report.generated_at,
+        "overall_score": report.overall_score,
+        "status": report.status,
+        "executive_summary": report.executive_summary,
+        "action_count": len(report.all_actions),
+        "quick_win_count": len(report.quick_wins),
+    })
+
+    for category in report.category_scores:
+        emit({"type": "category", **asdict(category)})
+
+    quick_win_ids = {id(action) for action in report.quick_wins}
+    actions = report.priority_actions or report.all_actions
+    for rank, action in enumerate(actions, 1):
+        emit(_action_record(rank, action, id(action) in quick_win_ids))
+
+    if report.content_stats:
+        emit({"type": "content_stats", **report.content_stats})
+    if report.technical_health:
+        emit({"type": "technical_health", **report.technical_health})
+
+    for keyword in report.keyword_opportunities:
+        emit({"type": "keyword", "keyword": keyword})
+
+    for route, score in report.page_scores.items():
+        emit({"type": "page_score", "route": route, "score": score})
+
+    for stage, seconds in report.stage_timings.items():
+        emit({"type": "stage_timing", "stage": stage, "seconds": seconds})
+
+
+HTML_STYLE = """
+body{font:15px/1.5 system-ui,-apple-system,sans-serif;max-width:960px;margin:2rem auto;padding:0 1rem;color:#1f2328}
+h1,h2{border-bottom:1px solid #d0d7de;padding-bottom:.3rem}
+table{border-collapse:collapse;width:100%;margin:1rem 0}
+th,td{border:1px solid #d0d7de;padding:.4rem .6rem;text-align:left;vertical-align:top}
+th{background:#f6f8fa}
+.score{font-size:2rem;font-weight:700}
+.badge{display:inline-block;padding:0 .5rem;border-radius:1rem;font-size:.8rem;background:#eaeef2}
+.high{background:#ffebe9}.medium{background:#fff8c5}.low{background:#dafbe1}
+details summary{cursor:pointer}
+details ul{max-height:20rem;overflow:auto;margin:.3rem 0}
+""".strip()
+
+
+def write_report_html(report: SEOReport, out: TextIO) -> None:
+    """
+    Stream the report as a single self-contained HTML page.
+
+    Args:
+        report: The SEO report
+        out: Writable text handle
+    """
+    write = out.write
+    write(
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+        "<title>SEO Analysis Report</title>\n"
+        f"<style>{HTML_STYLE}</style>\n</head>\n<body>\n"
+        "<h1>Comprehensive SEO Analysis Report</h1>\n"
+        f"<p>Generated: {escape(report.generated_at)}</p>\n"
+        "<h2>Executive Summary</h2>\n"
+        f"<p><span class=\"score\">{report.overall_score}/100</span> "
+        f"<span class=\"badge\">{escape(report.status)}</span></p>\n"
+        f"<p>{escape(report.executive_summary)}</p>\n"
+    )
+
+    write("<h2>Category Breakdown</h2>\n<table>\n<tr><th>Category</th><th>Score</th><th>Passed/Total</th></tr>\n")
+    for cs in report.category_scores:
+        write(f"<tr><td>{escape(cs.name)}</td><td>{cs.score}/100</td><td>{cs.checks_passed}/{cs.checks_total}</td></tr>\n")
+    write("</table>\n")
+
+    quick_win_ids = {id(action) for action in report.quick_wins}
+    actions = report.priority_actions or report.all_actions
+    write(
+        f"<h2>Action Items ({len(actions)})</h2>\n<table>\n"
+        "<tr><th>#</th><th>Action</th><th>Impact</th><th>Effort</th><th>Category</th><th>Pages</th></tr>\n"
+    )
+    for rank, action in enumerate(actions, 1):
+        impact = action.impact.value
+        flags = ""
+        if id(action) in quick_win_ids:
+            flags += " <span class=\"badge low\">quick win</span>"
+        if action.auto_fixable:
+            flags += " <span class=\"badge\">auto-fixable</span>"
+        command = f"<br><code>{escape(action.fix_command)}</code>" if action.fix_command else ""
+        write(
+            f"<tr><td>{rank}</td><td><strong>{escape(action.title)}</strong>{flags}"
+            f"<br>{escape(action.description)}{command}</td>"
+            f"<td><span class=\"badge {impact}\">{impact}</span></td>"
+            f"<td>{action.effort.value}</td><td>{escape(action.category)}</td><td>"
+        )
+        if action.affected_pages:
+            write(f"<details><summary>{len(action.affected_pages)} pages</summary><ul>")
+            for page in action.affected_pages:
+                write(f"<li>{escape(page)}</li>")
+            write("</ul></details>")
+        write("</td></tr>\n")
+    write("</table>\n")
+
+    if report.content_stats:
+        write("<h2>Content Statistics</h2>\n<table>\n<tr><th>Metric</th><th>Value</th></tr>\n")
+        for key, value in report.content_stats.items():
+            write(f"<tr><td>{escape(key.replace('_', ' ').title())}</td><td>{escape(str(value))}</td></tr>\n")
+        write("</table>\n")
+
+    if report.keyword_opportunities:
+        write("<h2>Keyword Opportunities</h2>\n<ul>\n")
+        for keyword in report.keyword_opportunities:
+            write(f"<li>{escape(keyword)}</li>\n")
+        write("</ul>\n")
+
+    if report.stage_timings:
+        write("<h2>Stage Timings</h2>\n<table>\n<tr><th>Stage</th><th>Seconds</th></tr>\n")
+        for stage, seconds in report.stage_timings.items():
+            write(f"<tr><td>{escape(stage)}</td><td>{seconds:.2f}</td></tr>\n")
+        write("</table>\n")
+
+    write("</body>\n</html>\n")
+
+
+WRITERS: dict[str, Callable[[SEOReport, TextIO], None]] = {
+    "markdown": write_report_markdown,
+    "jsonl": write_report_jsonl,
+    "html": write_report_html,
+}
+
+
+def write_report(
+    report: SEOReport,
+    destination: Union[str, Path, TextIO],
+    fmt: Optional[str] = None
+) -> None:
+    """
+    Write a report to a path or an open text handle.
+
+    Args:
+        report: The SEO report
+        destination: Output path or writable text handle
+        fmt: "markdown", "jsonl" or "html" (default: from the path
+            extension, else markdown)
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt is None:
+        suffix = Path(destination).suffix.lower() if isinstance(destination, (str, Path)) else ""
+        fmt = FORMAT_EXTENSIONS.get(suffix, "markdown")
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown report format '{fmt}' (expected one of {', '.join(WRITERS)})")
+
+    writer = WRITERS[fmt]
+    if not isinstance(destination, (str, Path)):
+        writer(report, destination)
+        return
+
+    path = Path(destination)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="\n") as handle:
+        writer(report, handle)
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+After running the analysis, save the report in the format the user needs:
+
+```python
+from report_orchestrator import generate_seo_report
+from report_writer import write_report
+
+report = generate_seo_report(base_url="https://tolearn.blog")
+write_report(report, "outputs/seo-report.md")      # human summary
+write_report(report, "outputs/seo-report.jsonl")   # every action, every page
+write_report(report, "outputs/seo-report.html")    # shareable single file
+```
+
+Query the JSONL output without loading it all:
+```bash
+grep '"type": "action"' outputs/seo-report.jsonl | grep '"quick_win": true'
+```
+"""
@@ -0,0 +1,504 @@
+"""
+Robots Rules Module for pSEO Engine
+
+This module turns robots.txt into something the audit can reason about:
+
+- parse robots.txt (fetched, from the build, or rendered from app/robots.ts
+  the way Next.js serializes MetadataRoute.Robots)
+- pick the group for a crawler (longest matching user-agent, else "*")
+- compile the group's Allow/Disallow rules into a prefix trie: a path is
+  walked once and only rules whose literal prefix matches are considered;
+  the longest matching pattern wins and Allow wins ties (Google's rules,
+  including "*" and "$")
+- evaluate every sitemap URL and linked page in bulk
+- simulate a crawler with a fetch budget over the link graph and report
+  how many pSEO pages it reaches within N fetches
+
+Usage by Claude:
+- Trigger: "seo audit" (Robots.txt Accessibility), "check robots", "crawl budget"
+- load_robots() -> RobotsFile; robots.matcher("Googlebot").is_allowed(path)
+- simulate_crawl_budget(links, matcher, budget=1000) -> CrawlBudgetResult
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+import heapq
+import re
+
+from site_routes import BASE_URL, DEFAULT_PROJECT_ROOT, iter_pseo_routes
+
+
+ROBOTS_SOURCE = "app/robots.ts"
+
+DEFAULT_USER_AGENT = "Googlebot"
+DEFAULT_CRAWL_BUDGET = 1000
+
+# Link distance assigned to URLs a crawler learns from the sitemap
+SITEMAP_DEPTH = 2
+
+
+@dataclass
+class RobotsRule:
+    """One Allow or Disallow line"""
+    allow: bool
+    pattern: str
+
+    @property
+    def directive(self) -> str:
+        return f"{'Allow' if self.allow else 'Disallow'}: {self.pattern}"
+
+
+@dataclass
+class RobotsGroup:
+    """Rules shared by consecutive User-agent lines"""
+    user_agents: list[str] = field(default_factory=list)
+    rules: list[RobotsRule] = field(default_factory=list)
+    crawl_delay: Optional[float] = None
+
+
+@dataclass
+class RobotsFile:
+    """A parsed robots.txt"""
+    groups: list[RobotsGroup] = field(default_factory=list)
+    sitemaps: list[str] = field(default_factory=list)
+    host: Optional[str] = None
+    source: str = "robots.txt"
+
+    def group_for(self, user_agent: str) -> RobotsGroup:
+        """
+        Merge every group addressed to the crawler's most specific user-agent token.
+
+        Args:
+            user_agent: Crawler token, e.g. "Googlebot" or "Googlebot-Image"
+
+        Returns:
+            Merged RobotsGroup (empty if nothing applies: everything allowed)
+        """
+        token = user_agent.lower()
+        best, merged = "", RobotsGroup(user_agents=[user_agent])
+        for group in self.groups:
+            for agent in group.user_agents:
+                agent = agent.lower()
+                if agent != "*" and token.startswith(agent) and len(agent) > len(best):
+                    best = agent
+        wanted = best or "*"
+        for group in self.groups:
+            if wanted in (agent.lower() for agent in group.user_agents):
+                merged.rules.extend(group.rules)
+                if group.crawl_delay is not None:
+                    merged.crawl_delay = group.crawl_delay
+        return merged
+
+    def matcher(self, user_agent: str = DEFAULT_USER_AGENT) -> "RobotsMatcher":
+        group = self.group_for(user_agent)
+        return RobotsMatcher(group.rules, user_agent, group.crawl_delay)
+
+
+def parse_robots_txt(text: str, source: str = "robots.txt") -> RobotsFile:
+    """
+    Parse robots.txt text.
+
+    Args:
+        text: File contents
+        source: Where the text came from (for reports)
+
+    Returns:
+        RobotsFile
+    """
+    robots = RobotsFile(source=source)
+    group: Optional[RobotsGroup] = None
+    for raw in text.splitlines():
+        line = raw.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        key, _, value = line.partition(":")
+        key, value = key.strip().lower(), value.strip()
+        if key == "user-agent":
+            # Consecutive User-agent lines share one group
+            if group is None or group.rules or group.crawl_delay is not None:
+                group = RobotsGroup()
+                robots.groups.append(group)
+            group.user_agents.append(value)
+        elif key in ("allow", "disallow") and group is not None:
+            if value:  # an empty Disallow allows everything
+                group.rules.append(RobotsRule(allow=key == "allow", pattern=value))
+        elif key == "crawl-delay" and group is not None:
+            try:
+                group.crawl_delay = float(value)
+            except ValueError:
+                pass
+        elif key == "sitemap":
+            robots.sitemaps.append(value)
+        elif key == "host":
+            robots.host = value
+    return robots
+
+
+# --- app/robots.ts ---------------------------------------------------------
+
+_TS_STRING = re.compile(r"'([^']*)'|\"([^\"]*)\"|`([^`]*)`")
+
+
+def _ts_values(expression: str, constants: dict[str, list[str]]) -> list[str]:
+    expression = expression.strip()
+    if expression in constants:
+        return constants[expression]
+    return [next(value for value in match.groups() if value is not None) for match in _TS_STRING.finditer(expression)]
+
+
+def render_robots_ts(root: Path = DEFAULT_PROJECT_ROOT, base_url: str = BASE_URL, env: Optional[dict] = None) -> str:
+    """
+    Render app/robots.ts to robots.txt text the way Next.js serializes it.
+
+    Literal rule objects are read from the source; `cond ? {...} : {...}`
+    entries take the branch selected by the environment flag they test.
+
+    Args:
+        root: Repository root
+        base_url: Site origin for Sitemap/Host
+        env: Environment overrides (e.g. {"BLOCK_SEO_TOOL_BOTS": "true"})
+
+    Returns:
+        robots.txt text ("" if app/robots.ts does not exist)
+    """
+    path = root / ROBOTS_SOURCE
+    if not path.exists():
+        return ""
+    source = re.sub(r"//[^\n]*", "", path.read_text(encoding="utf-8"))
+    env = env or {}
+
+    constants = {
+        name: _ts_values(body, {})
+        for name, body in re.findall(r"const\s+(\w+)\s*=\s*(\[[^\]]*\])", source)
+    }
+    flags = {}
+    for name, variable, negated, expected in re.findall(
+        r"const\s+(\w+)\s*=\s*process\.env\.(\w+)\s*(!==|===)\s*'([^']*)'", source
+    ):
+        matches = env.get(variable) == expected
+        flags[name] = not matches if negated == "!==" else matches
+
+    rules_block = re.search(r"const\s+rules\s*=\s*\[(.*)\n  \]", source, re.S)
+    body = rules_block.group(1) if rules_block else ""
+    for name, value in flags.items():
+        body = re.sub(
+            rf"{name}\s*\?\s*(\{{[^{{}}]*\}})\s*:\s*(\{{[^{{}}]*\}})",
+            lambda match: match.group(1) if value else match.group(2),
+            body,
+        )
+
+    lines = []
+    for entry in re.finditer(r"\{([^{}]*)\}", body):
+        fields = dict(re.findall(r"(\w+)\s*:\s*(\[[^\]]*\]|'[^']*'|\"[^\"]*\"|\w+|[\d.]+)", entry.group(1)))
+        lines += [f"User-Agent: {agent}" for agent in _ts_values(fields.get("userAgent", "'*'"), constants)]
+        lines += [f"Allow: {value}" for value in _ts_values(fields.get("allow", ""), constants)]
+        lines += [f"Disallow: {value}" for value in _ts_values(fields.get("disallow", ""), constants)]
+        if "crawlDelay" in fields:
+            lines.append(f"Crawl-delay: {fields['crawlDelay']}")
+        lines.append("")
+    if re.search(r"\bhost\s*:", source):
+        lines.append(f"Host: {urlsplit(base_url).netloc}")
+    if re.search(r"\bsitemap\s*:", source):
+        lines.append(f"Sitemap: {base_url.rstrip('/')}/sitemap.xml")
+    return "\n".join(lines) + "\n"
+
+
+def load_robots(root: Path = DEFAULT_PROJECT_ROOT, text: Optional[str] = None, source: Optional[str] = None) -> RobotsFile:
+    """
+    Parse served robots.txt text, or render app/robots.ts when none is given.
+
+    Args:
+        root: Repository root
+        text: robots.txt as fetched or built
+        source: Label for the text
+
+    Returns:
+        RobotsFile
+    """
+    if text is not None:
+        return parse_robots_txt(text, source or "robots.txt")
+    return parse_robots_txt(render_robots_ts(root), ROBOTS_SOURCE)
+
+
+# --- Matching --------------------------------------------------------------
+
+class _TrieNode:
+    __slots__ = ("children", "rules")
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.rules: list[tuple[RobotsRule, Optional[re.Pattern]]] = []
+
+
+def _pattern_regex(pattern: str) -> re.Pattern:
+    anchored = pattern.endswith("$")
+    body = pattern[:-1] if anchored else pattern
+    return re.compile("".join(".*" if char == "*" else re.escape(char) for char in body) + (r"\Z" if anchored else ""))
+
+
+class RobotsMatcher:
+    """
+    Allow/Disallow rules of one group compiled into a prefix trie.
+
+    Each rule is stored under its literal prefix (the pattern up to the
+    first "*" or "$"). Matching walks the path once; rules without
+    wildcards match by reaching their node, the rest are confirmed with
+    their compiled regex.
+
+    Args:
+        rules: Rules of the group
+        user_agent: Crawler the group was selected for
+        crawl_delay: Crawl-delay of the group
+    """
+
+    def __init__(self, rules: Iterable[RobotsRule], user_agent: str = DEFAULT_USER_AGENT, crawl_delay: Optional[float] = None):
+        self.user_agent = user_agent
+        self.crawl_delay = crawl_delay
+        self.root = _TrieNode()
+        self.size = 0
+        for rule in rules:
+            literal = re.split(r"[*$]", rule.pattern, 1)[0]
+            node = self.root
+            for char in literal:
+                node = node.children.setdefault(char, _TrieNode())
+            regex = None if literal == rule.pattern else _pattern_regex(rule.pattern)
+            node.rules.append((rule, regex))
+            self.size += 1
+
+    def match(self, path: str) -> Optional[RobotsRule]:
+        """
+        The rule deciding path (longest pattern; Allow wins ties).
+
+        Args:
+            path: Path with optional query string
+
+        Returns:
+            Deciding RobotsRule, or None if no rule matches (allowed)
+        """
+        best: Optional[RobotsRule] = None
+        node: Optional[_TrieNode] = self.root
+        index = 0
+        while node is not None:
+            for rule, regex in node.rules:
+                if regex is not None and not regex.match(path):
+                    continue
+                if best is None or (len(rule.pattern), rule.allow) > (len(best.pattern), best.allow):
+                    best = rule
+            if index == len(path):
+                break
+            node = node.children.get(path[index])
+            index += 1
+        return best
+
+    def is_allowed(self, path: str) -> bool:
+        rule = self.match(path)
+        return rule is None or rule.allow
+
+
+@dataclass
+class RobotsEvaluation:
+    """Bulk evaluation of paths against one crawler's rules"""
+    user_agent: str
+    checked: int = 0
+    allowed: int = 0
+    blocked: dict[str, str] = field(default_factory=dict)  # path -> deciding directive
+
+
+def evaluate_paths(matcher: RobotsMatcher, paths: Iterable[str]) -> RobotsEvaluation:
+    """
+    Evaluate every path once against the compiled rules.
+
+    Args:
+        matcher: Compiled group
+        paths: Paths or absolute URLs (duplicates are evaluated once)
+
+    Returns:
+        RobotsEvaluation
+    """
+    evaluation = RobotsEvaluation(user_agent=matcher.user_agent)
+    seen = set()
+    for value in paths:
+        parts = urlsplit(value)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        if path in seen:
+            continue
+        seen.add(path)
+        evaluation.checked += 1
+        rule = matcher.match(path)
+        if rule is None or rule.allow:
+            evaluation.allowed += 1
+        else:
+            evaluation.blocked[path] = rule.directive
+    return evaluation
+
+
+# --- Crawl budget ----------------------------------------------------------
+
+@dataclass
+class CrawlBudgetResult:
+    """What a crawler with a fixed number of fetches reaches"""
+    user_agent: str
+    budget: int
+    fetched: int = 0
+    discovered: int = 0
+    blocked: int = 0
+    targets: int = 0
+    targets_reached: int = 0
+    reach_curve: list[tuple[int, int]] = field(default_factory=list)  # (fetches, targets reached)
+    unreached_targets: list[str] = field(default_factory=list)
+    crawl_delay: Optional[float] = None
+
+    @property
+    def estimated_seconds(self) -> Optional[float]:
+        """Wall time for the fetches at the group's Crawl-delay (if any)."""
+        return self.fetched * self.crawl_delay if self.crawl_delay else None
+
+
+def pseo_targets(root: Path = DEFAULT_PROJECT_ROOT) -> set[str]:
+    """Paths of every pSEO template and solution page."""
+    return {entry.path for entry in iter_pseo_routes(root)}
+
+
+def simulate_crawl_budget(
+    links: dict[str, list[str]],
+    matcher: RobotsMatcher,
+    budget: int = DEFAULT_CRAWL_BUDGET,
+    seeds: Iterable[str] = ("/",),
+    sitemap_paths: Iterable[str] = (),
+    targets: Optional[set[str]] = None,
+    sitemap_depth: int = SITEMAP_DEPTH,
+    checkpoints: int = 10,
+    limit: Optional[int] = 100
+) -> CrawlBudgetResult:
+    """
+    Simulate a crawler spending a fixed number of fetches on the site.
+
+    The frontier is ordered by link distance from the seeds (breadth-first);
+    sitemap URLs enter at sitemap_depth. Disallowed URLs are discovered but
+    never fetched and cost nothing.
+
+    Args:
+        links: Link graph, path -> outgoing internal paths (redirect
+            targets count as links)
+        matcher: Compiled robots group of the crawler
+        budget: Fetches the crawler will make
+        seeds: Entry points (depth 0)
+        sitemap_paths: Paths listed in the sitemap
+        targets: Pages to count (defaults to every pSEO page)
+        sitemap_depth: Depth assigned to sitemap URLs
+        checkpoints: Points recorded on the reach curve
+        limit: Maximum unreached targets listed
+
+    Returns:
+        CrawlBudgetResult
+    """
+    targets = pseo_targets() if targets is None else targets
+    result = CrawlBudgetResult(
+        user_agent=matcher.user_agent,
+        budget=budget,
+        targets=len(targets),
+        crawl_delay=matcher.crawl_delay,
+    )
+    frontier: list[tuple[int, int, str]] = []
+    queued: set[str] = set()
+    sequence = 0
+
+    def discover(path: str, depth: int) -> None:
+        nonlocal sequence
+        if path in queued:
+            return
+        queued.add(path)
+        if not matcher.is_allowed(path):
+            result.blocked += 1
+            return
+        heapq.heappush(frontier, (depth, sequence, path))
+        sequence += 1
+
+    for path in seeds:
+        discover(path, 0)
+    for path in sitemap_paths:
+        discover(path, sitemap_depth)
+
+    reached: set[str] = set()
+    step = max(1, budget // max(1, checkpoints))
+    while frontier and result.fetched < budget:
+        depth, _, path = heapq.heappop(frontier)
+        result.fetched += 1
+        if path in targets:
+            reached.add(path)
+        for target in links.get(path, ()):
+            discover(target, depth + 1)
+        if result.fetched % step == 0:
+            result.reach_curve.append((result.fetched, len(reached)))
+
+    if not result.reach_curve or result.reach_curve[-1][0] != result.fetched:
+        result.reach_curve.append((result.fetched, len(reached)))
+    result.discovered = len(queued)
+    result.targets_reached = len(reached)
+    unreached = sorted(targets - reached)
+    result.unreached_targets = unreached[:limit] if limit else unreached
+    return result
+
+
+def link_graph_from_pages(pages: Iterable) -> dict[str, list[str]]:
+    """
+    Link graph of audited pages (links plus redirect targets).
+
+    Args:
+        pages: page_facts.PageFacts
+
+    Returns:
+        path -> outgoing internal paths
+    """
+    graph: dict[str, list[str]] = {}
+    for page in pages:
+        targets = list(page.links)
+        if page.location and page.location.startswith("/"):
+            targets.append(page.location)
+        graph[page.path] = targets
+    return graph
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Check the rules app/robots.ts produces:
+
+```python
+from robots_rules import evaluate_paths, load_robots
+from site_routes import iter_site_routes
+
+robots = load_robots()  # or load_robots(text=fetched_robots_txt)
+googlebot = robots.matcher("Googlebot")
+evaluation = evaluate_paths(googlebot, (entry.path for entry in iter_site_routes()))
+print(f"{evaluation.allowed}/{evaluation.checked} routes crawlable by Googlebot")
+for path, rule in list(evaluation.blocked.items())[:20]:
+    print("BLOCKED", path, "by", rule)
+```
+
+Crawl budget over a crawl's link graph:
+
+```python
+import asyncio
+from robots_rules import link_graph_from_pages, simulate_crawl_budget
+from site_crawler import crawl_site
+
+snapshot, _ = asyncio.run(crawl_site("http://localhost:3000"))
+result = simulate_crawl_budget(
+    link_graph_from_pages(snapshot.pages.values()),
+    googlebot,
+    budget=500,
+    sitemap_paths=snapshot.sitemap_paths,
+)
+print(f"{result.targets_reached}/{result.targets} pSEO pages within {result.fetched} fetches")
+print(result.reach_curve)
+```
+
+- pSEO pages that are only reachable deep in the graph need hub links
+  (`build internal links`) or earlier sitemap placement
+- `render_robots_ts(env={"BLOCK_SEO_TOOL_BOTS": "true"})` previews the
+  blocking variant
+"""
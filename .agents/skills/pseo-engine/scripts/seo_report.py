@@ -13,8 +13,11 @@ Usage by Claude:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TextIO
 from enum import Enum
+import heapq
+import io
+import re
 
 
 class ImpactLevel(Enum):
@@ -68,6 +71,13 @@ class SEOReport:
     content_stats: dict = field(default_factory=dict)
     technical_health: dict = field(default_factory=dict)
     keyword_opportunities: list[str] = field(default_factory=list)
+    stage_timings: dict = field(default_factory=dict)  # stage name -> seconds
+    page_scores: dict = field(default_factory=dict)  # route -> content SEO score
+
+
+_IMPACT_RANK = {ImpactLevel.LOW: 1, ImpactLevel.MEDIUM: 2, ImpactLevel.HIGH: 3}
+
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
 
 
 def calculate_priority_score(item: ActionItem) -> float:
@@ -98,17 +108,96 @@ def calculate_priority_score(item: ActionItem) -> float:
     return impact_weights[item.impact] * effort_weights[item.effort]
 
 
-def prioritize_actions(actions: list[ActionItem]) -> list[ActionItem]:
+def _priority_key(item: ActionItem) -> tuple[float, int]:
+    # Ties are broken by reach: a grouped issue on 40 pages beats one on 2
+    return calculate_priority_score(item), len(item.affected_pages)
+
+
+def prioritize_actions(actions: list[ActionItem], limit: Optional[int] = None) -> list[ActionItem]:
     """
     Sort actions by priority score.
 
     Args:
         actions: List of action items
+        limit: Only return the top N (selected with a heap, O(n log N))
 
     Returns:
         Sorted list (highest priority first)
     """
-    return sorted(actions, key=calculate_priority_score, reverse=True)
+    if limit is not None:
+        return heapq.nlargest(limit, actions, key=_priority_key)
+    return sorted(actions, key=_priority_key, reverse=True)
+
+
+def normalize_action_title(title: str) -> str:
+    """
+    Mask the numbers in an action title.
+
+    "Meta description too long (208 chars)" and "... (176 chars)" are the
+    same issue type; both normalize to "meta description too long (# chars)".
+
+    Args:
+        title: Action title
+
+    Returns:
+        Lowercased title with numbers replaced by "#"
+    """
+    return _NUMBER_PATTERN.sub("#", title.strip().lower())
+
+
+def _merge_numbers(texts: list[str]) -> str:
+    # Keep numbers shared by every text ("2-3 related posts"), mask the rest
+    # with the "#" normalize_action_title() uses, so the merged title keeps
+    # the issue_key of its members
+    first = texts[0]
+    numbers = [_NUMBER_PATTERN.findall(text) for text in texts]
+    if any(len(n) != len(numbers[0]) for n in numbers):
+        return first
+    slots = iter(
+        values[0] if len(set(values)) == 1 else "#"
+        for values in zip(*numbers)
+    )
+    return _NUMBER_PATTERN.sub(lambda _: next(slots), first)
+
+
+def group_actions(actions: list[ActionItem]) -> list[ActionItem]:
+    """
+    Merge per-page duplicates into one action per issue type.
+
+    Actions are grouped on (category, normalized title, fix_command). Each
+    group keeps the highest impact, the union of affected pages (in first-
+    seen order) and is auto-fixable only if every member is. Numbers that
+    differ between members' titles are shown as "#".
+
+    Args:
+        actions: Flat list of action items, typically one per page issue
+
+    Returns:
+        One ActionItem per issue type, in first-seen order
+    """
+    groups: dict[tuple, list[ActionItem]] = {}
+    for action in actions:
+        key = (action.category, normalize_action_title(action.title), action.fix_command)
+        groups.setdefault(key, []).append(action)
+
+    grouped = []
+    for members in groups.values():
+        first = members[0]
+        if len(members) == 1:
+            grouped.append(first)
+            continue
+
+        grouped.append(ActionItem(
+            title=_merge_numbers([m.title for m in members]),
+            description=_merge_numbers([m.description for m in members]),
+            impact=max((m.impact for m in members), key=_IMPACT_RANK.__getitem__),
+            effort=first.effort,
+            category=first.category,
+            auto_fixable=all(m.auto_fixable for m in members),
+            affected_pages=list(dict.fromkeys(page for m in members for page in m.affected_pages)),
+            fix_command=first.fix_command,
+        ))
+    return grouped
 
 
 def identify_quick_wins(actions: list[ActionItem]) -> list[ActionItem]:
@@ -204,17 +293,19 @@ def calculate_overall_score(category_scores: list[CategoryScore]) -> tuple[int,
     return score, status
 
 
-def format_report_markdown(report: SEOReport) -> str:
+def write_report_markdown(report: SEOReport, out: TextIO) -> None:
     """
-    Format report as markdown.
+    Stream the markdown report to a text handle.
+
+    Each section is written as it is produced, so rendering time is linear
+    in the number of actions and nothing is held beyond the current line.
 
     Args:
         report: The SEO report
-
-    Returns:
-        Formatted markdown string
+        out: Writable text handle (file, sys.stdout, io.StringIO)
     """
-    md = f"""# Comprehensive SEO Analysis Report
+    write = out.write
+    write(f"""# Comprehensive SEO Analysis Report
 
 Generated: {report.generated_at}
 
@@ -230,34 +321,34 @@ Generated: {report.generated_at}
 
 | Category | Score | Passed/Total |
 |----------|-------|--------------|
-"""
+""")
 
     for cs in report.category_scores:
-        md += f"| {cs.name} | {cs.score}/100 | {cs.checks_passed}/{cs.checks_total} |\n"
+        write(f"| {cs.name} | {cs.score}/100 | {cs.checks_passed}/{cs.checks_total} |\n")
 
-    md += """
+    write("""
 ---
 
 ## Quick Wins (Do These Now)
 
-"""
+""")
     if report.quick_wins:
         for i, qw in enumerate(report.quick_wins, 1):
             auto = " [Auto-fixable]" if qw.auto_fixable else ""
-            md += f"{i}. **{qw.title}**{auto}\n"
-            md += f"   - Impact: {qw.impact.value.title()}\n"
-            md += f"   - {qw.description}\n\n"
+            write(f"{i}. **{qw.title}**{auto}\n")
+            write(f"   - Impact: {qw.impact.value.title()}\n")
+            write(f"   - {qw.description}\n\n")
     else:
-        md += "No quick wins identified.\n"
+        write("No quick wins identified.\n")
 
-    md += """
+    write("""
 ---
 
 ## Priority Action Items
 
-"""
+""")
     for i, action in enumerate(report.priority_actions[:10], 1):
-        md += f"""### {i}. {action.title}
+        write(f"""### {i}. {action.title}
 
 - **Impact**: {action.impact.value.title()}
 - **Effort**: {action.effort.value.title()}
@@ -265,43 +356,55 @@ Generated: {report.generated_at}
 
 {action.description}
 
-"""
+""")
         if action.affected_pages:
-            md += "**Affected pages:**\n"
+            write("**Affected pages:**\n")
             for page in action.affected_pages[:5]:
-                md += f"- {page}\n"
+                write(f"- {page}\n")
             if len(action.affected_pages) > 5:
-                md += f"- ... and {len(action.affected_pages) - 5} more\n"
-            md += "\n"
+                write(f"- ... and {len(action.affected_pages) - 5} more\n")
+            write("\n")
 
-    md += """
+    write("""
 ---
 
 ## Content Statistics
 
-"""
+""")
     if report.content_stats:
-        md += f"""| Metric | Value |
+        write(f"""| Metric | Value |
 |--------|-------|
 | Total Posts | {report.content_stats.get('total_posts', 'N/A')} |
 | Average Score | {report.content_stats.get('average_score', 'N/A')}/100 |
 | Posts with Schema | {report.content_stats.get('with_schema', 'N/A')} |
 | Posts needing updates | {report.content_stats.get('needs_update', 'N/A')} |
-"""
+""")
 
-    md += """
+    write("""
 ---
 
 ## Keyword Opportunities
 
-"""
+""")
     if report.keyword_opportunities:
         for kw in report.keyword_opportunities[:5]:
-            md += f"- {kw}\n"
+            write(f"- {kw}\n")
     else:
-        md += "Run `keyword research [topic]` to discover opportunities.\n"
+        write("Run `keyword research [topic]` to discover opportunities.\n")
 
-    md += """
+    if report.stage_timings:
+        write("""
+---
+
+## Stage Timings
+
+| Stage | Seconds |
+|-------|---------|
+""")
+        for stage, seconds in report.stage_timings.items():
+            write(f"| {stage} | {seconds:.2f} |\n")
+
+    write("""
 ---
 
 ## Available Actions
@@ -312,9 +415,22 @@ Generated: {report.generated_at}
 | `optimize content [path]` | Deep-dive on specific content |
 | `build internal links` | Get internal link suggestions |
 | `generate pseo` | Create programmatic SEO pages |
-"""
+""")
+
+
+def format_report_markdown(report: SEOReport) -> str:
+    """
+    Format report as markdown.
 
-    return md
+    Args:
+        report: The SEO report
+
+    Returns:
+        Formatted markdown string
+    """
+    buffer = io.StringIO()
+    write_report_markdown(report, buffer)
+    return buffer.getvalue()
 
 
 # Usage documentation for Claude
@@ -0,0 +1,528 @@
+"""
+Site Crawler Module for pSEO Engine
+
+This module crawls a running site (typically `next start` on localhost)
+and runs every check declared in technical_seo_audit.BASE_CHECKS and
+EXTENDED_CHECKS against what it finds.
+
+The HTTP client is asyncio-native and stdlib-only:
+- Keep-alive connection pool per host (HTTP/1.1, chunked and gzip aware)
+- Global concurrency limit (asyncio.Semaphore)
+- Per-host rate limit (minimum interval between request starts)
+- Redirects are recorded, not followed, so chains can be analyzed
+- Conditional GETs against an on-disk cache (http_cache), so repeat
+  audits only transfer pages that changed
+- Every HTML page is recorded in the snapshot store (snapshot_store), so
+  it can be re-analyzed or diffed later without a server
+
+Usage by Claude:
+- Trigger: "seo audit" / "SEO诊断" against a local or staging build
+- run_site_audit("http://localhost:3000") -> AuditReport
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+from urllib.parse import urljoin, urlsplit
+import asyncio
+import gzip
+import ssl
+import time
+import xml.etree.ElementTree as ET
+import zlib
+
+from http_cache import DEFAULT_CACHE_DIR, STORED_HEADERS, HTTPCache
+from snapshot_store import DEFAULT_SNAPSHOT_DIR, SnapshotStore
+from page_facts import PageFacts, PageFactsParser, internal_hosts, normalize_page_path
+from audit_scoring import LiveScore, ScoreBoard
+from technical_seo_audit import (
+    BASE_CHECKS,
+    EXTENDED_CHECKS,
+    AuditReport,
+    SEOCheck,
+    SiteSnapshot,
+    build_audit_report,
+    run_declared_checks,
+)
+
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS_PER_SECOND = 100.0
+DEFAULT_MAX_PAGES = 5000
+REQUEST_TIMEOUT_SECONDS = 15
+MAX_SITEMAPS = 100  # nested sitemap index files followed
+
+USER_AGENT = "pseo-engine-audit/1.0 (+https://tolearn.blog)"
+
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# Failures of a single fetch; the URL is recorded as an error and the crawl
+# goes on (asyncio.IncompleteReadError is an EOFError, not an OSError)
+FETCH_ERRORS = (OSError, EOFError, asyncio.TimeoutError, ValueError, zlib.error)
+
+
+@dataclass
+class HTTPResponse:
+    """A fully read HTTP response"""
+    url: str
+    status: int
+    headers: dict[str, str]  # lowercase names
+    body: bytes
+    elapsed_ms: float
+    from_cache: bool = False  # 304 answered with the cached body
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+
+class HostRateLimiter:
+    """
+    Spaces request starts to the same host at least 1/rate seconds apart.
+
+    Args:
+        requests_per_second: Per-host rate (0 or None disables limiting)
+    """
+
+    def __init__(self, requests_per_second: Optional[float]):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_slot: dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class ConnectionPool:
+    """
+    Minimal HTTP/1.1 client that reuses connections per (scheme, host, port).
+
+    Args:
+        concurrency: Maximum requests in flight across all hosts
+        requests_per_second: Per-host rate limit
+        timeout: Seconds per request
+        cache: Revalidate GETs against this cache and store new bodies in it
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        requests_per_second: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+        cache: Optional[HTTPCache] = None
+    ):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._limiter = HostRateLimiter(requests_per_second)
+        self._idle: dict[tuple, list[_Connection]] = {}
+        self._ssl = ssl.create_default_context()
+        self.timeout = timeout
+        self.cache = cache
+        self.requests = 0
+        self.connections_opened = 0
+        self.bytes_received = 0  # body bytes on the wire
+
+    async def __aenter__(self) -> "ConnectionPool":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for connections in self._idle.values():
+            for conn in connections:
+                conn.writer.close()
+        self._idle.clear()
+
+    async def _connect(self, key: tuple) -> _Connection:
+        scheme, host, port = key
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=self._ssl if scheme == "https" else None
+        )
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        revalidate: bool = True
+    ) -> HTTPResponse:
+        """
+        Send one request and read the whole response.
+
+        Args:
+            method: "GET" or "HEAD"
+            url: Absolute http(s) URL
+            headers: Extra request headers
+            revalidate: Send the cache's validators (False forces a full
+                download that still refreshes the cache)
+
+        Returns:
+            HTTPResponse (body decompressed if gzip/deflate encoded; a 304 to
+            a cache revalidation is returned as the cached response)
+        """
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        lines = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            f"User-Agent: {USER_AGENT}",
+            "Accept-Encoding: gzip, deflate",
+            "Connection: keep-alive",
+        ]
+        headers = dict(headers or {})
+        use_cache = self.cache is not None and method == "GET" and not headers
+        if use_cache and revalidate:
+            headers.update(self.cache.conditional_headers(url))
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        async with self._semaphore:
+            await self._limiter.wait(parts.hostname or "")
+            self.requests += 1
+            started = time.perf_counter()
+
+            # A pooled connection may have been closed by the server; retry once fresh
+            for attempt in (0, 1):
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle and attempt == 0 else await self._connect(key)
+                try:
+                    conn.writer.write(payload)
+                    await conn.writer.drain()
+                    status, response_headers, body, reusable = await asyncio.wait_for(
+                        self._read_response(conn.reader, method), self.timeout
+                    )
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError, OSError):
+                    conn.writer.close()
+                    if attempt:
+                        raise
+                except BaseException:
+                    conn.writer.close()
+                    raise
+
+            elapsed = (time.perf_counter() - started) * 1000
+            if reusable:
+                self._idle.setdefault(key, []).append(conn)
+            else:
+                conn.writer.close()
+
+        self.bytes_received += len(body)
+        if use_cache and status == 304:
+            cached = self.cache.load(url)
+            if cached is not None:
+                refreshed = {name: response_headers[name] for name in STORED_HEADERS if name in response_headers}
+                return HTTPResponse(url, cached.status, {**cached.headers, **refreshed}, cached.body, elapsed, True)
+            # The stored body is gone or corrupt; a bodiless 304 is not the page
+            return await self.request(method, url, revalidate=False)
+
+        encoding = response_headers.get("content-encoding", "")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        if use_cache:
+            self.cache.store(url, status, response_headers, body)
+        return HTTPResponse(url, status, response_headers, body, elapsed)
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader, method: str) -> tuple[int, dict, bytes, bool]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed before response")
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+        status = int(status)
+
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        reusable = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return status, headers, b"", reusable
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass  # trailers
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            return status, headers, b"".join(chunks), reusable
+
+        if "content-length" in headers:
+            return status, headers, await reader.readexactly(int(headers["content-length"])), reusable
+
+        return status, headers, await reader.read(), False
+
+
+@dataclass
+class CrawlStats:
+    """Counters for one crawl"""
+    pages: int = 0
+    requests: int = 0
+    connections_opened: int = 0
+    revalidated: int = 0  # requests answered 304 from the HTTP cache
+    snapshots: int = 0  # pages recorded in the snapshot store
+    bytes_received: int = 0
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def _page_facts(path: str, response: HTTPResponse, hosts: tuple[str, ...]) -> PageFacts:
+    facts = PageFacts(
+        path=path,
+        status=response.status,
+        response_ms=round(response.elapsed_ms, 1),
+        content_type=response.headers.get("content-type", ""),
+        content_encoding=response.headers.get("content-encoding", ""),
+    )
+    if 300 <= response.status < 400 and "location" in response.headers:
+        location = urlsplit(urljoin(response.url, response.headers["location"]))
+        facts.location = (location.path.rstrip("/") or "/") if location.hostname in hosts else urljoin(
+            response.url, response.headers["location"]
+        )
+    elif response.status == 200 and "html" in facts.content_type:
+        parser = PageFactsParser(facts, response.url, hosts)
+        parser.feed(response.body.decode("utf-8", errors="replace"))
+        parser.close()
+    return facts
+
+
+async def _fetch_text(pool: ConnectionPool, url: str, stats: CrawlStats) -> tuple[Optional[int], Optional[str]]:
+    try:
+        response = await pool.request("GET", url)
+    except FETCH_ERRORS as error:
+        stats.errors.append(f"{url}: {error}")
+        return None, None
+    text = response.body.decode("utf-8", errors="replace") if response.status == 200 else None
+    return response.status, text
+
+
+async def _fetch_sitemap_urls(pool: ConnectionPool, base_url: str, stats: CrawlStats) -> tuple[Optional[int], list[str]]:
+    status = None
+    urls: list[str] = []
+    queue = [urljoin(base_url, "/sitemap.xml")]
+    fetched = 0
+
+    while queue and fetched < MAX_SITEMAPS:
+        sitemap_url = queue.pop(0)
+        fetched += 1
+        try:
+            response = await pool.request("GET", sitemap_url)
+        except FETCH_ERRORS as error:
+            stats.errors.append(f"{sitemap_url}: {error}")
+            continue
+        if fetched == 1:
+            status = response.status
+        if response.status != 200:
+            continue
+
+        body = response.body
+        if body[:2] == b"\x1f\x8b":
+            body = gzip.decompress(body)
+        try:
+            root = ET.fromstring(body)
+        except ET.ParseError as error:
+            stats.errors.append(f"{sitemap_url}: {error}")
+            continue
+
+        locs = [loc.text.strip() for loc in root.iter(f"{SITEMAP_NS}loc") if loc.text]
+        if root.tag == f"{SITEMAP_NS}sitemapindex":
+            # Child sitemaps may point at the production host; fetch them from base_url
+            queue.extend(urljoin(base_url, urlsplit(loc).path) for loc in locs)
+        else:
+            urls.extend(locs)
+
+    return status, urls
+
+
+async def crawl_site(
+    base_url: str,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_second: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    start_paths: Optional[list[str]] = None,
+    cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR,
+    snapshot_dir: Optional[Union[str, Path]] = DEFAULT_SNAPSHOT_DIR
+) -> tuple[SiteSnapshot, CrawlStats]:
+    """
+    Crawl a site breadth-first from "/" plus every sitemap URL.
+
+    Args:
+        base_url: Origin to crawl, e.g. "http://localhost:3000"
+        max_pages: Stop after this many URLs
+        concurrency: Requests in flight
+        requests_per_second: Per-host rate limit (None for unlimited)
+        start_paths: Extra paths to seed the crawl with
+        cache_dir: HTTP cache directory (None to always download in full)
+        snapshot_dir: Snapshot store for the HTML pages (None to not keep them)
+
+    Returns:
+        Tuple of (SiteSnapshot, CrawlStats)
+    """
+    base_url = base_url.rstrip("/")
+    hosts = internal_hosts(base_url)
+    snapshot = SiteSnapshot(base_url=base_url, source="crawl")
+    stats = CrawlStats()
+    started = time.perf_counter()
+
+    cache = HTTPCache(cache_dir) if cache_dir is not None else None
+    store = SnapshotStore(snapshot_dir) if snapshot_dir is not None else None
+    async with ConnectionPool(concurrency, requests_per_second, cache=cache) as pool:
+        (snapshot.robots_status, snapshot.robots_txt), (snapshot.sitemap_status, snapshot.sitemap_urls) = await asyncio.gather(
+            _fetch_text(pool, f"{base_url}/robots.txt", stats),
+            _fetch_sitemap_urls(pool, base_url, stats),
+        )
+
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        seen: set[str] = set()
+
+        def enqueue(path: str) -> None:
+            if path not in seen and len(seen) < max_pages:
+                seen.add(path)
+                queue.put_nowait(path)
+
+        for path in ["/", *(start_paths or []), *sorted(snapshot.sitemap_paths)]:
+            enqueue(path)
+
+        async def worker() -> None:
+            while True:
+                path = await queue.get()
+                try:
+                    response = await pool.request("GET", base_url + path)
+                    facts = _page_facts(path, response, hosts)
+                    snapshot.pages[path] = facts
+                    if store is not None and response.status == 200 and "html" in facts.content_type:
+                        # Hashing and compression run off the event loop; only the index write is here
+                        blob = await asyncio.to_thread(store.write_blob, response.body)
+                        store.record(response.url, blob, collection="crawl", content_type=facts.content_type)
+                        stats.snapshots += 1
+                    for link in facts.links:
+                        enqueue(link)
+                    # Follow hreflang alternates and canonicals so their targets get checked
+                    targets = list(facts.hreflang.values())
+                    if facts.canonical:
+                        targets.append(facts.canonical)
+                    for href in targets:
+                        target = normalize_page_path(href, base_url + path, hosts)
+                        if target:
+                            enqueue(target)
+                    if facts.location and facts.location.startswith("/"):
+                        enqueue(facts.location)
+                except FETCH_ERRORS as error:
+                    stats.errors.append(f"{path}: {error}")
+                except Exception as error:
+                    # Parser or store failures on one page; a dead worker would stall queue.join()
+                    stats.errors.append(f"{path}: {type(error).__name__}: {error}")
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        await queue.join()
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        stats.requests = pool.requests
+        stats.connections_opened = pool.connections_opened
+        stats.bytes_received = pool.bytes_received
+
+    if cache is not None:
+        stats.revalidated = cache.session.revalidated
+        cache.close()
+    if store is not None:
+        store.close()
+
+    stats.pages = len(snapshot.pages)
+    stats.seconds = round(time.perf_counter() - started, 3)
+    return snapshot, stats
+
+
+async def audit_site(
+    base_url: str,
+    on_score: Optional[Callable[[SEOCheck, LiveScore], None]] = None,
+    route_paths: Optional[Iterable[str]] = None,
+    **crawl_options
+) -> tuple[AuditReport, CrawlStats]:
+    """
+    Crawl a site and run every declared check.
+
+    Args:
+        base_url: Origin to crawl
+        on_score: Called after each check with the live weighted score
+        route_paths: Routes the sitemap should list (defaults to
+            site_routes when the crawled site is this repository's)
+        **crawl_options: Passed to crawl_site()
+
+    Returns:
+        Tuple of (AuditReport, CrawlStats)
+    """
+    snapshot, stats = await crawl_site(base_url, **crawl_options)
+    snapshot.route_paths = route_paths
+    board = ScoreBoard(expected=len(BASE_CHECKS) + len(EXTENDED_CHECKS))
+    checks = run_declared_checks(snapshot, on_score, board)
+    return build_audit_report(checks, board), stats
+
+
+def run_site_audit(base_url: str = "http://localhost:3000", **crawl_options) -> AuditReport:
+    """Synchronous entry point for audit_site()."""
+    report, _ = asyncio.run(audit_site(base_url, **crawl_options))
+    return report
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+When user triggers "seo audit" and a build can be served locally:
+
+```bash
+npm run build && npx next start -p 3000 &
+```
+
+```python
+import asyncio
+from site_crawler import audit_site
+from technical_seo_audit import get_status_emoji
+
+report, stats = asyncio.run(audit_site("http://localhost:3000", concurrency=16))
+print(f"{report.overall_score}/100 {report.status} - "
+      f"{stats.pages} pages, {stats.requests} requests over "
+      f"{stats.connections_opened} connections in {stats.seconds}s")
+
+for check in report.priority_fixes:
+    print(get_status_emoji(check.status), check.name, "-", check.message)
+```
+
+- Against production, lower the rate: `requests_per_second=5`
+- `check.details` carries full page lists (broken links, orphans, etc.)
+- Repeat runs revalidate with ETag/Last-Modified: `stats.revalidated`
+  pages came back 304, `stats.bytes_received` is what actually moved;
+  pass `cache_dir=None` to bypass the cache
+- Every HTML page lands in outputs/.snapshots (`stats.snapshots`); see
+  snapshot_store.diff_snapshots() to compare it with an earlier audit,
+  or pass `snapshot_dir=None` to not keep pages
+- Sitemap completeness compares against site_routes only when the site
+  is ours (its host, or its sitemap's, is BASE_URL's); for another site
+  pass `route_paths=[...]`, otherwise only crawled pages are compared
+"""
@@ -0,0 +1,748 @@
+"""
+Site Routes Module for pSEO Engine
+
+This module enumerates the public routes of the site (localized static
+pages, AI directories, blog posts and their translations, categories,
+tags, topic hubs, guides, pSEO combinations) directly from the
+repository, mirroring the rules in app/sitemap.ts, app/lib/i18n-paths.js
+and app/lib/blog-i18n.js.
+
+lastmod follows app/sitemap.ts too: post dates for posts, and the latest
+mtime of the source files that render a page (plus the posts it lists)
+for everything else. A route without any dated source has no lastmod.
+
+Every source is a generator so callers such as the sitemap writer can
+stream routes without materializing the full URL set.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from urllib.parse import quote
+import json
+import os
+import re
+import subprocess
+
+
+# Repository root (scripts/ -> pseo-engine/ -> skills/ -> .agents/ -> root)
+DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+BASE_URL = os.environ.get("NEXT_PUBLIC_URL", "https://tolearn.blog")
+
+# Mirrors app/lib/i18n-paths.js
+LOCALES = ("en", "zh", "de", "fr", "th", "pt")
+DEFAULT_LOCALE = "en"
+LOCALE_LANGUAGE_TAGS = {
+    "en": "en-US",
+    "zh": "zh-CN",
+    "de": "de-DE",
+    "fr": "fr-FR",
+    "th": "th-TH",
+    "pt": "pt-BR",
+}
+
+# Mirrors the slug mappings in app/lib/blog-i18n.js
+SLUG_MAPPINGS = {
+    "SEO": "seo-optimization-guide",
+    "AI生成PPT": "ai-generated-presentations",
+    "AI-Revolution-Finance": "ai-revolution-finance",
+    "AI-Revolution-American-Workplaces": "ai-revolution-american-workplaces",
+}
+
+BLOG_POSTS_DIR = "app/blog/posts"
+BLOG_TRANSLATIONS_DIR = "app/blog/translations"
+PSEO_DATA_PATH = "data/pseo_data.json"
+PSEO_PAGE_HASHES_PATH = "data/pseo_page_hashes.json"
+CATEGORIES_SOURCE = "app/lib/categories.ts"
+TAG_UTILS_SOURCE = "app/lib/tag-utils.ts"
+GUIDES_SOURCE = "app/lib/guides.ts"
+TOPIC_HUBS_SOURCE = "app/lib/topic-hubs.ts"
+AI_DIRECTORIES_SOURCE = "app/lib/ai-directories.ts"
+AI_TOPIC_CLUSTERS_PATH = "data/ai-topic-clusters.json"
+
+# Files whose mtime dates a group of pages (the *SourceLastModified values in app/sitemap.ts)
+CATEGORY_SOURCES = (
+    "app/categories/page.tsx",
+    "app/categories/[slug]/page.tsx",
+    "app/categories/[slug]/[year]/page.tsx",
+    CATEGORIES_SOURCE,
+    "app/lib/category-descriptions.ts",
+)
+CATEGORY_YEAR_SOURCES = ("app/categories/[slug]/[year]/page.tsx",)
+TAG_SOURCES = ("app/tags/page.tsx", "app/tags/[tag]/page.tsx", "app/lib/tag-descriptions.ts")
+TOPIC_SOURCES = ("app/topics/page.tsx", "app/topics/[slug]/page.tsx", TOPIC_HUBS_SOURCE)
+GUIDE_SOURCES = ("app/guides/page.tsx", "app/guides/[slug]/page.tsx", GUIDES_SOURCE)
+AI_DIRECTORY_SOURCES = (
+    "app/ai-coding-agents/page.tsx",
+    "app/ai-tools/page.tsx",
+    "app/ai-models/page.tsx",
+    "app/components/ai-directory-page.tsx",
+    AI_DIRECTORIES_SOURCE,
+    AI_TOPIC_CLUSTERS_PATH,
+)
+PSEO_SOURCES = (
+    PSEO_DATA_PATH,
+    "app/templates/page.tsx",
+    "app/templates/[tech]/[role]/page.tsx",
+    "app/solutions/page.tsx",
+    "app/solutions/[feature]/page.tsx",
+)
+
+# Mirrors staticRoutes in app/sitemap.ts, each published in every locale
+# (LOCALIZED_SITEMAP_PATHS; /templates and /solutions are in that set but
+# are not static routes, so they are listed once): path -> (sources, dated
+# by the latest post too, changefreq, priority)
+STATIC_ROUTES = {
+    "/": (("app/page.tsx",), True, "daily", 1.0),
+    "/blog": (("app/blog/page.tsx",), True, "daily", 0.9),
+    "/categories": (CATEGORY_SOURCES, True, "weekly", 0.5),
+    "/tags": (TAG_SOURCES, True, "weekly", 0.5),
+    "/topics": (TOPIC_SOURCES, True, "weekly", 0.7),
+    "/guides": (GUIDE_SOURCES, False, "weekly", 0.75),
+    "/about": (("app/about/page.tsx",), False, "monthly", 0.8),
+    "/contact": (("app/contact/page.tsx",), False, "monthly", 0.5),
+    "/privacy": (("app/privacy/page.tsx",), False, "yearly", 0.3),
+    "/terms": (("app/terms/page.tsx",), False, "yearly", 0.3),
+}
+
+# Mirrors the thresholds in app/sitemap.ts and app/lib/tags.ts
+MIN_POSTS_FOR_INDEXED_TAG_PAGE = 2
+MIN_POSTS_FOR_YEAR_PAGE = 3
+
+
+@dataclass
+class RouteEntry:
+    """A single public route with sitemap attributes"""
+    path: str
+    lastmod: Optional[str] = None
+    changefreq: str = "weekly"
+    priority: float = 0.5
+    locale: str = DEFAULT_LOCALE
+
+
+@dataclass
+class BlogPost:
+    """A source blog post and the locales it is published in"""
+    slug: str
+    source_path: Path
+    metadata: dict = field(default_factory=dict)
+    translations: dict[str, Path] = field(default_factory=dict)
+
+
+def absolute_url(path: str, base_url: str = BASE_URL) -> str:
+    """Join a route path onto the base URL the way app/sitemap.ts does."""
+    return f"{base_url}{'' if path == '/' else path}"
+
+
+def slugify(value: str) -> str:
+    """Port of slugify() in app/lib/formatters.ts (ASCII word characters only)."""
+    value = re.sub(r"\s+", "-", value.lower().strip())
+    value = value.replace("&", "-and-")
+    value = re.sub(r"[^\w\-]+", "", value, flags=re.ASCII)
+    value = re.sub(r"-{2,}", "-", value)
+    return re.sub(r"^-|-$", "", value)
+
+
+def create_clean_slug(filename: str) -> str:
+    """
+    Derive a post slug from its MDX filename.
+
+    Args:
+        filename: File name with or without extension
+
+    Returns:
+        URL slug
+    """
+    slug = re.sub(r"\.[^/.]+$", "", filename)
+    if slug in SLUG_MAPPINGS:
+        return SLUG_MAPPINGS[slug]
+    slug = re.sub(r"[^a-z0-9-]", "-", slug.lower())
+    return re.sub(r"-+", "-", slug).strip("-")
+
+
+def localize_path(path: str, locale: str = DEFAULT_LOCALE) -> str:
+    """
+    Prefix a content path with its locale (the default locale is unprefixed).
+
+    Args:
+        path: Unlocalized route path
+        locale: Target locale
+
+    Returns:
+        Localized route path
+    """
+    if locale == DEFAULT_LOCALE or locale not in LOCALES:
+        return path
+    return f"/{locale}" if path == "/" else f"/{locale}{path}"
+
+
+def normalize_path(path: str) -> str:
+    """Port of normalizePath() in app/lib/i18n-paths.js (no trailing slash)."""
+    if not path or path == "/":
+        return "/"
+    path = path if path.startswith("/") else f"/{path}"
+    return path[:-1] if len(path) > 1 and path.endswith("/") else path
+
+
+def strip_locale(path: str) -> tuple[str, str]:
+    """
+    Port of stripLocaleFromPath() in app/lib/i18n-paths.js.
+
+    Args:
+        path: Route path, possibly locale-prefixed
+
+    Returns:
+        Tuple of (locale, unprefixed path); the default locale when unprefixed
+    """
+    normalized = normalize_path(path)
+    match = re.match(r"^/([^/]+)(/.*)?$", normalized)
+    if match and match.group(1) in LOCALES:
+        return match.group(1), normalize_path(match.group(2) or "/")
+    return DEFAULT_LOCALE, normalized
+
+
+def parse_frontmatter(text: str) -> dict:
+    """
+    Parse the `key: value` frontmatter block of an MDX file.
+
+    Matches the line-based parser in app/blog/utils.ts: values are kept as
+    strings with surrounding quotes removed.
+
+    Args:
+        text: Raw file content
+
+    Returns:
+        Metadata dictionary
+    """
+    match = re.match(r"---\s*([\s\S]*?)\s*---", text)
+    if not match:
+        return {}
+
+    metadata = {}
+    for line in match.group(1).strip().split("\n"):
+        key, _, value = line.partition(": ")
+        value = re.sub(r"^(['\"])(.*)\1$", r"\2", value.strip())
+        metadata[key.strip()] = value
+    return metadata
+
+
+def read_frontmatter(path: Path) -> dict:
+    """Read only the frontmatter block of an MDX file."""
+    lines = []
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for index, line in enumerate(handle):
+            lines.append(line)
+            if index > 0 and line.strip() == "---":
+                break
+    return parse_frontmatter("".join(lines))
+
+
+def read_mdx(path: Path) -> tuple[dict, str]:
+    """
+    Read an MDX file into (frontmatter, body).
+
+    Args:
+        path: MDX file
+
+    Returns:
+        Tuple of (metadata dictionary, content without frontmatter)
+    """
+    text = path.read_text(encoding="utf-8", errors="replace")
+    body = re.sub(r"---\s*[\s\S]*?\s*---", "", text, count=1).strip()
+    return parse_frontmatter(text), body
+
+
+def parse_list_value(value: str) -> list[str]:
+    """
+    Parse a frontmatter list such as `['a', 'b']`, `["a","b"]` or `a, b`.
+
+    Args:
+        value: Raw frontmatter value
+
+    Returns:
+        List of trimmed, non-empty items
+    """
+    value = (value or "").strip()
+    if value.startswith("[") and value.endswith("]"):
+        try:
+            parsed = json.loads(value)
+            if isinstance(parsed, list):
+                return [str(item).strip() for item in parsed if str(item).strip()]
+        except json.JSONDecodeError:
+            value = value[1:-1]
+    return [item.strip().strip("'\"").strip() for item in value.split(",") if item.strip().strip("'\"").strip()]
+
+
+def iter_blog_posts(root: Path = DEFAULT_PROJECT_ROOT) -> Iterator[BlogPost]:
+    """
+    Yield every source blog post with its available translations.
+
+    Args:
+        root: Repository root
+
+    Yields:
+        BlogPost records, sorted by slug
+    """
+    posts_dir = root / BLOG_POSTS_DIR
+    translations_dir = root / BLOG_TRANSLATIONS_DIR
+    if not posts_dir.is_dir():
+        return
+
+    for source in sorted(posts_dir.glob("*.mdx"), key=lambda p: create_clean_slug(p.name)):
+        slug = create_clean_slug(source.name)
+        translations = {}
+        for locale in LOCALES:
+            if locale == DEFAULT_LOCALE:
+                continue
+            candidate = translations_dir / locale / f"{slug}.mdx"
+            if candidate.is_file():
+                translations[locale] = candidate
+
+        yield BlogPost(
+            slug=slug,
+            source_path=source,
+            metadata=read_frontmatter(source),
+            translations=translations,
+        )
+
+
+def normalize_lastmod(value: Optional[str]) -> Optional[str]:
+    """Turn a frontmatter date (YYYY-MM-DD or ISO) into a W3C datetime."""
+    if not value:
+        return None
+    value = value.strip()
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
+        return f"{value}T00:00:00+00:00"
+    return value
+
+
+def git_lastmod_map(root: Path = DEFAULT_PROJECT_ROOT, *paths: str) -> dict[str, str]:
+    """
+    Map files to their last commit date in a single `git log` pass.
+
+    Args:
+        root: Repository root
+        paths: Pathspecs to restrict the log to
+
+    Returns:
+        Dictionary of repo-relative path -> ISO commit date; empty if git
+        is unavailable
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", "log", "--format=%x00%cI", "--name-only", "--", *paths],
+            cwd=root, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    lastmod = {}
+    current = None
+    for line in result.stdout.splitlines():
+        if line.startswith("\x00"):
+            current = line[1:]
+        elif line and current:
+            # Log is newest first, so the first date seen per file wins
+            lastmod.setdefault(line, current)
+    return lastmod
+
+
+def _latest(*values: Optional[str]) -> Optional[str]:
+    present = [v for v in values if v]
+    return max(present) if present else None
+
+
+def file_lastmod(root: Path, *relative_paths: str) -> Optional[str]:
+    """
+    Latest mtime of some repository files (getFileLastModified in app/sitemap.ts).
+
+    Args:
+        root: Repository root
+        relative_paths: Repo-relative file paths
+
+    Returns:
+        W3C datetime in UTC, or None if none of the files exist
+    """
+    mtimes = []
+    for relative in relative_paths:
+        try:
+            mtimes.append((root / relative).stat().st_mtime)
+        except OSError:
+            continue
+    if not mtimes:
+        return None
+    return datetime.fromtimestamp(max(mtimes), timezone.utc).isoformat(timespec="seconds")
+
+
+def post_lastmod(post: BlogPost) -> Optional[str]:
+    """A post's updatedAt, else publishedAt (getPostLastModified in app/sitemap.ts)."""
+    return normalize_lastmod(post.metadata.get("updatedAt") or post.metadata.get("publishedAt"))
+
+
+def iter_static_routes(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    posts: Optional[list[BlogPost]] = None
+) -> Iterator[RouteEntry]:
+    """
+    Yield the localized static routes for every locale, then the AI directories.
+
+    Args:
+        root: Repository root
+        posts: Blog posts (read from disk if omitted)
+
+    Yields:
+        RouteEntry per static path × locale, and one per AI directory
+    """
+    posts = list(iter_blog_posts(root)) if posts is None else posts
+    latest_post = _latest(*(post_lastmod(post) for post in posts))
+
+    for path, (sources, with_posts, changefreq, priority) in STATIC_ROUTES.items():
+        lastmod = file_lastmod(root, *sources)
+        if with_posts:
+            lastmod = _latest(lastmod, latest_post)
+        for locale in LOCALES:
+            yield RouteEntry(
+                path=localize_path(path, locale),
+                lastmod=lastmod,
+                changefreq=changefreq,
+                priority=priority,
+                locale=locale,
+            )
+
+    directory_lastmod = file_lastmod(root, *AI_DIRECTORY_SOURCES)
+    for path in re.findall(r"canonicalPath:\s*'([^']+)'", _js_source(root, AI_DIRECTORIES_SOURCE)):
+        yield RouteEntry(path=path, lastmod=directory_lastmod, priority=0.78)
+
+
+def iter_blog_routes(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    git_lastmod: Optional[dict[str, str]] = None
+) -> Iterator[RouteEntry]:
+    """
+    Yield blog post routes and their translated variants.
+
+    lastmod comes from frontmatter (updatedAt/publishedAt, translatedAt for
+    translations) and, when a git map is given, from the file's last commit.
+
+    Args:
+        root: Repository root
+        git_lastmod: Optional result of git_lastmod_map()
+
+    Yields:
+        RouteEntry per post × published locale
+    """
+    git_lastmod = git_lastmod or {}
+
+    def commit_date(path: Path) -> Optional[str]:
+        return git_lastmod.get(path.relative_to(root).as_posix())
+
+    for post in iter_blog_posts(root):
+        source_lastmod = _latest(post_lastmod(post), commit_date(post.source_path))
+        yield RouteEntry(
+            path=f"/blog/{post.slug}",
+            lastmod=source_lastmod,
+            priority=0.7,
+        )
+
+        for locale, translation in post.translations.items():
+            translated_at = normalize_lastmod(read_frontmatter(translation).get("translatedAt"))
+            yield RouteEntry(
+                path=localize_path(f"/blog/{post.slug}", locale),
+                lastmod=_latest(source_lastmod, translated_at, commit_date(translation)),
+                priority=0.65,
+                locale=locale,
+            )
+
+
+def iter_pseo_index_routes(root: Path = DEFAULT_PROJECT_ROOT) -> Iterator[RouteEntry]:
+    """
+    Yield /templates and /solutions (unlocalized in app/sitemap.ts).
+
+    Args:
+        root: Repository root
+
+    Yields:
+        RouteEntry per pSEO index, dated by the pSEO data and page sources
+    """
+    lastmod = file_lastmod(root, *PSEO_SOURCES)
+    for path in ("/templates", "/solutions"):
+        yield RouteEntry(path=path, lastmod=lastmod, priority=0.7)
+
+
+def iter_pseo_routes(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    data: Optional[dict] = None,
+    page_hashes: Optional[dict[str, dict]] = None
+) -> Iterator[RouteEntry]:
+    """
+    Yield every pSEO template and solution route.
+
+    lastmod comes from the per-page hash state written by
+    pseo_generator.write_incremental_outputs(), so a page only gets a new
+    date when its rendered content changed; pages without hash state fall
+    back to the pSEO source mtimes, as in app/sitemap.ts.
+
+    Args:
+        root: Repository root
+        data: pseo_data.json contents (read from disk if omitted)
+        page_hashes: Hash state (read from disk if omitted)
+
+    Yields:
+        RouteEntry per pSEO page
+    """
+    if data is None:
+        with (root / PSEO_DATA_PATH).open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+
+    if page_hashes is None:
+        state_file = root / PSEO_PAGE_HASHES_PATH
+        page_hashes = {}
+        if state_file.exists():
+            with state_file.open("r", encoding="utf-8") as handle:
+                page_hashes = json.load(handle).get("pages", {})
+
+    source_lastmod = file_lastmod(root, *PSEO_SOURCES)
+
+    def lastmod_for(path: str) -> Optional[str]:
+        return page_hashes.get(path, {}).get("lastmod") or source_lastmod
+
+    for tech in data.get("technologies", []):
+        for role in data.get("roles", []):
+            path = f"/templates/{tech['slug']}/{role['slug']}"
+            yield RouteEntry(path=path, lastmod=lastmod_for(path), changefreq="monthly", priority=0.6)
+
+    for feature in data.get("features", []):
+        path = f"/solutions/{feature['slug']}"
+        yield RouteEntry(path=path, lastmod=lastmod_for(path), changefreq="monthly", priority=0.6)
+
+
+def _js_source(root: Path, relative: str) -> str:
+    path = root / relative
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def canonical_tag_names(root: Path = DEFAULT_PROJECT_ROOT) -> dict[str, str]:
+    """Read the canonicalTagNames map from app/lib/tag-utils.ts."""
+    source = _js_source(root, TAG_UTILS_SOURCE)
+    block = re.search(r"canonicalTagNames[^=]*=\s*\{(.*?)\n\}", source, re.S)
+    if not block:
+        return {}
+    return {
+        key or bare: value
+        for key, bare, value in re.findall(r"(?:'([^']+)'|(\w+)):\s*'([^']+)'", block.group(1))
+    }
+
+
+def to_tag_slug(tag: str, canonical_names: dict[str, str]) -> str:
+    """
+    Port of toTagSlug() in app/lib/tag-utils.ts.
+
+    Args:
+        tag: Raw frontmatter tag
+        canonical_names: Result of canonical_tag_names()
+
+    Returns:
+        Tag slug ("" for empty tags)
+    """
+    name = re.sub(r"\s+", " ", tag).strip()
+    name = re.sub(r"[\[\]'\"]+$", "", re.sub(r"^[\[\]'\"]+", "", name)).strip()
+    name = canonical_names.get(name.lower(), name) if name else name
+    return slugify(name) or re.sub(r"\s+", "-", name.strip().lower())
+
+
+def iter_taxonomy_routes(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    posts: Optional[list[BlogPost]] = None
+) -> Iterator[RouteEntry]:
+    """
+    Yield category, category-year and indexed tag routes.
+
+    Mirrors categoryRoutes, categoryYearRoutes and tagRoutes in
+    app/sitemap.ts: only categories with posts, years with at least
+    MIN_POSTS_FOR_YEAR_PAGE posts and tags on at least
+    MIN_POSTS_FOR_INDEXED_TAG_PAGE posts, each dated by its page sources
+    and the posts it lists.
+
+    Args:
+        root: Repository root
+        posts: Blog posts (read from disk if omitted)
+
+    Yields:
+        RouteEntry per taxonomy page
+    """
+    posts = list(iter_blog_posts(root)) if posts is None else posts
+    declared = re.findall(r"name:\s*'([^']+)'", _js_source(root, CATEGORIES_SOURCE))
+    canonical_names = canonical_tag_names(root)
+    category_sources = file_lastmod(root, *CATEGORY_SOURCES)
+    year_sources = file_lastmod(root, *CATEGORY_YEAR_SOURCES)
+    tag_sources = file_lastmod(root, *TAG_SOURCES)
+
+    used: dict[str, dict[str, int]] = {}
+    latest: dict[str, Optional[str]] = {}
+    tag_counts: dict[str, int] = {}
+    for post in posts:
+        lastmod = post_lastmod(post)
+        category = post.metadata.get("category")
+        if category:
+            year = (post.metadata.get("publishedAt") or "")[:4]
+            years = used.setdefault(category, {})
+            years[year] = years.get(year, 0) + 1
+            latest[category] = _latest(latest.get(category), lastmod)
+            latest[f"{category}:{year}"] = _latest(latest.get(f"{category}:{year}"), lastmod)
+        for tag in parse_list_value(post.metadata.get("tags", "")):
+            slug = to_tag_slug(tag, canonical_names)
+            if slug:
+                tag_counts[slug] = tag_counts.get(slug, 0) + 1
+                latest[f"tag:{slug}"] = _latest(latest.get(f"tag:{slug}"), lastmod)
+
+    for name in declared:
+        if name == "All" or name not in used:
+            continue
+        slug = quote(slugify(name) or re.sub(r"\s+", "-", name.strip().lower()), safe="")
+        yield RouteEntry(path=f"/categories/{slug}", lastmod=_latest(category_sources, latest[name]), priority=0.6)
+        for year, count in sorted(used[name].items()):
+            if year.isdigit() and count >= MIN_POSTS_FOR_YEAR_PAGE:
+                yield RouteEntry(
+                    path=f"/categories/{slug}/{year}",
+                    lastmod=_latest(year_sources, latest[f"{name}:{year}"]),
+                    priority=0.55,
+                )
+
+    for slug, count in tag_counts.items():
+        if count >= MIN_POSTS_FOR_INDEXED_TAG_PAGE:
+            yield RouteEntry(
+                path=f"/tags/{quote(slug, safe='')}",
+                lastmod=_latest(tag_sources, latest[f"tag:{slug}"]),
+                priority=0.5,
+            )
+
+
+def topic_hubs(root: Path = DEFAULT_PROJECT_ROOT) -> dict[str, list[str]]:
+    """
+    Read the hubs of app/lib/topic-hubs.ts.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Hub slug -> relatedTags, in declaration order
+    """
+    source = _js_source(root, TOPIC_HUBS_SOURCE)
+    block = re.search(r"topicHubs[^=]*=\s*\[(.*?)\n\]", source, re.S)
+    if not block:
+        return {}
+    hubs = {}
+    for hub in re.split(r"\n  \{", block.group(1)):
+        slug = re.search(r"^    slug:\s*'([^']+)'", hub, re.M)
+        if not slug:
+            continue
+        tags = re.search(r"^    relatedTags:\s*\[(.*?)\]", hub, re.M | re.S)
+        quoted = re.findall(r"'([^']*)'|\"([^\"]*)\"", tags.group(1)) if tags else []
+        hubs[slug.group(1)] = [single or double for single, double in quoted]
+    return hubs
+
+
+def iter_topic_routes(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    posts: Optional[list[BlogPost]] = None
+) -> Iterator[RouteEntry]:
+    """
+    Yield every topic hub that has posts (topicRoutes in app/sitemap.ts).
+
+    A post belongs to a hub when data/ai-topic-clusters.json assigns it
+    there or one of its tags matches a related tag (postBelongsToTopicHub).
+
+    Args:
+        root: Repository root
+        posts: Blog posts (read from disk if omitted)
+
+    Yields:
+        RouteEntry per non-empty hub
+    """
+    posts = list(iter_blog_posts(root)) if posts is None else posts
+    canonical_names = canonical_tag_names(root)
+    clusters_file = root / AI_TOPIC_CLUSTERS_PATH
+    primary_hubs = {}
+    if clusters_file.exists():
+        with clusters_file.open("r", encoding="utf-8") as handle:
+            primary_hubs = json.load(handle).get("primaryHubBySlug", {})
+
+    def tag_name(tag: str) -> str:
+        # normalizeTagName() in app/lib/tag-utils.ts, lowercased as postMatchesTopicHub() compares
+        name = re.sub(r"\s+", " ", tag).strip()
+        name = re.sub(r"[\[\]'\"]+$", "", re.sub(r"^[\[\]'\"]+", "", name)).strip()
+        return canonical_names.get(name.lower(), name).lower()
+
+    post_tags = {post.slug: {tag_name(tag) for tag in parse_list_value(post.metadata.get("tags", ""))} for post in posts}
+    topic_sources = file_lastmod(root, *TOPIC_SOURCES)
+    for slug, related in topic_hubs(root).items():
+        related_names = {tag_name(tag) for tag in related}
+        matching = [
+            post for post in posts
+            if primary_hubs.get(post.slug) == slug or post_tags[post.slug] & related_names
+        ]
+        if matching:
+            yield RouteEntry(
+                path=f"/topics/{slug}",
+                lastmod=_latest(topic_sources, *(post_lastmod(post) for post in matching)),
+                priority=0.8,
+            )
+
+
+def iter_guide_routes(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    posts: Optional[list[BlogPost]] = None
+) -> Iterator[RouteEntry]:
+    """
+    Yield the RSS feed and every guide in app/lib/guides.ts.
+
+    Args:
+        root: Repository root
+        posts: Blog posts, to date the feed (read from disk if omitted)
+
+    Yields:
+        RouteEntry per guide plus /rss
+    """
+    posts = list(iter_blog_posts(root)) if posts is None else posts
+    yield RouteEntry(path="/rss", lastmod=_latest(*(post_lastmod(post) for post in posts)), priority=0.3)
+    guide_sources = file_lastmod(root, *GUIDE_SOURCES)
+    for slug in re.findall(r"^\s+slug:\s*'([^']+)'", _js_source(root, GUIDES_SOURCE), re.M):
+        yield RouteEntry(path=f"/guides/{slug}", lastmod=guide_sources, priority=0.85)
+
+
+def iter_site_routes(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    use_git: bool = False,
+    lastmod_fallback: Optional[Callable[[RouteEntry], Optional[str]]] = None
+) -> Iterator[RouteEntry]:
+    """
+    Chain every route source into a single stream.
+
+    Args:
+        root: Repository root
+        use_git: Also consult git commit dates for blog lastmod
+        lastmod_fallback: Called for entries without a lastmod (by default
+            they keep none, so no date is invented)
+
+    Yields:
+        RouteEntry for every public route
+    """
+    git_lastmod = git_lastmod_map(root, BLOG_POSTS_DIR, BLOG_TRANSLATIONS_DIR) if use_git else None
+    posts = list(iter_blog_posts(root))
+
+    sources = (
+        iter_static_routes(root, posts),
+        iter_blog_routes(root, git_lastmod),
+        iter_taxonomy_routes(root, posts),
+        iter_topic_routes(root, posts),
+        iter_guide_routes(root, posts),
+        iter_pseo_index_routes(root),
+        iter_pseo_routes(root),
+    )
+    for source in sources:
+        for entry in source:
+            if entry.lastmod is None and lastmod_fallback is not None:
+                entry.lastmod = lastmod_fallback(entry)
+            yield entry
@@ -0,0 +1,317 @@
+"""
+Sitemap Diff Module for pSEO Engine
+
+This module compares the URLs a sitemap actually lists with the routes the
+repository says should exist (site_routes: localized static pages, blog
+posts × locales, categories, tags, guides, pSEO combinations) and reports
+both differences:
+
+- missing: expected routes the sitemap does not list
+- extra:   sitemap URLs no route source produces
+
+Sitemaps are streamed with ElementTree.iterparse (gzip and sitemap indexes
+supported) and both sides are compared by a sorted merge over external
+sorted runs, so memory stays bounded by the run size rather than by the
+number of URLs.
+
+Usage by Claude:
+- Trigger: "seo audit" (XML Sitemap Completeness), "check sitemap"
+- diff_sitemap("public/sitemaps/sitemap-index.xml") -> SitemapDiff
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Union
+from urllib.parse import unquote, urlsplit
+from urllib.request import Request, urlopen
+import gzip
+import heapq
+import tempfile
+import xml.etree.ElementTree as ET
+
+from site_routes import DEFAULT_PROJECT_ROOT, iter_site_routes
+
+
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# Paths held in memory per sorted run before spilling to disk
+DEFAULT_RUN_SIZE = 100_000
+
+FETCH_TIMEOUT = 30
+USER_AGENT = "pseo-engine-sitemap-diff/1.0"
+
+
+@dataclass
+class SitemapDiff:
+    """Differences between the sitemap and the expected routes"""
+    expected: int = 0
+    listed: int = 0
+    duplicates: int = 0  # sitemap entries repeating an earlier path
+    sitemaps: list[str] = field(default_factory=list)  # files/URLs read
+    missing: list[str] = field(default_factory=list)
+    extra: list[str] = field(default_factory=list)
+    missing_count: int = 0
+    extra_count: int = 0
+
+    @property
+    def is_complete(self) -> bool:
+        return self.missing_count == 0 and self.extra_count == 0
+
+
+def normalize_loc(loc: str) -> str:
+    """
+    Reduce a sitemap <loc> or route to the comparable path.
+
+    Host and scheme are dropped so a sitemap generated for production can
+    be compared against local routes; percent-encoding and trailing
+    slashes are normalized.
+
+    Args:
+        loc: Absolute URL or path
+
+    Returns:
+        Path, e.g. "/zh/blog/my-post"
+    """
+    path = unquote(urlsplit(loc.strip()).path)
+    return path.rstrip("/") or "/"
+
+
+@contextmanager
+def _open_source(source: str) -> Iterator[IO[bytes]]:
+    # GzipFile(fileobj=...) does not close the file or response under it
+    if source.startswith(("http://", "https://")):
+        handle = urlopen(Request(source, headers={"User-Agent": USER_AGENT}), timeout=FETCH_TIMEOUT)
+    else:
+        handle = open(source, "rb")
+    with handle:
+        if source.endswith(".gz"):
+            with gzip.GzipFile(fileobj=handle) as stream:
+                yield stream
+        else:
+            yield handle
+
+
+def _child_source(parent: str, loc: str) -> str:
+    # Index entries point at public URLs; prefer the sibling file of a local index
+    if not parent.startswith(("http://", "https://")):
+        local = Path(parent).parent / Path(urlsplit(loc).path).name
+        if local.exists():
+            return str(local)
+    return loc
+
+
+def iter_sitemap_locs(source: str, visited: Optional[list[str]] = None) -> Iterator[str]:
+    """
+    Stream every <loc> of a sitemap, following sitemap indexes.
+
+    Elements are cleared as soon as they are read, so memory does not grow
+    with the size of the file.
+
+    Args:
+        source: File path or URL (".gz" is decompressed on the fly)
+        visited: Optional list collecting every sitemap read
+
+    Yields:
+        Page URLs in document order
+    """
+    if visited is not None:
+        visited.append(source)
+    children = []
+    with _open_source(source) as handle:
+        context = ET.iterparse(handle, events=("start", "end"))
+        _, root = next(context)
+        is_index = root.tag == f"{SITEMAP_NS}sitemapindex"
+        for event, element in context:
+            if event != "end":
+                continue
+            if element.tag == f"{SITEMAP_NS}loc" and element.text:
+                if is_index:
+                    children.append(element.text.strip())
+                else:
+                    yield element.text.strip()
+            elif element.tag in (f"{SITEMAP_NS}url", f"{SITEMAP_NS}sitemap"):
+                element.clear()
+                root.clear()
+
+    for child in children:
+        yield from iter_sitemap_locs(_child_source(source, child), visited)
+
+
+def _write_run(directory: str, values: list[str]) -> str:
+    values.sort()
+    handle = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, delete=False, suffix=".run")
+    with handle:
+        handle.writelines(f"{value}\n" for value in values)
+    return handle.name
+
+
+def _read_run(path: str) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            yield line.rstrip("\n")
+
+
+def external_sort(values: Iterable[str], directory: str, run_size: int = DEFAULT_RUN_SIZE) -> Iterator[str]:
+    """
+    Sort a stream of strings using sorted runs spilled to directory.
+
+    Args:
+        values: Strings without newlines
+        directory: Scratch directory for the runs
+        run_size: Values sorted in memory per run
+
+    Yields:
+        Values in sorted order (duplicates kept)
+    """
+    runs, buffer = [], []
+    for value in values:
+        buffer.append(value)
+        if len(buffer) >= run_size:
+            runs.append(_write_run(directory, buffer))
+            buffer = []
+    if not runs:
+        yield from sorted(buffer)
+        return
+    if buffer:
+        runs.append(_write_run(directory, buffer))
+    yield from heapq.merge(*(_read_run(run) for run in runs))
+
+
+def merge_diff(
+    expected: Iterator[str],
+    listed: Iterator[str],
+    diff: SitemapDiff,
+    limit: Optional[int] = None
+) -> SitemapDiff:
+    """
+    Walk two sorted streams once and record both set differences.
+
+    Args:
+        expected: Sorted expected paths (duplicates allowed)
+        listed: Sorted sitemap paths (duplicates are counted)
+        diff: Result to fill in
+        limit: Maximum paths kept per list (counts are always exact)
+
+    Returns:
+        diff
+    """
+    def record(bucket: list[str], value: str) -> None:
+        if limit is None or len(bucket) < limit:
+            bucket.append(value)
+
+    sentinel = None
+    exp = next(expected, sentinel)
+    lst = next(listed, sentinel)
+    last_expected = last_listed = sentinel
+
+    while exp is not sentinel or lst is not sentinel:
+        if exp is not sentinel and exp == last_expected:
+            exp = next(expected, sentinel)
+            continue
+        if lst is not sentinel and lst == last_listed:
+            diff.duplicates += 1
+            lst = next(listed, sentinel)
+            continue
+
+        if lst is sentinel or (exp is not sentinel and exp < lst):
+            diff.expected += 1
+            diff.missing_count += 1
+            record(diff.missing, exp)
+            last_expected, exp = exp, next(expected, sentinel)
+        elif exp is sentinel or lst < exp:
+            diff.listed += 1
+            diff.extra_count += 1
+            record(diff.extra, lst)
+            last_listed, lst = lst, next(listed, sentinel)
+        else:
+            diff.expected += 1
+            diff.listed += 1
+            last_expected, exp = exp, next(expected, sentinel)
+            last_listed, lst = lst, next(listed, sentinel)
+    return diff
+
+
+def diff_paths(
+    expected: Iterable[str],
+    listed: Iterable[str],
+    run_size: int = DEFAULT_RUN_SIZE,
+    limit: Optional[int] = None
+) -> SitemapDiff:
+    """
+    Diff two unsorted streams of URLs or paths.
+
+    Args:
+        expected: Expected routes
+        listed: Sitemap URLs
+        run_size: Values sorted in memory per run
+        limit: Maximum paths kept per list
+
+    Returns:
+        SitemapDiff
+    """
+    with tempfile.TemporaryDirectory(prefix="sitemap-diff-") as scratch:
+        return merge_diff(
+            external_sort((normalize_loc(v) for v in expected), scratch, run_size),
+            external_sort((normalize_loc(v) for v in listed), scratch, run_size),
+            SitemapDiff(),
+            limit,
+        )
+
+
+def diff_sitemap(
+    source: Union[str, Path],
+    root: Path = DEFAULT_PROJECT_ROOT,
+    run_size: int = DEFAULT_RUN_SIZE,
+    limit: Optional[int] = None
+) -> SitemapDiff:
+    """
+    Compare a sitemap (or sitemap index) with every route the repository defines.
+
+    Args:
+        source: Sitemap file or URL, e.g. "https://tolearn.blog/sitemap.xml",
+            "public/sitemaps/sitemap-index.xml" or
+            ".next/server/app/sitemap.xml.body"
+        root: Repository root
+        run_size: Values sorted in memory per run
+        limit: Maximum paths kept per list
+
+    Returns:
+        SitemapDiff
+    """
+    visited: list[str] = []
+    diff = diff_paths(
+        (entry.path for entry in iter_site_routes(root)),
+        iter_sitemap_locs(str(source), visited),
+        run_size,
+        limit,
+    )
+    diff.sitemaps = visited
+    return diff
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+After `npm run build` (or against production):
+
+```python
+from sitemap_diff import diff_sitemap
+
+diff = diff_sitemap(".next/server/app/sitemap.xml.body")
+# diff = diff_sitemap("https://tolearn.blog/sitemap.xml")
+# diff = diff_sitemap("public/sitemaps/sitemap-index.xml")
+
+print(f"{diff.listed} listed / {diff.expected} expected, "
+      f"{diff.missing_count} missing, {diff.extra_count} extra, {diff.duplicates} duplicates")
+for path in diff.missing[:20]:
+    print("MISSING", path)
+for path in diff.extra[:20]:
+    print("EXTRA  ", path)
+```
+
+- Missing routes: add them to app/sitemap.ts (or the sitemap shards)
+- Extra URLs: stale routes, or a route source site_routes does not model
+  yet
+"""
@@ -0,0 +1,251 @@
+"""
+Sitemap Writer Module for pSEO Engine
+
+This module streams every site route into gzipped sitemap shards plus a
+sitemap index, so the sitemap keeps working past the 50,000-URL / 50MB
+per-file limit that a single app/sitemap.ts response runs into.
+
+Usage by Claude:
+- Trigger: "generate sitemap" or as the sitemap step of "generate pseo"
+- Streams routes from site_routes (static × locales, AI directories, blog,
+  taxonomy, topic hubs, guides, pSEO)
+- Uses real lastmod values (frontmatter, git, pSEO content hashes, source
+  file mtimes) and leaves <lastmod> out where there is none
+- Writes public/sitemaps/sitemap-N.xml.gz and public/sitemaps/sitemap-index.xml
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+from xml.sax.saxutils import escape
+import gzip
+import re
+
+from site_routes import BASE_URL, DEFAULT_PROJECT_ROOT, RouteEntry, absolute_url, iter_site_routes
+
+
+# Protocol limits (https://www.sitemaps.org/protocol.html)
+MAX_URLS_PER_SHARD = 50_000
+MAX_SHARD_BYTES = 50 * 1024 * 1024  # uncompressed
+
+DEFAULT_OUTPUT_DIR = "public/sitemaps"
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+_URLSET_OPEN = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'.encode("utf-8")
+_URLSET_CLOSE = b"</urlset>\n"
+
+
+@dataclass
+class SitemapShard:
+    """One gzipped sitemap file"""
+    filename: str
+    url_count: int = 0
+    byte_count: int = 0
+    lastmod: Optional[str] = None
+
+
+@dataclass
+class SitemapIndexResult:
+    """Outcome of a sharded sitemap run"""
+    index_path: str
+    shards: list[SitemapShard] = field(default_factory=list)
+    total_urls: int = 0
+
+
+class ShardedSitemapWriter:
+    """
+    Write sitemap entries into size-bounded gzip shards.
+
+    Only the current shard's file handle and a per-shard summary are held
+    in memory, so memory use does not grow with the number of URLs.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        base_url: str = BASE_URL,
+        public_prefix: str = "/sitemaps",
+        max_urls: int = MAX_URLS_PER_SHARD,
+        max_bytes: int = MAX_SHARD_BYTES
+    ):
+        self.output_dir = Path(output_dir)
+        self.base_url = base_url
+        self.public_prefix = public_prefix
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.shards: list[SitemapShard] = []
+        self._handle = None
+        self._current: Optional[SitemapShard] = None
+
+    def abort(self) -> None:
+        """Close the open shard without writing an index."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            self._current = None
+
+    def _open_shard(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        shard = SitemapShard(filename=f"sitemap-{len(self.shards) + 1}.xml.gz")
+        # mtime=0 keeps output byte-identical across runs with the same input
+        self._handle = gzip.GzipFile(self.output_dir / shard.filename, "wb", mtime=0)
+        self._handle.write(_URLSET_OPEN)
+        shard.byte_count = len(_URLSET_OPEN) + len(_URLSET_CLOSE)
+        self.shards.append(shard)
+        self._current = shard
+
+    def _close_shard(self) -> None:
+        if self._handle is not None:
+            self._handle.write(_URLSET_CLOSE)
+            self._handle.close()
+            self._handle = None
+            self._current = None
+
+    def add(self, entry: RouteEntry) -> None:
+        """
+        Append one route, rotating to a new shard when a limit is reached.
+
+        Args:
+            entry: Route to add
+        """
+        parts = [f"<url><loc>{escape(absolute_url(entry.path, self.base_url))}</loc>"]
+        if entry.lastmod:
+            parts.append(f"<lastmod>{escape(entry.lastmod)}</lastmod>")
+        parts.append(f"<changefreq>{entry.changefreq}</changefreq>")
+        parts.append(f"<priority>{entry.priority:.1f}</priority></url>\n")
+        record = "".join(parts).encode("utf-8")
+
+        shard = self._current
+        if shard is None or shard.url_count >= self.max_urls or shard.byte_count + len(record) > self.max_bytes:
+            self._close_shard()
+            self._open_shard()
+            shard = self._current
+
+        self._handle.write(record)
+        shard.url_count += 1
+        shard.byte_count += len(record)
+        if entry.lastmod and (shard.lastmod is None or entry.lastmod > shard.lastmod):
+            shard.lastmod = entry.lastmod
+
+    def close(self, index_name: str = "sitemap-index.xml") -> SitemapIndexResult:
+        """
+        Finish the last shard, write the sitemap index and delete shards
+        left over from an earlier, larger run.
+
+        Args:
+            index_name: File name for the index
+
+        Returns:
+            SitemapIndexResult describing the written files
+        """
+        self._close_shard()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        index_path = self.output_dir / index_name
+
+        with index_path.open("w", encoding="utf-8") as handle:
+            handle.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            handle.write(f'<sitemapindex xmlns="{SITEMAP_NS}">\n')
+            for shard in self.shards:
+                loc = f"{self.base_url}{self.public_prefix}/{shard.filename}"
+                handle.write(f"<sitemap><loc>{escape(loc)}</loc>")
+                if shard.lastmod:
+                    handle.write(f"<lastmod>{escape(shard.lastmod)}</lastmod>")
+                handle.write("</sitemap>\n")
+            handle.write("</sitemapindex>\n")
+
+        # A smaller run leaves higher-numbered shards from the last one behind
+        written = {shard.filename for shard in self.shards}
+        for path in self.output_dir.glob("sitemap-*.xml.gz"):
+            if path.name not in written and re.fullmatch(r"sitemap-\d+\.xml\.gz", path.name):
+                path.unlink()
+
+        return SitemapIndexResult(
+            index_path=str(index_path),
+            shards=list(self.shards),
+            total_urls=sum(s.url_count for s in self.shards),
+        )
+
+
+def write_sitemaps(
+    entries: Iterable[RouteEntry],
+    output_dir: Path,
+    base_url: str = BASE_URL,
+    max_urls: int = MAX_URLS_PER_SHARD
+) -> SitemapIndexResult:
+    """
+    Stream route entries into sharded sitemaps.
+
+    Args:
+        entries: Any iterable of RouteEntry (typically a generator)
+        output_dir: Directory for shards and index
+        base_url: Site origin
+        max_urls: URLs per shard (capped at the protocol limit)
+
+    Returns:
+        SitemapIndexResult
+    """
+    writer = ShardedSitemapWriter(output_dir, base_url, max_urls=min(max_urls, MAX_URLS_PER_SHARD))
+    try:
+        for entry in entries:
+            writer.add(entry)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+def generate_site_sitemaps(
+    root: Path = DEFAULT_PROJECT_ROOT,
+    output_dir: Optional[Path] = None,
+    use_git: bool = False
+) -> SitemapIndexResult:
+    """
+    Write sharded sitemaps for every public route of the site.
+
+    Args:
+        root: Repository root
+        output_dir: Output directory (defaults to public/sitemaps)
+        use_git: Use git commit dates as an extra lastmod source for posts
+
+    Returns:
+        SitemapIndexResult
+    """
+    output_dir = output_dir or root / DEFAULT_OUTPUT_DIR
+    return write_sitemaps(iter_site_routes(root, use_git=use_git), output_dir)
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+When the route count approaches the single-file sitemap limit, or when
+"generate pseo" adds a large batch of pages:
+
+1. Refresh the pSEO hash state so pSEO lastmod values are current:
+```python
+from pseo_generator import generate_pseo_data, write_incremental_outputs
+write_incremental_outputs(generate_pseo_data())
+```
+
+2. Stream the sitemap shards:
+```python
+from sitemap_writer import generate_site_sitemaps
+result = generate_site_sitemaps(use_git=True)
+```
+
+3. Point robots.txt at the index (`app/robots.ts`):
+```typescript
+sitemap: [`${baseUrl}/sitemap.xml`, `${baseUrl}/sitemaps/sitemap-index.xml`],
+```
+
+### Output Report
+
+```markdown
+## Sitemap Generation Complete
+
+- Index: public/sitemaps/sitemap-index.xml
+- Shards: 3 (50,000 + 50,000 + 12,408 URLs)
+- Total URLs: 112,408
+- lastmod sources: frontmatter, git, pSEO content hashes, source file mtimes
+```
+"""
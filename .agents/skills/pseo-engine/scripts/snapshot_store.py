@@ -0,0 +1,431 @@
+"""
+Snapshot Store Module for pSEO Engine
+
+This module keeps every fetched or saved page so analyses can be re-run
+locally and pages compared over time:
+
+- bodies are content-addressed (SHA-256) and compressed with lzma (or
+  zlib, or stored raw); a page that did not change between runs, or the
+  same HTML under several URLs, is stored once
+- every fetch is a row in a SQLite index (URL, fetch time, collection,
+  status, digest), so the history of a URL is one indexed query
+- read() hands analyzers a memoryview: raw blobs are mmapped straight
+  from disk, compressed blobs are decompressed once into a buffer the
+  parsers slice without copying
+- diff_snapshots() compares the extracted text of two versions of a page;
+  unchanged versions share a digest and are skipped without reading them
+
+Writing a blob (hash + compress + file) touches no SQLite state, so it can
+run in worker threads or processes; only record() goes through the index.
+
+Usage by Claude:
+- Not triggered directly; site_crawler.crawl_site() and
+  competitor_batch.analyze_competitor_batch() record into it by default
+- SnapshotStore().history(url) / .read(snapshot) / diff_snapshots(store, url)
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Union
+import difflib
+import hashlib
+import lzma
+import mmap
+import os
+import sqlite3
+import tempfile
+import time
+import zlib
+
+from competitor_analyzer import extract_page_from_buffer
+
+
+DEFAULT_SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / "outputs" / ".snapshots"
+DEFAULT_CODEC = "lzma"
+LZMA_PRESET = 6
+ZLIB_LEVEL = 6
+
+# codec -> blob file suffix
+CODEC_SUFFIXES = {"lzma": ".xz", "zlib": ".z", "raw": ".html"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    collection TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_url ON snapshots (url, fetched_at);
+CREATE INDEX IF NOT EXISTS snapshots_by_collection ON snapshots (collection, url);
+CREATE INDEX IF NOT EXISTS snapshots_by_digest ON snapshots (digest);
+"""
+
+RECORD_COLUMNS = "url, fetched_at, collection, status, content_type, digest, codec, size, stored_size"
+COLUMNS = f"id, {RECORD_COLUMNS}"
+
+
+@dataclass
+class StoredBlob:
+    """A body written to (or found in) the blob directory"""
+    digest: str
+    codec: str
+    size: int
+    stored_size: int
+
+
+@dataclass
+class Snapshot:
+    """One recorded fetch of a URL"""
+    id: int
+    url: str
+    fetched_at: float  # epoch seconds
+    collection: str  # e.g. "crawl", "competitors/ai-agents"
+    status: int
+    content_type: str
+    digest: str
+    codec: str
+    size: int
+    stored_size: int
+
+
+def blob_path(directory: Union[str, Path], digest: str, codec: str) -> Path:
+    """Path of a blob inside a store directory."""
+    return Path(directory) / "blobs" / digest[:2] / f"{digest}{CODEC_SUFFIXES[codec]}"
+
+
+def write_blob(directory: Union[str, Path], body: Union[bytes, memoryview], codec: str = DEFAULT_CODEC) -> StoredBlob:
+    """
+    Store a body under its SHA-256 unless a blob with that digest exists.
+
+    Safe to call from several threads or processes at once, and alongside
+    SnapshotStore.prune(): blobs are written to a temporary file and
+    renamed into place, and a reused blob gets a fresh mtime so a prune
+    with an earlier cutoff leaves it for the record() that follows.
+
+    Args:
+        directory: Store directory
+        body: Raw page bytes
+        codec: "lzma", "zlib" or "raw" (used only for new blobs)
+
+    Returns:
+        StoredBlob (with the codec of the existing blob when deduplicated)
+    """
+    digest = hashlib.sha256(body).hexdigest()
+    for existing in (codec, *CODEC_SUFFIXES):
+        path = blob_path(directory, digest, existing)
+        try:
+            os.utime(path)
+            return StoredBlob(digest, existing, len(body), path.stat().st_size)
+        except FileNotFoundError:
+            continue
+
+    if codec == "lzma":
+        data = lzma.compress(body, preset=LZMA_PRESET)
+    elif codec == "zlib":
+        data = zlib.compress(body, ZLIB_LEVEL)
+    elif codec == "raw":
+        data = body
+    else:
+        raise ValueError(f"Unknown codec: {codec}")
+
+    path = blob_path(directory, digest, codec)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(handle, "wb") as output:
+        output.write(data)
+    os.replace(temporary, path)
+    return StoredBlob(digest, codec, len(body), len(data))
+
+
+def open_blob(directory: Union[str, Path], digest: str, codec: str) -> memoryview:
+    """
+    Read-only view of a blob's original bytes.
+
+    Raw blobs are memory-mapped, so nothing is copied until a parser
+    decodes a slice; compressed blobs are decompressed once.
+
+    Args:
+        directory: Store directory
+        digest: SHA-256 of the body
+        codec: Codec the blob was written with
+
+    Returns:
+        memoryview of the page bytes
+    """
+    path = blob_path(directory, digest, codec)
+    if codec == "raw":
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+    data = path.read_bytes()
+    return memoryview(lzma.decompress(data) if codec == "lzma" else zlib.decompress(data))
+
+
+class SnapshotStore:
+    """
+    URL/time index over content-addressed, compressed page bodies.
+
+    Args:
+        directory: Store directory (index.sqlite3 plus blobs/)
+        codec: Codec for new blobs ("lzma", "zlib" or "raw")
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_SNAPSHOT_DIR, codec: str = DEFAULT_CODEC):
+        if codec not in CODEC_SUFFIXES:
+            raise ValueError(f"Unknown codec: {codec}")
+        self.directory = Path(directory)
+        self.codec = codec
+        (self.directory / "blobs").mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.directory / "index.sqlite3"))
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write_blob(self, body: Union[bytes, memoryview]) -> StoredBlob:
+        """Store a body without recording a fetch (see module write_blob())."""
+        return write_blob(self.directory, body, self.codec)
+
+    def record(
+        self,
+        url: str,
+        blob: StoredBlob,
+        collection: str = "",
+        status: int = 200,
+        content_type: str = "text/html",
+        fetched_at: Optional[float] = None
+    ) -> Snapshot:
+        """
+        Index one fetch of url whose body was stored as blob.
+
+        Recording the same URL, time and body twice (e.g. re-running a
+        batch over the same saved files) returns the existing snapshot.
+
+        Args:
+            url: Page URL
+            blob: Result of write_blob()
+            collection: Grouping label ("crawl", "competitors/<cluster>", ...)
+            status: HTTP status of the fetch
+            content_type: Response content type
+            fetched_at: Fetch time (defaults to now)
+
+        Returns:
+            The recorded Snapshot
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        existing = self._select("url = ? AND fetched_at = ? AND digest = ? LIMIT 1", (url, fetched_at, blob.digest))
+        if existing:
+            return existing[0]
+        values = (url, fetched_at, collection, status, content_type, blob.digest, blob.codec, blob.size, blob.stored_size)
+        cursor = self.conn.execute(f"INSERT INTO snapshots ({RECORD_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+        self.conn.commit()
+        return Snapshot(cursor.lastrowid, *values)
+
+    def put(self, url: str, body: Union[bytes, memoryview], **record_options) -> Snapshot:
+        """
+        Store a body and record the fetch.
+
+        Args:
+            url: Page URL
+            body: Raw page bytes
+            **record_options: collection, status, content_type, fetched_at
+
+        Returns:
+            The recorded Snapshot
+        """
+        return self.record(url, self.write_blob(body), **record_options)
+
+    def read(self, snapshot: Snapshot) -> memoryview:
+        """Page bytes of a snapshot (see open_blob())."""
+        return open_blob(self.directory, snapshot.digest, snapshot.codec)
+
+    def _select(self, where: str, params: tuple) -> list[Snapshot]:
+        return [Snapshot(*row) for row in self.conn.execute(f"SELECT {COLUMNS} FROM snapshots WHERE {where}", params)]
+
+    def latest(self, url: str, at: Optional[float] = None) -> Optional[Snapshot]:
+        """
+        Most recent snapshot of url.
+
+        Args:
+            url: Page URL
+            at: Only consider fetches at or before this time
+
+        Returns:
+            Snapshot, or None if the URL was never recorded
+        """
+        rows = self._select(
+            "url = ? AND fetched_at <= ? ORDER BY fetched_at DESC, id DESC LIMIT 1",
+            (url, float("inf") if at is None else at),
+        )
+        return rows[0] if rows else None
+
+    def history(self, url: str) -> list[Snapshot]:
+        """Every snapshot of url, oldest first."""
+        return self._select("url = ? ORDER BY fetched_at, id", (url,))
+
+    def changes(self, url: str) -> list[Snapshot]:
+        """Snapshots of url whose body differs from the previous one, oldest first."""
+        versions: list[Snapshot] = []
+        for snapshot in self.history(url):
+            if not versions or snapshot.digest != versions[-1].digest:
+                versions.append(snapshot)
+        return versions
+
+    def iter_latest(self, collection: str = "", at: Optional[float] = None) -> Iterator[Snapshot]:
+        """
+        Latest snapshot per URL and collection, in collections starting
+        with collection.
+
+        Args:
+            collection: Collection prefix ("" for all, "competitors/" for
+                every competitor cluster)
+            at: Only consider fetches at or before this time
+
+        Yields:
+            Snapshot per (collection, URL), ordered by collection then URL
+        """
+        # SQLite takes bare columns from the row that holds MAX()
+        rows = self.conn.execute(
+            f"SELECT {COLUMNS}, MAX(fetched_at) FROM snapshots "
+            "WHERE substr(collection, 1, ?) = ? AND fetched_at <= ? "
+            "GROUP BY collection, url ORDER BY collection, url",
+            (len(collection), collection, float("inf") if at is None else at),
+        )
+        for row in rows:
+            yield Snapshot(*row[:-1])
+
+    def prune(self, before: float) -> int:
+        """
+        Forget snapshots fetched before a time (each URL keeps its latest)
+        and delete blobs no snapshot references.
+
+        Only blobs last written before the cutoff are deleted, and
+        write_blob()'s temporary files are left alone, so blobs that
+        another process has written but not yet recorded survive.
+
+        Args:
+            before: Epoch seconds
+
+        Returns:
+            Number of blob files removed
+        """
+        self.conn.execute(
+            "DELETE FROM snapshots WHERE fetched_at < ? AND id NOT IN "
+            "(SELECT id FROM (SELECT id, MAX(fetched_at) FROM snapshots GROUP BY url))",
+            (before,),
+        )
+        self.conn.commit()
+        referenced = {row[0] for row in self.conn.execute("SELECT DISTINCT digest FROM snapshots")}
+        removed = 0
+        suffixes = set(CODEC_SUFFIXES.values())
+        for path in (self.directory / "blobs").glob("*/*"):
+            if path.suffix not in suffixes or path.stem in referenced:
+                continue
+            try:
+                if path.stat().st_mtime < before:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue  # removed by a concurrent prune
+        return removed
+
+    def stats(self) -> dict:
+        """Snapshot, URL and blob counts, and raw vs stored bytes of distinct blobs."""
+        snapshots, urls = self.conn.execute("SELECT COUNT(*), COUNT(DISTINCT url) FROM snapshots").fetchone()
+        blobs, raw, stored = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) "
+            "FROM (SELECT size, stored_size FROM snapshots GROUP BY digest)"
+        ).fetchone()
+        return {"snapshots": snapshots, "urls": urls, "blobs": blobs, "raw_bytes": raw, "stored_bytes": stored}
+
+
+def _diff_lines(store: SnapshotStore, snapshot: Snapshot) -> list[str]:
+    extract = extract_page_from_buffer(store.read(snapshot), snapshot.url)
+    return [f"title: {extract.title}", f"description: {extract.meta_description}", *extract.text.splitlines()]
+
+
+def diff_snapshots(
+    store: SnapshotStore,
+    url: str,
+    older: Optional[Snapshot] = None,
+    newer: Optional[Snapshot] = None,
+    context: int = 2
+) -> list[str]:
+    """
+    Unified diff of the title, meta description and body text of two
+    versions of a page.
+
+    Args:
+        store: Snapshot store
+        url: Page URL
+        older: Earlier snapshot (defaults to the version before newer)
+        newer: Later snapshot (defaults to the latest version)
+        context: Unchanged lines around each change
+
+    Returns:
+        Diff lines (empty when both versions have the same body)
+    """
+    versions = store.changes(url)
+    newer = newer or (versions[-1] if versions else None)
+    if older is None and newer is not None:
+        earlier = [version for version in versions if version.fetched_at < newer.fetched_at and version.digest != newer.digest]
+        older = earlier[-1] if earlier else None
+    if older is None or newer is None or older.digest == newer.digest:
+        return []
+
+    def label(snapshot: Snapshot) -> str:
+        return f"{url} @ {time.strftime('%Y-%m-%d %H:%M', time.gmtime(snapshot.fetched_at))}"
+
+    return list(difflib.unified_diff(
+        _diff_lines(store, older), _diff_lines(store, newer),
+        fromfile=label(older), tofile=label(newer), n=context, lineterm="",
+    ))
+
+
+# Usage documentation for Claude
+USAGE_EXAMPLE = """
+## How Claude Should Use This Module
+
+Audits and competitor batches record into outputs/.snapshots by default.
+Re-run an analysis without fetching anything:
+
+```python
+from competitor_analyzer import analyze_competitor_page, extract_page_from_buffer
+from snapshot_store import SnapshotStore
+
+with SnapshotStore() as store:
+    snapshot = store.latest("https://example.com/guide")
+    page = extract_page_from_buffer(store.read(snapshot), snapshot.url)
+    print(analyze_competitor_page(snapshot.url, page).content_metrics)
+```
+
+What changed on a competitor page since the last batch:
+
+```python
+from snapshot_store import SnapshotStore, diff_snapshots
+
+with SnapshotStore() as store:
+    print(len(store.changes("https://example.com/guide")), "versions")
+    print("\\n".join(diff_snapshots(store, "https://example.com/guide")))
+    print(store.stats())
+```
+
+Re-benchmark every stored competitor cluster (no downloads):
+`analyze_competitor_batch(SnapshotStore())`. Old history can be dropped
+with `store.prune(before=time.time() - 90 * 86400)`.
+"""
@@ -6,14 +6,31 @@ extending the base /api/seo-health functionality.
 
 Usage by Claude:
 - Trigger: "seo audit" or "SEO诊断"
-- Call /api/seo-health as base
+- Call /api/seo-health as base, or crawl the site with site_crawler.py
 - Perform extended checks on schema, links, and structure
 - Generate prioritized fix list
+
+run_declared_checks(SiteSnapshot) executes every entry of BASE_CHECKS and
+EXTENDED_CHECKS through CHECK_RUNNERS.
+Scores are weighted by audit_scoring (category, severity, affected pages).
 """
 
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+import re
+
+from asset_budget import analyze_asset_budget
+from audit_scoring import LiveScore, ScoreBoard
+from canonical_map import build_canonical_map
+from hreflang_matrix import summarize_problems, validate_hreflang
+from page_facts import PageFacts
+from redirect_analyzer import analyze_redirects, load_redirect_graph
+from robots_rules import DEFAULT_USER_AGENT, evaluate_paths, link_graph_from_pages, load_robots, simulate_crawl_budget
+from site_routes import BASE_URL, absolute_url, iter_site_routes
+from sitemap_diff import diff_paths
 
 
 class CheckStatus(Enum):
@@ -43,6 +60,7 @@ class SEOCheck:
     fix_instructions: Optional[str] = None
     priority: Priority = Priority.MEDIUM
     details: dict = field(default_factory=dict)
+    severity: str = "medium"  # "critical", "high", "medium" or "low" (scoring weight)
 
 
 @dataclass
@@ -56,6 +74,7 @@ class AuditReport:
     warnings: list[SEOCheck] = field(default_factory=list)
     passed: list[SEOCheck] = field(default_factory=list)
     priority_fixes: list[SEOCheck] = field(default_factory=list)
+    category_scores: dict[str, int] = field(default_factory=dict)  # category -> 0-100
 
 
 # Check categories
@@ -77,38 +96,44 @@ BASE_CHECKS = [
         "category": "accessibility",
         "check_url": "/sitemap.xml",
         "expected": "200 OK",
-        "impact": "Search engines cannot discover pages without sitemap"
+        "impact": "Search engines cannot discover pages without sitemap",
+        "severity": "critical"
     },
     {
         "name": "Robots.txt Accessibility",
         "category": "accessibility",
         "check_url": "/robots.txt",
         "expected": "200 OK",
-        "impact": "Crawlers may not understand crawl rules"
+        "impact": "Crawlers may not understand crawl rules",
+        "severity": "high"
     },
     {
         "name": "Homepage Meta Tags",
         "category": "meta",
         "checks": ["title", "description", "canonical", "og:image"],
-        "impact": "Poor SERP appearance and click-through rates"
+        "impact": "Poor SERP appearance and click-through rates",
+        "severity": "high"
     },
     {
         "name": "Structured Data Validation",
         "category": "schema",
         "check_for": "application/ld+json",
-        "impact": "Missing rich results in search"
+        "impact": "Missing rich results in search",
+        "severity": "medium"
     },
     {
         "name": "Page Speed Basics",
         "category": "performance",
         "checks": ["response_time", "lazy_loading", "preconnect", "compression"],
-        "impact": "Poor user experience and rankings"
+        "impact": "Poor user experience and rankings",
+        "severity": "medium"
     },
     {
         "name": "Mobile Friendliness",
         "category": "mobile",
         "checks": ["viewport", "responsive_images", "touch_icons"],
-        "impact": "Poor mobile search rankings"
+        "impact": "Poor mobile search rankings",
+        "severity": "high"
     },
 ]
 
@@ -120,56 +145,65 @@ EXTENDED_CHECKS = [
         "description": "Check for required schema types on content pages",
         "required_schemas": ["BlogPosting", "WebSite", "Organization"],
         "optional_schemas": ["HowTo", "FAQPage", "Course"],
-        "impact": "Missing rich snippets and SERP features"
+        "impact": "Missing rich snippets and SERP features",
+        "severity": "medium"
     },
     {
         "name": "Canonical Tags Consistency",
         "category": "technical",
         "description": "Verify all pages have correct canonical tags",
-        "impact": "Duplicate content issues"
+        "impact": "Duplicate content issues",
+        "severity": "high"
     },
     {
         "name": "Internal Link Health",
         "category": "links",
         "description": "Check for broken internal links",
-        "impact": "Poor user experience and crawl efficiency"
+        "impact": "Poor user experience and crawl efficiency",
+        "severity": "high"
     },
     {
         "name": "Orphan Page Detection",
         "category": "links",
         "description": "Find pages with no internal links pointing to them",
-        "impact": "Pages may not be discovered by search engines"
+        "impact": "Pages may not be discovered by search engines",
+        "severity": "medium"
     },
     {
         "name": "Redirect Chain Analysis",
         "category": "technical",
         "description": "Detect redirect chains longer than 1 hop",
-        "impact": "PageRank dilution and slow page loads"
+        "impact": "PageRank dilution and slow page loads",
+        "severity": "medium"
     },
     {
         "name": "Core Web Vitals Indicators",
         "category": "performance",
         "description": "Check for CWV optimization signals",
         "checks": ["image_optimization", "font_loading", "js_defer"],
-        "impact": "Poor Core Web Vitals scores"
+        "impact": "Poor Core Web Vitals scores",
+        "severity": "medium"
     },
     {
         "name": "HTTPS Enforcement",
         "category": "technical",
         "description": "Verify all URLs use HTTPS",
-        "impact": "Security warnings and ranking penalty"
+        "impact": "Security warnings and ranking penalty",
+        "severity": "critical"
     },
     {
         "name": "XML Sitemap Completeness",
         "category": "accessibility",
         "description": "Verify all important pages are in sitemap",
-        "impact": "Incomplete indexing"
+        "impact": "Incomplete indexing",
+        "severity": "high"
     },
     {
         "name": "Hreflang Tags (if multilingual)",
         "category": "technical",
         "description": "Check for proper hreflang implementation",
-        "impact": "Wrong language versions in search results"
+        "impact": "Wrong language versions in search results",
+        "severity": "medium"
     },
 ]
 
@@ -184,51 +218,53 @@ def get_status_emoji(status: CheckStatus) -> str:
     }[status]
 
 
-def calculate_overall_score(checks: list[SEOCheck]) -> tuple[int, str]:
+def score_checks(checks: list[SEOCheck]) -> ScoreBoard:
     """
-    Calculate overall SEO score and status.
+    Fold completed checks into a weighted ScoreBoard (see audit_scoring).
 
     Args:
         checks: List of completed checks
 
     Returns:
-        Tuple of (score, status)
+        ScoreBoard
     """
-    if not checks:
-        return 0, "unknown"
+    board = ScoreBoard(expected=len(checks))
+    for check in checks:
+        board.add(check)
+    return board
 
-    passed = sum(1 for c in checks if c.status == CheckStatus.PASSED)
-    total = len([c for c in checks if c.status != CheckStatus.SKIPPED])
 
-    if total == 0:
-        return 0, "unknown"
+def calculate_overall_score(checks: list[SEOCheck]) -> tuple[int, str]:
+    """
+    Calculate overall SEO score and status.
 
-    score = round((passed / total) * 100)
+    Checks are weighted by category, severity and affected pages, and
+    earn partial credit for partial compliance (audit_scoring).
 
-    if score >= 90:
-        status = "excellent"
-    elif score >= 75:
-        status = "good"
-    elif score >= 50:
-        status = "needs-improvement"
-    else:
-        status = "poor"
+    Args:
+        checks: List of completed checks
 
-    return score, status
+    Returns:
+        Tuple of (score, status)
+    """
+    live = score_checks(checks).snapshot()
+    return live.score, live.status
 
 
-def prioritize_fixes(checks: list[SEOCheck]) -> list[SEOCheck]:
+def prioritize_fixes(checks: list[SEOCheck], board: Optional[ScoreBoard] = None) -> list[SEOCheck]:
     """
-    Sort failed checks by priority.
+    Sort failed checks by priority, then by weighted points lost.
 
     Args:
         checks: List of checks
+        board: Scores of the checks (computed if omitted)
 
     Returns:
         Prioritized list of fixes needed
     """
+    board = board or score_checks(checks)
     failed = [c for c in checks if c.status in (CheckStatus.FAILED, CheckStatus.WARNING)]
-    return sorted(failed, key=lambda x: x.priority.value)
+    return sorted(failed, key=lambda x: (x.priority.value, -board.points_lost(x.name)))
 
 
 # Example usage documentation for Claude
@@ -363,3 +399,530 @@ def generate_fix_instructions(check: SEOCheck) -> str:
     }
 
     return instructions.get(check.name, "Review and fix according to best practices")
+
+
+# --- Check runners -------------------------------------------------------
+
+@dataclass
+class SiteSnapshot:
+    """Everything the declared checks need, from a crawl or a build directory"""
+    base_url: str
+    pages: dict[str, PageFacts] = field(default_factory=dict)  # path -> facts
+    sitemap_status: Optional[int] = None
+    sitemap_urls: list[str] = field(default_factory=list)
+    robots_status: Optional[int] = None
+    robots_txt: Optional[str] = None
+    source: str = "crawl"  # "crawl" or "build"
+    route_paths: Optional[Iterable[str]] = None  # expected routes; site_routes when this is our site
+
+    @property
+    def homepage(self) -> Optional[PageFacts]:
+        return self.pages.get("/")
+
+    @property
+    def sitemap_paths(self) -> set[str]:
+        return {urlsplit(url).path.rstrip("/") or "/" for url in self.sitemap_urls}
+
+    def html_pages(self) -> list[PageFacts]:
+        return [p for p in self.pages.values() if p.status == 200 and p.is_html]
+
+    def is_own_site(self) -> bool:
+        """
+        Whether this repository's site is being audited: a build, or an
+        origin whose host (or whose sitemap's host, as on a local dev
+        server of this repo) is BASE_URL's.
+        """
+        if self.source == "build":
+            return True
+        own = _bare_host(BASE_URL)
+        return _bare_host(self.base_url) == own or any(_bare_host(url) == own for url in self.sitemap_urls)
+
+    def expected_routes(self) -> Optional[Iterable[str]]:
+        """Route paths the site should publish, or None when unknown."""
+        if self.route_paths is not None:
+            return self.route_paths
+        if self.is_own_site():
+            return (entry.path for entry in iter_site_routes())
+        return None
+
+
+def _bare_host(url: str) -> str:
+    host = urlsplit(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+# (status, message, details) returned by each runner
+CheckResult = tuple[CheckStatus, str, dict]
+
+BLOG_POST_PATTERN = re.compile(r"^(?:/[a-z]{2})?/blog/[^/]+$")
+
+
+def _ratio_status(passed: int, total: int, pass_ratio: float) -> CheckStatus:
+    return CheckStatus.PASSED if total and passed >= total * pass_ratio else CheckStatus.WARNING
+
+
+def _check_url_status(status: Optional[int], label: str) -> CheckResult:
+    if status is None:
+        return CheckStatus.FAILED, f"Failed to fetch {label}", {}
+    if status != 200:
+        return CheckStatus.FAILED, f"{label} returned {status}", {"status": status}
+    return CheckStatus.PASSED, f"{label} is accessible", {"status": status}
+
+
+def check_sitemap_accessibility(site: SiteSnapshot) -> CheckResult:
+    status, message, details = _check_url_status(site.sitemap_status, "Sitemap")
+    if status == CheckStatus.PASSED and not site.sitemap_urls:
+        return CheckStatus.WARNING, "Sitemap is accessible but lists no URLs", details
+    details["urls"] = len(site.sitemap_urls)
+    return status, message, details
+
+
+def check_robots_accessibility(site: SiteSnapshot) -> CheckResult:
+    status, message, details = _check_url_status(site.robots_status, "Robots.txt")
+    if status != CheckStatus.PASSED or site.robots_txt is None:
+        return status, message, details
+
+    robots = load_robots(text=site.robots_txt)
+    matcher = robots.matcher(DEFAULT_USER_AGENT)
+    sitemap = evaluate_paths(matcher, site.sitemap_paths)
+    indexable = evaluate_paths(matcher, {p.path for p in site.html_pages() if p.is_indexable})
+    # A budget the size of the audited site: can the crawler spend it on pSEO pages?
+    budget = simulate_crawl_budget(
+        link_graph_from_pages(site.pages.values()),
+        matcher,
+        budget=max(len(site.html_pages()), 1),
+        sitemap_paths=sorted(site.sitemap_paths),
+    )
+    details.update({
+        "userAgent": DEFAULT_USER_AGENT,
+        "groups": len(robots.groups),
+        "rules": matcher.size,
+        "crawlDelay": matcher.crawl_delay,
+        "pathsChecked": sitemap.checked,
+        "blockedSitemapUrls": sitemap.blocked,
+        "blockedIndexablePages": indexable.blocked,
+        "crawlBudget": {
+            "fetches": budget.fetched,
+            "pseoPages": budget.targets,
+            "pseoReached": budget.targets_reached,
+            "reachCurve": budget.reach_curve,
+            "estimatedSeconds": budget.estimated_seconds,
+        },
+    })
+    if sitemap.blocked:
+        return CheckStatus.FAILED, f"robots.txt disallows {len(sitemap.blocked)} sitemap URLs for {DEFAULT_USER_AGENT}", details
+    if indexable.blocked:
+        return CheckStatus.WARNING, f"robots.txt disallows {len(indexable.blocked)} indexable pages for {DEFAULT_USER_AGENT}", details
+    return status, (
+        f"Robots.txt is accessible; {DEFAULT_USER_AGENT} reaches {budget.targets_reached}/{budget.targets} "
+        f"pSEO pages within {budget.fetched} fetches"
+    ), details
+
+
+def check_homepage_meta(site: SiteSnapshot) -> CheckResult:
+    home = site.homepage
+    if home is None:
+        return CheckStatus.FAILED, "Homepage was not fetched", {}
+    checks = {
+        "title": bool(home.title),
+        "description": bool(home.meta_description),
+        "canonical": bool(home.canonical),
+        "ogImage": bool(home.og_image),
+    }
+    passed = sum(checks.values())
+    status = CheckStatus.PASSED if passed == len(checks) else CheckStatus.FAILED
+    return status, f"Meta tags check: {passed}/{len(checks)} passed", checks
+
+
+def check_structured_data(site: SiteSnapshot) -> CheckResult:
+    home = site.homepage
+    if home is None:
+        return CheckStatus.FAILED, "Homepage was not fetched", {}
+    total = len(home.jsonld) + len(home.jsonld_errors)
+    if not total:
+        return CheckStatus.FAILED, "No structured data found", {"count": 0}
+    details = {"validCount": len(home.jsonld), "totalCount": total, "errors": home.jsonld_errors}
+    status = CheckStatus.FAILED if home.jsonld_errors else CheckStatus.PASSED
+    return status, f"Structured data: {len(home.jsonld)}/{total} valid", details
+
+
+def check_page_speed(site: SiteSnapshot) -> CheckResult:
+    home = site.homepage
+    if home is None:
+        return CheckStatus.FAILED, "Homepage was not fetched", {}
+    checks = {
+        "responseTime": None if home.response_ms is None else home.response_ms < 3000,
+        "lazyLoading": any(img.loading == "lazy" for img in home.images) or None,
+        "preconnect": home.has_preconnect,
+        "compression": None if home.content_encoding is None else home.content_encoding in ("gzip", "br"),
+    }
+    # None = could not be measured (offline build, or no images to lazy-load)
+    measured = {k: v for k, v in checks.items() if v is not None}
+    passed = sum(measured.values())
+    details = {**checks, "responseTime": f"{home.response_ms:.0f}ms" if home.response_ms is not None else None}
+    return _ratio_status(passed, len(measured), 0.75), f"Performance basics: {passed}/{len(measured)} passed", details
+
+
+def check_mobile_friendliness(site: SiteSnapshot) -> CheckResult:
+    home = site.homepage
+    if home is None:
+        return CheckStatus.FAILED, "Homepage was not fetched", {}
+    checks = {
+        "viewport": bool(home.viewport),
+        "responsiveImages": any(img.has_srcset for img in home.images),
+        "touchIcons": home.has_touch_icon,
+    }
+    passed = sum(checks.values())
+    status = CheckStatus.PASSED if checks["viewport"] else CheckStatus.FAILED
+    return status, f"Mobile friendliness: {passed}/{len(checks)} passed", checks
+
+
+def check_schema_coverage(site: SiteSnapshot) -> CheckResult:
+    declared = next(c for c in EXTENDED_CHECKS if c["name"] == "Schema Coverage")
+    site_types = set().union(*(p.schema_types for p in site.html_pages())) if site.pages else set()
+    missing_site = [t for t in ("WebSite", "Organization") if t in declared["required_schemas"] and t not in site_types]
+
+    posts = [p for p in site.html_pages() if BLOG_POST_PATTERN.match(p.path)]
+    missing_posts = [p.path for p in posts if "BlogPosting" not in p.schema_types]
+    details = {
+        "postsChecked": len(posts),
+        "postsMissingBlogPosting": missing_posts,
+        "missingSiteSchemas": missing_site,
+        "optionalFound": sorted(site_types & set(declared["optional_schemas"])),
+    }
+
+    if posts and len(missing_posts) == len(posts):
+        return CheckStatus.FAILED, f"None of {len(posts)} blog posts have BlogPosting schema", details
+    if missing_posts or missing_site:
+        parts = []
+        if missing_posts:
+            parts.append(f"{len(missing_posts)} of {len(posts)} blog posts missing BlogPosting schema")
+        if missing_site:
+            parts.append(f"site-wide schemas missing: {', '.join(missing_site)}")
+        return CheckStatus.WARNING, "; ".join(parts), details
+    return CheckStatus.PASSED, f"Required schemas present ({len(posts)} blog posts checked)", details
+
+
+def check_canonical_consistency(site: SiteSnapshot) -> CheckResult:
+    pages = [p for p in site.html_pages() if p.is_indexable]
+    missing = [p.path for p in pages if not p.canonical]
+    mismatched = [
+        {"page": p.path, "canonical": p.canonical}
+        for p in pages
+        if p.canonical and (urlsplit(p.canonical).path.rstrip("/") or "/") != p.path
+    ]
+    canonical_map = build_canonical_map(site.pages.values(), site.base_url, load_redirect_graph())
+    details = {
+        "pagesChecked": len(pages),
+        "missing": missing,
+        "mismatched": mismatched,
+        "canonicals": canonical_map.canonicals,
+        "external": canonical_map.external,
+        "badTargets": [
+            {"page": i.page, "canonical": i.canonical, "problem": i.problem}
+            for i in canonical_map.target_issues[:100]
+        ],
+        "conflictingClusters": {c.key: list(c.pages) for c in canonical_map.conflicting_clusters[:50]},
+        "duplicateContent": [c.pages for c in canonical_map.duplicate_content[:50]],
+    }
+    if canonical_map.target_issues or canonical_map.conflicting_clusters:
+        return CheckStatus.FAILED, (
+            f"{len(canonical_map.target_issues)} canonicals point at invalid URLs, "
+            f"{len(canonical_map.conflicting_clusters)} canonicals shared by different content"
+        ), details
+    issues = len(missing) + len(mismatched) + len(canonical_map.duplicate_content)
+    if not issues:
+        return CheckStatus.PASSED, f"All {len(pages)} pages have self-referencing canonicals", details
+    status = CheckStatus.FAILED if issues > len(pages) * 0.25 else CheckStatus.WARNING
+    message = f"{len(missing)} pages without canonical, {len(mismatched)} pointing elsewhere"
+    if canonical_map.duplicate_content:
+        message += f", {len(canonical_map.duplicate_content)} duplicate-content groups"
+    return status, message, details
+
+
+def check_internal_link_health(site: SiteSnapshot) -> CheckResult:
+    broken = []
+    checked = 0
+    for page in site.html_pages():
+        for target in page.links:
+            facts = site.pages.get(target)
+            if facts is None:
+                continue
+            checked += 1
+            if facts.status >= 400:
+                broken.append({"from": page.path, "to": target, "status": facts.status})
+    details = {"linksChecked": checked, "broken": broken}
+    if broken:
+        return CheckStatus.FAILED, f"{len(broken)} broken internal links", details
+    return CheckStatus.PASSED, f"No broken links among {checked} internal links", details
+
+
+def check_orphan_pages(site: SiteSnapshot) -> CheckResult:
+    linked = {target for page in site.html_pages() for target in page.links if target != page.path}
+    candidates = site.sitemap_paths | {p.path for p in site.html_pages() if p.is_indexable}
+    orphans = sorted(path for path in candidates - linked if path != "/")
+    details = {"pagesChecked": len(candidates), "orphans": orphans}
+    if orphans:
+        return CheckStatus.WARNING, f"{len(orphans)} pages have no incoming internal links", details
+    return CheckStatus.PASSED, f"All {len(candidates)} pages are linked internally", details
+
+
+def check_redirect_chains(site: SiteSnapshot) -> CheckResult:
+    redirects = {p.path: p.location for p in site.pages.values() if 300 <= p.status < 400 and p.location}
+    chains, loops = [], []
+    for start in redirects:
+        hops, seen, current = [start], {start}, redirects[start]
+        while current in redirects:
+            if current in seen:
+                loops.append(hops + [current])
+                break
+            seen.add(current)
+            hops.append(current)
+            current = redirects[current]
+        else:
+            if len(hops) > 1:
+                chains.append(hops + [current])
+
+    details = {"redirects": len(redirects), "chains": chains, "loops": loops}
+    configured, redirecting = [], []
+    if site.is_own_site():
+        # This repo's redirects (vercel.json, next.config.js, middleware.ts) resolved without HTTP
+        analysis = analyze_redirects(sitemap_urls=[absolute_url(path) for path in sorted(site.sitemap_paths)])
+        loops += [[r.url] + [hop.target for hop in r.hops] for r in analysis.loops]
+        configured = [[r.url] + [hop.target for hop in r.hops] for r in analysis.chains]
+        redirecting = [r.url for r in analysis.redirecting_sitemap_urls]
+        details.update({
+            "configuredRules": len(analysis.rules),
+            "configuredChains": configured[:50],
+            "configuredChainCount": len(configured),
+            "redirectingSitemapUrls": redirecting,
+        })
+    if loops:
+        return CheckStatus.FAILED, f"{len(loops)} redirect loops", details
+    if chains or configured or redirecting:
+        message = f"{len(chains) + len(configured)} redirect chains longer than 1 hop"
+        if redirecting:
+            message += f", {len(redirecting)} sitemap URLs redirect"
+        return CheckStatus.WARNING, message, details
+    return CheckStatus.PASSED, f"No redirect chains ({len(redirects)} redirects observed)", details
+
+
+def check_core_web_vitals(site: SiteSnapshot) -> CheckResult:
+    pages = site.html_pages()
+    images = [img for page in pages for img in page.images]
+    optimized = sum(1 for img in images if img.has_dimensions or img.has_srcset)
+    home = site.homepage
+    checks = {
+        "image_optimization": not images or optimized >= len(images) * 0.8,
+        "font_loading": any(p.has_font_preload for p in pages),
+        "js_defer": home is not None and not home.blocking_scripts,
+    }
+    budget = analyze_asset_budget(pages=pages)
+    if budget.pages:
+        checks["page_weight"] = not budget.over_budget
+    passed = sum(checks.values())
+    details = {
+        **checks,
+        "imagesOptimized": f"{optimized}/{len(images)}",
+        "blockingScripts": home.blocking_scripts if home else [],
+        "pageBudgetBytes": budget.budget,
+        "overBudget": len(budget.over_budget),
+        "heaviestPages": {
+            p.route: {"bytes": p.total_bytes, "images": p.image_bytes, "js": p.js_bytes, "warnings": p.warnings}
+            for p in budget.pages[:20]
+        },
+    }
+    return _ratio_status(passed, len(checks), 2 / 3), f"CWV indicators: {passed}/{len(checks)} passed", details
+
+
+def check_https_enforcement(site: SiteSnapshot) -> CheckResult:
+    local_hosts = ("localhost", "127.0.0.1", "0.0.0.0", urlsplit(site.base_url).hostname)
+    insecure = set()
+
+    def inspect(url: Optional[str], where: str) -> None:
+        if url and url.startswith("http://") and urlsplit(url).hostname not in local_hosts:
+            insecure.add(f"{where}: {url}")
+
+    for url in site.sitemap_urls:
+        inspect(url, "sitemap")
+    for page in site.html_pages():
+        inspect(page.canonical, page.path)
+        inspect(page.og_url, page.path)
+        for href in page.hreflang.values():
+            inspect(href, page.path)
+
+    details = {"insecure": sorted(insecure)}
+    if insecure:
+        return CheckStatus.FAILED, f"{len(insecure)} absolute URLs use http://", details
+    return CheckStatus.PASSED, "All canonical, sitemap and hreflang URLs use HTTPS", details
+
+
+def check_sitemap_completeness(site: SiteSnapshot) -> CheckResult:
+    if not site.sitemap_urls:
+        return CheckStatus.FAILED, "No sitemap URLs to compare against", {}
+    listed = site.sitemap_paths
+    missing = sorted(p.path for p in site.html_pages() if p.is_indexable and p.path not in listed)
+    expected = site.expected_routes()
+    if expected is None:
+        # Another site: only the crawled pages can be compared
+        details = {"sitemapUrls": len(listed), "missingFromSitemap": missing}
+        if missing:
+            return CheckStatus.WARNING, f"{len(missing)} crawled pages missing from sitemap", details
+        return CheckStatus.PASSED, f"Sitemap lists all {len(site.html_pages())} crawled pages", details
+
+    routes = diff_paths(expected, site.sitemap_urls, limit=100)
+    details = {
+        "sitemapUrls": len(listed),
+        "missingFromSitemap": missing,
+        "expectedRoutes": routes.expected,
+        "missingRoutes": routes.missing,
+        "missingRouteCount": routes.missing_count,
+        "extraUrls": routes.extra,
+        "extraUrlCount": routes.extra_count,
+        "duplicateUrls": routes.duplicates,
+    }
+    if missing or routes.missing_count:
+        message = f"{routes.missing_count} expected routes and {len(missing)} crawled pages missing from sitemap"
+        return CheckStatus.WARNING, message, details
+    if routes.extra_count:
+        return CheckStatus.WARNING, f"{routes.extra_count} sitemap URLs match no known route", details
+    return CheckStatus.PASSED, f"Sitemap lists all {routes.expected} expected routes", details
+
+
+def check_hreflang(site: SiteSnapshot) -> CheckResult:
+    report = validate_hreflang(site.pages.values())
+    if not report.pages:
+        return CheckStatus.SKIPPED, "No hreflang alternates found", {}
+
+    details = {
+        "pagesWithHreflang": report.pages,
+        "pagesWithProblems": len(report.problems),
+        "alternates": report.alternates,
+        "issueCounts": report.issue_counts,
+        "pages": {page: "; ".join(issues) for page, issues in summarize_problems(report, limit=100).items()},
+        "nonReciprocal": report.non_reciprocal[:100],
+    }
+    breakdown = ", ".join(f"{kind}: {pages}" for kind, pages in sorted(report.issue_counts.items()))
+    message = f"hreflang problems on {len(report.problems)} of {report.pages} pages ({breakdown})"
+    if report.issue_counts.get("non-reciprocal") or report.issue_counts.get("bad-target"):
+        return CheckStatus.FAILED, message, details
+    if report.problems:
+        return CheckStatus.WARNING, message, details
+    return CheckStatus.PASSED, f"hreflang is consistent on {report.pages} pages", details
+
+
+CHECK_RUNNERS = {
+    "Sitemap Accessibility": check_sitemap_accessibility,
+    "Robots.txt Accessibility": check_robots_accessibility,
+    "Homepage Meta Tags": check_homepage_meta,
+    "Structured Data Validation": check_structured_data,
+    "Page Speed Basics": check_page_speed,
+    "Mobile Friendliness": check_mobile_friendliness,
+    "Schema Coverage": check_schema_coverage,
+    "Canonical Tags Consistency": check_canonical_consistency,
+    "Internal Link Health": check_internal_link_health,
+    "Orphan Page Detection": check_orphan_pages,
+    "Redirect Chain Analysis": check_redirect_chains,
+    "Core Web Vitals Indicators": check_core_web_vitals,
+    "HTTPS Enforcement": check_https_enforcement,
+    "XML Sitemap Completeness": check_sitemap_completeness,
+    "Hreflang Tags (if multilingual)": check_hreflang,
+}
+
+
+def iter_declared_checks(site: SiteSnapshot) -> Iterator[SEOCheck]:
+    """
+    Run every check in BASE_CHECKS and EXTENDED_CHECKS, yielding each as it completes.
+
+    Args:
+        site: Crawled or built site
+
+    Yields:
+        One SEOCheck per declared check, in declaration order
+    """
+    for declared in BASE_CHECKS + EXTENDED_CHECKS:
+        runner = CHECK_RUNNERS.get(declared["name"])
+        if runner is None:
+            status, message, details = CheckStatus.SKIPPED, "No runner for this check", {}
+        else:
+            status, message, details = runner(site)
+
+        if status == CheckStatus.FAILED:
+            priority = Priority.CRITICAL if declared["category"] == "accessibility" else Priority.HIGH
+        elif status == CheckStatus.WARNING:
+            priority = Priority.MEDIUM
+        else:
+            priority = Priority.LOW
+
+        check = SEOCheck(
+            name=declared["name"],
+            category=declared["category"],
+            status=status,
+            message=message,
+            impact=declared["impact"],
+            priority=priority,
+            details=details,
+            severity=declared.get("severity", "medium"),
+        )
+        if status in (CheckStatus.FAILED, CheckStatus.WARNING):
+            check.fix_instructions = generate_fix_instructions(check)
+        yield check
+
+
+def run_declared_checks(
+    site: SiteSnapshot,
+    on_score: Optional[Callable[[SEOCheck, LiveScore], None]] = None,
+    board: Optional[ScoreBoard] = None
+) -> list[SEOCheck]:
+    """
+    Run every check in BASE_CHECKS and EXTENDED_CHECKS against a snapshot.
+
+    Args:
+        site: Crawled or built site
+        on_score: Called after each check with the live score so far
+        board: ScoreBoard to fold the checks into (one is created for on_score)
+
+    Returns:
+        One SEOCheck per declared check, in declaration order
+    """
+    if on_score is not None and board is None:
+        board = ScoreBoard(expected=len(BASE_CHECKS) + len(EXTENDED_CHECKS))
+    checks = []
+    for check in iter_declared_checks(site):
+        checks.append(check)
+        if board is not None:
+            live = board.add(check)
+            if on_score is not None:
+                on_score(check, live)
+    return checks
+
+
+def build_audit_report(checks: list[SEOCheck], board: Optional[ScoreBoard] = None) -> AuditReport:
+    """
+    Assemble an AuditReport from completed checks.
+
+    Args:
+        checks: Completed checks
+        board: Live ScoreBoard already holding some of the checks (built if omitted)
+
+    Returns:
+        AuditReport with weighted score, buckets and priority queue
+    """
+    if board is None:
+        board = score_checks(checks)
+    else:
+        for check in checks:
+            if check.name not in board.scores:
+                board.add(check)
+    live = board.snapshot()
+    return AuditReport(
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        overall_score=live.score,
+        status=live.status,
+        checks=checks,
+        critical_issues=[c for c in checks if c.status == CheckStatus.FAILED],
+        warnings=[c for c in checks if c.status == CheckStatus.WARNING],
+        passed=[c for c in checks if c.status == CheckStatus.PASSED],
+        priority_fixes=prioritize_fixes(checks, board),
+        category_scores=live.categories,
+    )